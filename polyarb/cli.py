@@ -108,8 +108,8 @@ def markets(ctx: PolyarbContext, search: Optional[str], slug: Optional[str], lim
     ctx.log("Fetching markets from Polymarket Gamma API...")
 
     try:
-        client = GammaClient()
-        markets_list = client.search_markets(query=search, limit=limit, include_expired=include_expired)
+        with GammaClient() as client:
+            markets_list = client.search_markets(query=search, limit=limit, include_expired=include_expired)
 
         if not markets_list:
             click.echo("No markets found.")
@@ -276,8 +276,8 @@ def analyze(
     # Step 1: Fetch market metadata from Gamma
     try:
         ctx.log("Fetching market data from Polymarket Gamma API...")
-        gamma_client = GammaClient()
-        market = gamma_client.get_market(market_id)
+        with GammaClient() as gamma_client:
+            market = gamma_client.get_market(market_id)
         ctx.log(f"Market: {market.title}")
     except Exception as e:
         click.echo(f"Error fetching market: {e}", err=True)
@@ -511,8 +511,8 @@ def analyze(
         # 6.4: Fetch or use provided risk-free rate
         if rate is None:
             ctx.log(f"Fetching risk-free rate from FRED series {fred_series_id}...")
-            fred_client = FredClient(api_key=ctx.fred_api_key)
-            rate_value, rate_date = fred_client.get_latest_observation(fred_series_id)
+            with FredClient(api_key=ctx.fred_api_key) as fred_client:
+                rate_value, rate_date = fred_client.get_latest_observation(fred_series_id)
             rate = rate_value / 100.0  # Convert from percentage to decimal
             ctx.log(f"Risk-free rate: {rate:.4%} (from {rate_date})")
             rate_source = f"FRED {fred_series_id} ({rate_date})"
@@ -728,50 +728,49 @@ def rates(ctx: PolyarbContext, series_id: Optional[str], search: Optional[str]):
     from polyarb.clients.fred import FredClient
 
     try:
-        fred_client = FredClient(api_key=ctx.fred_api_key)
-
-        if search:
-            # Search for series by keyword
-            ctx.log(f"Searching for series matching '{search}'...")
-            results = fred_client.search_series(query=search, limit=10)
-
-            if not results:
-                click.echo(f"No series found matching '{search}'")
-                return
-
-            click.echo(f"\nFound {len(results)} series:\n")
-            for i, series in enumerate(results, 1):
-                title = series.get("title", "N/A")
-                series_id_result = series.get("id", "N/A")
-                units = series.get("units", "N/A")
-                frequency = series.get("frequency", "N/A")
-
-                click.echo(f"{i}. {series_id_result}")
-                click.echo(f"   Title: {title}")
-                click.echo(f"   Units: {units}, Frequency: {frequency}")
-                click.echo()
-
-        if series_id:
-            # Fetch latest observation for the series
-            ctx.log(f"Fetching latest observation for series {series_id}...")
-
-            # Get series info
-            info = fred_client.get_series_info(series_id)
-            title = info.get("title", "N/A")
-            units = info.get("units", "N/A")
-
-            # Get latest observation
-            value, obs_date = fred_client.get_latest_observation(series_id)
-
-            click.echo(f"\nSeries: {series_id}")
-            click.echo(f"Title: {title}")
-            click.echo(f"Units: {units}")
-            click.echo(f"Latest observation: {value} (as of {obs_date})")
-
-            # If units indicate percentage, also show as decimal
-            if "percent" in units.lower():
-                decimal_value = value / 100
-                click.echo(f"Decimal form: {decimal_value:.6f}")
+        with FredClient(api_key=ctx.fred_api_key) as fred_client:
+            if search:
+                # Search for series by keyword
+                ctx.log(f"Searching for series matching '{search}'...")
+                results = fred_client.search_series(query=search, limit=10)
+
+                if not results:
+                    click.echo(f"No series found matching '{search}'")
+                    return
+
+                click.echo(f"\nFound {len(results)} series:\n")
+                for i, series in enumerate(results, 1):
+                    title = series.get("title", "N/A")
+                    series_id_result = series.get("id", "N/A")
+                    units = series.get("units", "N/A")
+                    frequency = series.get("frequency", "N/A")
+
+                    click.echo(f"{i}. {series_id_result}")
+                    click.echo(f"   Title: {title}")
+                    click.echo(f"   Units: {units}, Frequency: {frequency}")
+                    click.echo()
+
+            if series_id:
+                # Fetch latest observation for the series
+                ctx.log(f"Fetching latest observation for series {series_id}...")
+
+                # Get series info
+                info = fred_client.get_series_info(series_id)
+                title = info.get("title", "N/A")
+                units = info.get("units", "N/A")
+
+                # Get latest observation
+                value, obs_date = fred_client.get_latest_observation(series_id)
+
+                click.echo(f"\nSeries: {series_id}")
+                click.echo(f"Title: {title}")
+                click.echo(f"Units: {units}")
+                click.echo(f"Latest observation: {value} (as of {obs_date})")
+
+                # If units indicate percentage, also show as decimal
+                if "percent" in units.lower():
+                    decimal_value = value / 100
+                    click.echo(f"Decimal form: {decimal_value:.6f}")
 
     except Exception as e:
         ctx.log(f"Error fetching FRED data: {e}", level="error")
@@ -0,0 +1,85 @@
+"""Small on-disk TTL cache for API responses.
+
+Entries are stored one file per key under ``$POLYARB_CACHE_DIR`` (default
+``~/.polyarb/cache``) and expire by file modification time. The cache is
+best-effort: filesystem errors are treated as a miss and never surface to
+callers.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Decode JSON with orjson when it is installed; both accept bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+DEFAULT_CACHE_DIR = Path.home() / ".polyarb" / "cache"
+
+
+def cache_dir() -> Path:
+    """Root cache directory, honouring POLYARB_CACHE_DIR."""
+    return Path(os.getenv("POLYARB_CACHE_DIR") or DEFAULT_CACHE_DIR)
+
+
+def cache_key(endpoint: str, params: dict) -> str:
+    """Stable key for a request to ``endpoint`` with query ``params``."""
+    return hashlib.md5(f"{endpoint}|{sorted(params.items())}".encode()).hexdigest()
+
+
+class FileCache:
+    """Key/bytes store under one namespace directory with a fixed TTL."""
+
+    def __init__(self, namespace: str, ttl: float):
+        """Initialize the cache.
+
+        Args:
+            namespace: Subdirectory of the cache root (e.g. "fred")
+            ttl: Seconds an entry stays valid after it is written
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+
+    @property
+    def path(self) -> Path:
+        """Directory holding this namespace's entries (resolved on each use)."""
+        return cache_dir() / self.namespace
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached bytes for ``key``, or None if missing or expired."""
+        file = self.path / key
+        try:
+            if time.time() - file.stat().st_mtime > self.ttl:
+                return None
+            return file.read_bytes()
+        except OSError:
+            return None
+
+    def get_json(self, key: str) -> Optional[Any]:
+        """Return the decoded JSON for ``key``, or None if missing, expired or corrupt."""
+        cached = self.get(key)
+        if cached is None:
+            return None
+        try:
+            return json_loads(cached)
+        except ValueError:
+            return None
+
+    def put(self, key: str, value: bytes) -> None:
+        """Store ``value`` under ``key``, replacing any existing entry."""
+        path = self.path
+        file = path / key
+        tmp = file.with_name(f"{key}.{os.getpid()}.tmp")
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(value)
+            os.replace(tmp, file)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
@@ -0,0 +1,30 @@
+"""Shared HTTP connection pooling for the API clients."""
+
+import httpx
+
+# Keep connections open between calls so repeat requests skip the TLS handshake
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+)
+
+
+class PooledClient:
+    """Base for clients that hold one pooled ``httpx.Client`` in ``_client``.
+
+    Requests share one pooled connection; call close() (or use the client as
+    a context manager) when done.
+    """
+
+    __slots__ = ("_client",)
+
+    DEFAULT_LIMITS = DEFAULT_LIMITS
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
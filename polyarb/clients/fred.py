@@ -1,27 +1,46 @@
 """FRED (Federal Reserve Economic Data) API client for risk-free rates."""
 
+import asyncio
+import importlib.util
 import os
-from typing import Optional
+from typing import Optional, Sequence
 from datetime import datetime
 
 import httpx
 
+from polyarb.clients._cache import FileCache, cache_key
+from polyarb.clients._cache import json_loads as _json_loads
+from polyarb.clients._http import PooledClient
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install httpx[http2])
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
 
 class FredClientError(Exception):
     """Error raised by FRED API client."""
     pass
 
 
-class FredClient:
+class FredClient(PooledClient):
     """Client for FRED (Federal Reserve Economic Data) API.
 
     FRED API provides economic data series including risk-free rates.
     Base URL: https://api.stlouisfed.org/fred
     Requires API key from environment variable FRED_API_KEY.
+
+    Successful responses are cached on disk (see polyarb.clients._cache) so
+    warm calls skip HTTP entirely.
     """
 
+    __slots__ = (
+        "api_key", "timeout", "_base_params",
+        "_observation_cache", "_metadata_cache",
+    )
+
     BASE_URL = "https://api.stlouisfed.org/fred"
     DEFAULT_TIMEOUT = 30.0  # seconds
+    OBSERVATION_TTL = 60 * 60  # seconds; FRED rate series update daily
+    METADATA_TTL = 30 * 24 * 60 * 60  # seconds; series metadata rarely changes
 
     def __init__(self, api_key: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
         """Initialize FRED client.
@@ -40,6 +59,13 @@ class FredClient:
                 "or pass api_key parameter."
             )
         self.timeout = timeout
+        # Sent with every request; httpx merges these with per-call params
+        self._base_params = {"api_key": self.api_key, "file_type": "json"}
+        self._client = httpx.Client(
+            params=self._base_params, timeout=timeout, limits=self.DEFAULT_LIMITS
+        )
+        self._observation_cache = FileCache("fred", ttl=self.OBSERVATION_TTL)
+        self._metadata_cache = FileCache("fred", ttl=self.METADATA_TTL)
 
     def get_latest_observation(self, series_id: str) -> tuple[float, datetime]:
         """Fetch the latest observation for a FRED series.
@@ -54,60 +80,119 @@ class FredClient:
         Raises:
             FredClientError: If API request fails or data is invalid
         """
-        url = f"{self.BASE_URL}/series/observations"
-        params = {
-            "series_id": series_id,
-            "api_key": self.api_key,
-            "file_type": "json",
-            "sort_order": "desc",  # Most recent first
-            "limit": 1,  # Only need the latest
-        }
+        url, params = self._observation_request(series_id)
+        key = _request_key(url, params)
+        data = self._observation_cache.get_json(key)
+        if data is not None:
+            return _parse_latest_observation(series_id, data)
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 400:
-                # Check if it's an invalid series ID
-                error_msg = e.response.text
-                if "Bad Request" in error_msg or "series does not exist" in error_msg.lower():
-                    raise FredClientError(f"Invalid series ID: {series_id}") from e
-            raise FredClientError(f"HTTP error fetching series {series_id}: {e}") from e
-        except httpx.RequestError as e:
-            raise FredClientError(f"Request error fetching series {series_id}: {e}") from e
+            response = self._client.get(url, params=params)
+            response.raise_for_status()
+            content = response.content
+            data = _json_loads(content)
         except Exception as e:
-            raise FredClientError(f"Unexpected error fetching series {series_id}: {e}") from e
+            raise _observation_error(series_id, e) from e
 
-        # Parse response
-        observations = data.get("observations", [])
-        if not observations:
-            raise FredClientError(f"No observations found for series {series_id}")
+        result = _parse_latest_observation(series_id, data)
+        self._observation_cache.put(key, content)
+        return result
 
-        latest = observations[0]
-        value_str = latest.get("value")
-        date_str = latest.get("date")
+    def get_latest_observation_many(
+        self, series_ids: Sequence[str]
+    ) -> list[tuple[float, datetime]]:
+        """Fetch the latest observation for several FRED series concurrently.
 
-        if not value_str or not date_str:
-            raise FredClientError(f"Invalid observation data for series {series_id}")
+        Synchronous wrapper around aget_latest_observation_many(); must not be
+        called from inside a running event loop.
 
-        # Handle missing values (FRED uses "." for missing data)
-        if value_str == ".":
-            raise FredClientError(f"Latest observation for series {series_id} is missing")
+        Args:
+            series_ids: FRED series IDs
 
-        try:
-            value = float(value_str)
-        except ValueError as e:
-            raise FredClientError(f"Invalid value '{value_str}' for series {series_id}") from e
+        Returns:
+            List of (value, observation_date) tuples in the order of series_ids
+
+        Raises:
+            FredClientError: If any request fails or returns invalid data
+        """
+        return asyncio.run(self.aget_latest_observation_many(series_ids))
+
+    async def aget_latest_observation(self, series_id: str) -> tuple[float, datetime]:
+        """Async variant of get_latest_observation().
+
+        Args:
+            series_id: FRED series ID
+
+        Returns:
+            Tuple of (value, observation_date)
+
+        Raises:
+            FredClientError: If API request fails or data is invalid
+        """
+        (result,) = await self.aget_latest_observation_many([series_id])
+        return result
+
+    async def aget_latest_observation_many(
+        self, series_ids: Sequence[str]
+    ) -> list[tuple[float, datetime]]:
+        """Fetch the latest observation for several series over one connection.
+
+        All requests are issued at once with asyncio.gather, so wall-clock time
+        is bounded by the slowest request rather than the sum. HTTP/2 is used
+        to multiplex them when the h2 package is installed (httpx[http2]).
+
+        Args:
+            series_ids: FRED series IDs
+
+        Returns:
+            List of (value, observation_date) tuples in the order of series_ids
+
+        Raises:
+            FredClientError: If any request fails or returns invalid data
+        """
+        async with httpx.AsyncClient(
+            params=self._base_params,
+            timeout=self.timeout,
+            limits=self.DEFAULT_LIMITS,
+            http2=_HAS_H2,
+        ) as client:
+            return list(
+                await asyncio.gather(
+                    *(self._aget_latest_observation(client, s) for s in series_ids)
+                )
+            )
+
+    async def _aget_latest_observation(
+        self, client: httpx.AsyncClient, series_id: str
+    ) -> tuple[float, datetime]:
+        """Fetch one series' latest observation on a shared async client."""
+        url, params = self._observation_request(series_id)
+        key = _request_key(url, params)
+        data = self._observation_cache.get_json(key)
+        if data is not None:
+            return _parse_latest_observation(series_id, data)
 
         try:
-            # FRED uses YYYY-MM-DD format
-            obs_date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError as e:
-            raise FredClientError(f"Invalid date '{date_str}' for series {series_id}") from e
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            content = response.content
+            data = _json_loads(content)
+        except Exception as e:
+            raise _observation_error(series_id, e) from e
+
+        result = _parse_latest_observation(series_id, data)
+        self._observation_cache.put(key, content)
+        return result
 
-        return value, obs_date
+    def _observation_request(self, series_id: str) -> tuple[str, dict]:
+        """URL and query parameters for a series' latest observation."""
+        url = f"{self.BASE_URL}/series/observations"
+        params = {
+            "series_id": series_id,
+            "sort_order": "desc",  # Most recent first
+            "limit": 1,  # Only need the latest
+        }
+        return url, params
 
     def get_series_info(self, series_id: str) -> dict:
         """Fetch metadata for a FRED series.
@@ -124,15 +209,17 @@ class FredClient:
         url = f"{self.BASE_URL}/series"
         params = {
             "series_id": series_id,
-            "api_key": self.api_key,
-            "file_type": "json",
         }
+        key = _request_key(url, params)
+        cached = self._metadata_cache.get_json(key)
+        if cached is not None:
+            return cached["seriess"][0]
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = self._client.get(url, params=params)
+            response.raise_for_status()
+            content = response.content
+            data = _json_loads(content)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 400:
                 raise FredClientError(f"Invalid series ID: {series_id}") from e
@@ -146,6 +233,7 @@ class FredClient:
         if not series_list:
             raise FredClientError(f"Series {series_id} not found")
 
+        self._metadata_cache.put(key, content)
         return series_list[0]
 
     def search_series(self, query: str, limit: int = 10) -> list[dict]:
@@ -164,16 +252,18 @@ class FredClient:
         url = f"{self.BASE_URL}/series/search"
         params = {
             "search_text": query,
-            "api_key": self.api_key,
-            "file_type": "json",
             "limit": limit,
         }
+        key = _request_key(url, params)
+        data = self._metadata_cache.get_json(key)
+        if data is not None:
+            return data.get("seriess", [])
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = self._client.get(url, params=params)
+            response.raise_for_status()
+            content = response.content
+            data = _json_loads(content)
         except httpx.HTTPStatusError as e:
             raise FredClientError(f"HTTP error searching series with query '{query}': {e}") from e
         except httpx.RequestError as e:
@@ -181,4 +271,55 @@ class FredClient:
         except Exception as e:
             raise FredClientError(f"Unexpected error searching series with query '{query}': {e}") from e
 
+        self._metadata_cache.put(key, content)
         return data.get("seriess", [])
+
+
+def _request_key(url: str, params: dict) -> str:
+    """Cache key for a request's per-call params (the API key never touches disk)."""
+    return cache_key(url, params)
+
+
+def _observation_error(series_id: str, e: Exception) -> FredClientError:
+    """Translate a failure fetching observations into a FredClientError."""
+    if isinstance(e, httpx.HTTPStatusError):
+        if e.response.status_code == 400:
+            # Check if it's an invalid series ID
+            error_msg = e.response.text
+            if "Bad Request" in error_msg or "series does not exist" in error_msg.lower():
+                return FredClientError(f"Invalid series ID: {series_id}")
+        return FredClientError(f"HTTP error fetching series {series_id}: {e}")
+    if isinstance(e, httpx.RequestError):
+        return FredClientError(f"Request error fetching series {series_id}: {e}")
+    return FredClientError(f"Unexpected error fetching series {series_id}: {e}")
+
+
+def _parse_latest_observation(series_id: str, data: dict) -> tuple[float, datetime]:
+    """Extract (value, observation_date) from a series/observations response."""
+    observations = data.get("observations", [])
+    if not observations:
+        raise FredClientError(f"No observations found for series {series_id}")
+
+    latest = observations[0]
+    value_str = latest.get("value")
+    date_str = latest.get("date")
+
+    if not value_str or not date_str:
+        raise FredClientError(f"Invalid observation data for series {series_id}")
+
+    # Handle missing values (FRED uses "." for missing data)
+    if value_str == ".":
+        raise FredClientError(f"Latest observation for series {series_id} is missing")
+
+    try:
+        value = float(value_str)
+    except ValueError as e:
+        raise FredClientError(f"Invalid value '{value_str}' for series {series_id}") from e
+
+    try:
+        # FRED uses YYYY-MM-DD format
+        obs_date = datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError as e:
+        raise FredClientError(f"Invalid date '{date_str}' for series {series_id}") from e
+
+    return value, obs_date
@@ -6,6 +6,7 @@ import httpx
 from datetime import datetime, timezone
 from typing import Optional
 
+from polyarb.clients._http import PooledClient
 from polyarb.models import Market
 from polyarb.util.dates import parse_datetime
 
@@ -15,13 +16,26 @@ class GammaClientError(Exception):
     pass
 
 
-class GammaClient:
+# Field names seen across Gamma endpoints, in order of preference
+_ID_KEYS = ("id", "condition_id", "conditionId")
+_END_DATE_KEYS = ("endDate", "end_date", "expirationDate", "expiration_date")
+_TOKEN_ID_KEYS = ("clobTokenIds", "clob_token_ids", "tokens")
+
+
+def _first_value(data: dict, keys: tuple[str, ...]):
+    """First truthy value of ``data`` under ``keys``, or None."""
+    return next((value for key in keys if (value := data.get(key))), None)
+
+
+class GammaClient(PooledClient):
     """Client for Polymarket Gamma API.
 
     Gamma API provides market metadata, outcomes, and token mappings.
     Base URL: https://gamma-api.polymarket.com
     """
 
+    __slots__ = ("timeout",)
+
     BASE_URL = "https://gamma-api.polymarket.com"
     DEFAULT_TIMEOUT = 30.0  # seconds
 
@@ -32,6 +46,7 @@ class GammaClient:
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
+        self._client = httpx.Client(timeout=timeout, limits=self.DEFAULT_LIMITS)
 
     def get_market(self, market_id: str) -> Market:
         """Fetch market details by ID.
@@ -48,10 +63,9 @@ class GammaClient:
         url = f"{self.BASE_URL}/markets/{market_id}"
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            response = self._client.get(url)
+            response.raise_for_status()
+            data = response.json()
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 raise GammaClientError(f"Market {market_id} not found") from e
@@ -114,10 +128,9 @@ class GammaClient:
             params["archived"] = "true"
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = self._client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
         except httpx.HTTPStatusError as e:
             raise GammaClientError(f"HTTP error searching markets: {e}") from e
         except httpx.RequestError as e:
@@ -126,7 +139,6 @@ class GammaClient:
             raise GammaClientError(f"Unexpected error searching markets: {e}") from e
 
         # Gamma API may return list directly or nested in a data field
-        # Handle both formats
         if isinstance(data, list):
             markets_data = data
         elif isinstance(data, dict) and "data" in data:
@@ -134,21 +146,7 @@ class GammaClient:
         else:
             raise GammaClientError(f"Unexpected API response format: {data}")
 
-        markets = []
-        for market_data in markets_data:
-            try:
-                market = self._parse_market(market_data)
-                markets.append(market)
-            except Exception as e:
-                # Log warning but continue processing other markets
-                print(f"Warning: Failed to parse market: {e}")
-                continue
-
-        if not include_expired:
-            now = datetime.now(tz=timezone.utc)
-            markets = [m for m in markets if m.end_date > now]
-
-        return markets
+        return self._parse_markets(markets_data, include_expired)
 
     def public_search(self, query: str, limit: int = 10) -> list[Market]:
         """Search markets using the /public-search endpoint.
@@ -167,10 +165,9 @@ class GammaClient:
         params = {"q": query, "limit": limit}
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            response = self._client.get(url, params=params)
+            response.raise_for_status()
+            data = response.json()
         except httpx.HTTPStatusError as e:
             raise GammaClientError(f"HTTP error in public search: {e}") from e
         except httpx.RequestError as e:
@@ -182,22 +179,41 @@ class GammaClient:
         # Note: The API limit applies to events, not total markets.
         # Each event can contain multiple markets, so we collect all markets
         # from all returned events and then apply the limit client-side.
-        events = data.get("events", [])
-
-        markets = []
-        for event in events:
-            for market_data in event.get("markets", []):
-                try:
-                    market = self._parse_market(market_data)
-                    markets.append(market)
-                except Exception as e:
-                    print(f"Warning: Failed to parse market in search result: {e}")
-                    continue
+        markets_data = [
+            market_data
+            for event in data.get("events", [])
+            for market_data in event.get("markets", [])
+        ]
 
         # Apply limit client-side to the flattened list of markets
-        return markets[:limit]
+        return self._parse_markets(markets_data)[:limit]
 
-    def _parse_market(self, data: dict) -> Market:
+    @classmethod
+    def _parse_markets(cls, markets_data: list, include_expired: bool = True) -> list[Market]:
+        """Parse raw market dicts in one pass, skipping ones that fail to parse.
+
+        Args:
+            markets_data: Raw market data from API
+            include_expired: Keep markets whose end_date is in the past
+
+        Returns:
+            Parsed Market objects, in input order
+        """
+        now = None if include_expired else datetime.now(tz=timezone.utc)
+        markets = []
+        for market_data in markets_data:
+            try:
+                market = cls._parse_market(market_data)
+            except Exception as e:
+                # Log warning but continue processing other markets
+                print(f"Warning: Failed to parse market: {e}")
+                continue
+            if now is None or market.end_date > now:
+                markets.append(market)
+        return markets
+
+    @staticmethod
+    def _parse_market(data: dict) -> Market:
         """Parse market data from API response.
 
         Args:
@@ -211,7 +227,7 @@ class GammaClient:
         """
         try:
             # Extract required fields
-            market_id = data.get("id") or data.get("condition_id") or data.get("conditionId")
+            market_id = _first_value(data, _ID_KEYS)
             if not market_id:
                 raise GammaClientError("Missing market ID in response")
 
@@ -219,12 +235,7 @@ class GammaClient:
             description = data.get("description", "")
 
             # Parse end date (may be endDate, end_date, or expirationDate)
-            end_date_str = (
-                data.get("endDate")
-                or data.get("end_date")
-                or data.get("expirationDate")
-                or data.get("expiration_date")
-            )
+            end_date_str = _first_value(data, _END_DATE_KEYS)
             if not end_date_str:
                 raise GammaClientError("Missing end date in response")
 
@@ -241,12 +252,7 @@ class GammaClient:
 
             # Parse CLOB token IDs mapping
             # Format may vary: clobTokenIds, clob_token_ids, tokens
-            clob_token_ids_raw = (
-                data.get("clobTokenIds")
-                or data.get("clob_token_ids")
-                or data.get("tokens")
-                or []
-            )
+            clob_token_ids_raw = _first_value(data, _TOKEN_ID_KEYS) or []
 
             if isinstance(clob_token_ids_raw, str):
                 clob_token_ids_raw = json.loads(clob_token_ids_raw)
@@ -255,10 +261,8 @@ class GammaClient:
             clob_token_ids = {}
             if isinstance(clob_token_ids_raw, list):
                 # List format: [token_id1, token_id2, ...]
-                # Map by index to outcomes
-                for i, token_id in enumerate(clob_token_ids_raw):
-                    if i < len(outcomes):
-                        clob_token_ids[outcomes[i]] = str(token_id)
+                # Map by index to outcomes (extra token IDs are ignored)
+                clob_token_ids = dict(zip(outcomes, map(str, clob_token_ids_raw)))
             elif isinstance(clob_token_ids_raw, dict):
                 # Dict format: {outcome: token_id, ...}
                 clob_token_ids = {str(k): str(v) for k, v in clob_token_ids_raw.items()}
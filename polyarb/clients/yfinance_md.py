@@ -1,18 +1,35 @@
 """yfinance wrapper for market data (spot, options, implied volatility)."""
 
+import asyncio
+import functools
+import json
 import warnings
-from datetime import date, datetime
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Callable, Optional, Sequence, TypeVar
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
+from polyarb.clients._cache import FileCache, cache_key
+
+# Distinct symbols kept per client; each Ticker holds its own cached responses
+TICKER_CACHE_SIZE = 128
+
+_T = TypeVar("_T")
+
 
 class YFinanceClientError(Exception):
     """Error raised by yfinance market data client."""
     pass
 
 
+def _new_ticker(symbol: str) -> yf.Ticker:
+    """Construct a yfinance Ticker (looked up at call time so it can be patched)."""
+    return yf.Ticker(symbol)
+
+
 class YFMarketData:
     """Client for fetching market data using yfinance.
 
@@ -20,9 +37,24 @@ class YFMarketData:
     for pricing Polymarket events using options-implied fair values.
     """
 
+    # Slow-moving reference data is cached on disk across runs. Spot prices
+    # (fresh Ticker per call) and option chains (yfinance downloads each
+    # chain on every option_chain() call) are never cached
+    EXPIRIES_TTL = 60 * 60  # seconds; listed expiries change at most daily
+    DIVIDEND_TTL = 24 * 60 * 60  # seconds; dividend data changes rarely
+    # Concurrent requests in the *_many methods; kept small so bursts over
+    # many symbols stay clear of Yahoo's rate limiting
+    MAX_WORKERS = 8
+
     def __init__(self):
         """Initialize yfinance market data client."""
-        pass  # yfinance is stateless, no initialization needed
+        # One Ticker per symbol for the client's lifetime, so expiries, chains
+        # and dividends for a symbol share yfinance's per-Ticker caches. Spot
+        # is read from a fresh Ticker each call, because Ticker.info is fetched
+        # once and never refreshed.
+        self._ticker = functools.lru_cache(maxsize=TICKER_CACHE_SIZE)(_new_ticker)
+        self._expiries_cache = FileCache("yfinance", ttl=self.EXPIRIES_TTL)
+        self._dividend_cache = FileCache("yfinance", ttl=self.DIVIDEND_TTL)
 
     def get_spot(self, ticker: str) -> float:
         """Fetch current spot price for a ticker.
@@ -37,7 +69,7 @@ class YFMarketData:
             YFinanceClientError: If ticker is invalid or data unavailable
         """
         try:
-            ticker_obj = yf.Ticker(ticker)
+            ticker_obj = _new_ticker(ticker)
             info = ticker_obj.info
 
             # Try different price fields in order of preference
@@ -80,14 +112,14 @@ class YFMarketData:
             ticker: Ticker symbol (e.g., "SPY", "BTC-USD")
 
         Returns:
-            List of expiration dates, sorted chronologically
+            List of expiration dates, sorted chronologically (the listing is
+            cached on disk for EXPIRIES_TTL)
 
         Raises:
             YFinanceClientError: If ticker has no options or data unavailable
         """
         try:
-            ticker_obj = yf.Ticker(ticker)
-            expiries = ticker_obj.options
+            expiries = self._listed_expiries(ticker)
 
             if not expiries:
                 raise YFinanceClientError(
@@ -100,7 +132,7 @@ class YFMarketData:
             expiry_dates = []
             for expiry_str in expiries:
                 try:
-                    expiry_date = datetime.strptime(expiry_str, "%Y-%m-%d").date()
+                    expiry_date = date.fromisoformat(expiry_str)
                     expiry_dates.append(expiry_date)
                 except ValueError:
                     warnings.warn(f"Skipping invalid expiry date format: {expiry_str}")
@@ -144,7 +176,7 @@ class YFMarketData:
             YFinanceClientError: If expiry not available or data fetch fails
         """
         try:
-            ticker_obj = yf.Ticker(ticker)
+            ticker_obj = self._ticker(ticker)
 
             # Convert date to string format expected by yfinance
             expiry_str = expiry.strftime("%Y-%m-%d")
@@ -173,21 +205,15 @@ class YFMarketData:
                     )
                     df['impliedVolatility'] = None
                 else:
-                    # Convert percentage form to decimal if needed
+                    # Convert percentage form to decimal if needed, in one pass
+                    # over a float64 buffer (missing values become NaN)
                     # Assume if IV > 1, it's in percentage form
-                    mask = df['impliedVolatility'] > 1.0
-                    if mask.any():
-                        df.loc[mask, 'impliedVolatility'] = df.loc[mask, 'impliedVolatility'] / 100.0
+                    iv = df['impliedVolatility'].to_numpy(dtype=np.float64, na_value=np.nan)
+                    df['impliedVolatility'] = np.where(iv > 1.0, iv / 100.0, iv)
 
             # Drop rows with missing IV (NaN or None)
-            calls_before = len(calls)
-            puts_before = len(puts)
-
-            calls = calls.dropna(subset=['impliedVolatility'])
-            puts = puts.dropna(subset=['impliedVolatility'])
-
-            calls_dropped = calls_before - len(calls)
-            puts_dropped = puts_before - len(puts)
+            calls, calls_dropped = _drop_missing_iv(calls)
+            puts, puts_dropped = _drop_missing_iv(puts)
 
             if calls_dropped > 0 or puts_dropped > 0:
                 warnings.warn(
@@ -223,27 +249,147 @@ class YFMarketData:
         Note:
             This is a best-effort method. For many tickers (especially crypto),
             dividend yield will be unavailable. Caller should default to 0 with warning.
+            Results (including "unavailable") are cached on disk for DIVIDEND_TTL.
         """
+        key = cache_key("dividend_yield", {"ticker": ticker})
+        cached = self._dividend_cache.get_json(key)
+        if isinstance(cached, list) and cached:
+            return cached[0]
+
         try:
-            ticker_obj = yf.Ticker(ticker)
+            ticker_obj = self._ticker(ticker)
             info = ticker_obj.info
 
             # Try dividend yield field (already in decimal form)
             div_yield = info.get('dividendYield')
 
             if div_yield is not None:
-                return float(div_yield)
-
-            # Try computing from dividendRate and price
-            div_rate = info.get('dividendRate')
-            price = info.get('currentPrice') or info.get('regularMarketPrice')
-
-            if div_rate is not None and price is not None and price > 0:
-                return float(div_rate) / float(price)
-
-            # No dividend data available
-            return None
+                result = float(div_yield)
+            else:
+                # Try computing from dividendRate and price
+                div_rate = info.get('dividendRate')
+                price = info.get('currentPrice') or info.get('regularMarketPrice')
+
+                if div_rate is not None and price is not None and price > 0:
+                    result = float(div_rate) / float(price)
+                else:
+                    # No dividend data available
+                    result = None
 
         except Exception:
             # Don't raise - dividend yield is optional
             return None
+
+        # Stored as a one-element list so a cached "no dividend" is not a miss
+        self._dividend_cache.put(key, json.dumps([result]).encode())
+        return result
+
+    def get_spot_many(self, tickers: Sequence[str]) -> list[float]:
+        """Fetch spot prices for several tickers concurrently.
+
+        Args:
+            tickers: Ticker symbols
+
+        Returns:
+            Spot prices in the order of tickers
+
+        Raises:
+            YFinanceClientError: If any lookup fails (the first failure is raised)
+        """
+        return self._map_concurrently(self.get_spot, tickers)
+
+    def get_option_expiries_many(self, tickers: Sequence[str]) -> list[list[date]]:
+        """Fetch option expiration dates for several tickers concurrently.
+
+        Args:
+            tickers: Ticker symbols
+
+        Returns:
+            Sorted expiry lists in the order of tickers
+
+        Raises:
+            YFinanceClientError: If any lookup fails (the first failure is raised)
+        """
+        return self._map_concurrently(self.get_option_expiries, tickers)
+
+    def get_chain_many(
+        self,
+        requests: Sequence[tuple[str, date]]
+    ) -> list[tuple[pd.DataFrame, pd.DataFrame]]:
+        """Fetch option chains for several (ticker, expiry) pairs concurrently.
+
+        Args:
+            requests: (ticker, expiry) pairs, as passed to get_chain()
+
+        Returns:
+            (calls_df, puts_df) tuples in the order of requests
+
+        Raises:
+            YFinanceClientError: If any lookup fails (the first failure is raised)
+        """
+        return self._map_concurrently(lambda req: self.get_chain(*req), requests)
+
+    async def aget_spot(self, ticker: str) -> float:
+        """Async variant of get_spot().
+
+        Args:
+            ticker: Ticker symbol (e.g., "SPY", "BTC-USD")
+
+        Returns:
+            Current spot price
+
+        Raises:
+            YFinanceClientError: If ticker is invalid or data unavailable
+        """
+        (spot,) = await self.aget_spot_many([ticker])
+        return spot
+
+    async def aget_spot_many(self, tickers: Sequence[str]) -> list[float]:
+        """Fetch spot prices for several tickers from inside an event loop.
+
+        yfinance is synchronous, so each lookup runs in a worker thread; at most
+        MAX_WORKERS run at once.
+
+        Args:
+            tickers: Ticker symbols
+
+        Returns:
+            Spot prices in the order of tickers
+
+        Raises:
+            YFinanceClientError: If any lookup fails
+        """
+        limit = asyncio.Semaphore(self.MAX_WORKERS)
+
+        async def fetch(ticker: str) -> float:
+            async with limit:
+                return await asyncio.to_thread(self.get_spot, ticker)
+
+        return list(await asyncio.gather(*(fetch(t) for t in tickers)))
+
+    def _map_concurrently(self, fn: Callable[..., _T], items: Sequence) -> list[_T]:
+        """Apply ``fn`` to each item on a bounded thread pool, preserving order."""
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def _listed_expiries(self, ticker: str) -> tuple[str, ...]:
+        """Raw "YYYY-MM-DD" expiry strings for ``ticker``, from disk when fresh."""
+        key = cache_key("options", {"ticker": ticker})
+        cached = self._expiries_cache.get_json(key)
+        if isinstance(cached, list):
+            return tuple(cached)
+
+        expiries = tuple(self._ticker(ticker).options)
+        if expiries:
+            self._expiries_cache.put(key, json.dumps(expiries).encode())
+        return expiries
+
+
+def _drop_missing_iv(df: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    """Rows of ``df`` with an IV, and how many were dropped (no copy if none)."""
+    missing = df['impliedVolatility'].isna().to_numpy()
+    if not missing.any():
+        return df, 0
+    return df.loc[~missing], int(missing.sum())
@@ -5,6 +5,8 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
+
 
 class EventType(str, Enum):
     """Type of event being modeled."""
@@ -31,8 +33,15 @@ class Verdict(str, Enum):
     FAIR = "Fair"
     EXPENSIVE = "Expensive"
 
+    emoji: str  # Report marker, attached to each member below
 
-@dataclass
+
+Verdict.CHEAP.emoji = "📉"
+Verdict.FAIR.emoji = "✅"
+Verdict.EXPENSIVE.emoji = "📈"
+
+
+@dataclass(slots=True)
 class Market:
     """Polymarket market data from Gamma API."""
     id: str
@@ -189,6 +198,25 @@ class AnalysisInputs:
 
 
 @dataclass
+class SensitivityGrid:
+    """Volatility sensitivity as parallel arrays, one entry per sigma shift."""
+    shifts: np.ndarray  # Shifts applied to the base sigma
+    sigmas: np.ndarray  # Shifted sigmas actually priced (floored at 1%)
+    probabilities: np.ndarray
+    pvs: np.ndarray
+
+    def as_dict(self) -> dict[str, tuple[float, float]]:
+        """Keyed form, e.g. {"sigma-0.02": (prob, pv), "sigma+0.02": (prob, pv)}."""
+        return {
+            # Negative shifts already carry their sign
+            (f"sigma+{shift:.2f}" if shift >= 0 else f"sigma{shift:.2f}"): (prob, pv)
+            for shift, prob, pv in zip(
+                self.shifts.tolist(), self.probabilities.tolist(), self.pvs.tolist()
+            )
+        }
+
+
+@dataclass(slots=True)
 class PricingResult:
     """Results from pricing engine."""
     probability: float  # Risk-neutral probability of event
@@ -201,6 +229,7 @@ class PricingResult:
     # Sensitivity analysis (varying sigma)
     sensitivity: dict[str, tuple[float, float]] = field(default_factory=dict)
     # e.g., {"sigma-0.02": (prob, pv), "sigma+0.02": (prob, pv), ...}
+    sensitivity_grid: Optional[SensitivityGrid] = None  # Same data as arrays
 
 
 @dataclass
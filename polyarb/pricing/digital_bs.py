@@ -5,12 +5,14 @@ occurs if the underlying settles above or below a strike at expiration.
 """
 
 import math
-from typing import Literal
+from typing import Callable, Literal
 
-from scipy.stats import norm
+import numpy as np
 
-from polyarb.models import PricingResult
-from polyarb.util.math import safe_exp, safe_log
+from polyarb.models import PricingResult, SensitivityGrid
+from polyarb.util.jit import njit, prange
+
+_SQRT2 = math.sqrt(2.0)
 
 
 class DigitalPricingError(Exception):
@@ -18,6 +20,91 @@ class DigitalPricingError(Exception):
     pass
 
 
+@njit(cache=True)
+def _discount_factor(r, T):
+    """exp(-rT), with safe_exp's overflow clamp."""
+    return math.exp(min(-r * T, 700.0))
+
+
+@njit(cache=True)
+def _digital_from_terms(log_moneyness, sqrt_T, T, carry, sigma, above, df):
+    """
+    Digital probability and PV from terms that do not depend on sigma.
+
+    ``log_moneyness`` is ln(S0/K) (clamped like safe_log), ``sqrt_T`` is √T,
+    ``carry`` is r - q and ``df`` is exp(-rT), so callers repricing the same
+    option at several sigmas compute them once.
+
+    Returns (probability, pv, d2, drift), using N(x) = erfc(-x/√2)/2 so it
+    compiles without SciPy.
+    """
+    # Compute risk-neutral drift
+    drift = carry - 0.5 * sigma * sigma
+
+    # d2 = (ln(S0/K) + (r - q - 0.5σ²)T) / (σ√T)
+    d2 = (log_moneyness + drift * T) / (sigma * sqrt_T)
+
+    # P(above) = N(d2), P(below) = N(-d2)
+    x = d2 if above else -d2
+    probability = 0.5 * math.erfc(-x / _SQRT2)
+
+    # Clamp probability to [0, 1] to handle numerical edge cases
+    probability = max(0.0, min(1.0, probability))
+
+    # Compute present value: PV = exp(-rT) * P(event)
+    return probability, df * probability, d2, drift
+
+
+@njit(cache=True)
+def _digital_core_with_df(S0, K, T, r, q, sigma, above, df):
+    """
+    Numerical core of digital_price on validated inputs.
+
+    ``df`` is the discount factor exp(-rT), passed in so batch callers
+    pricing many strikes or sigmas at one (r, T) compute it once.
+
+    Returns (probability, pv, d2, drift).
+    """
+    log_moneyness = math.log(max(S0 / K, 1e-10))
+    return _digital_from_terms(log_moneyness, math.sqrt(T), T, r - q, sigma, above, df)
+
+
+@njit(cache=True)
+def _digital_core(S0, K, T, r, q, sigma, above):
+    """_digital_core_with_df with the discount factor computed here."""
+    return _digital_core_with_df(S0, K, T, r, q, sigma, above, _discount_factor(r, T))
+
+
+@njit(cache=True)
+def _digital_core_many(S0, K, T, r, q, sigmas, above):
+    """Probabilities and PVs for each sigma in ``sigmas``, sharing sigma-free terms."""
+    df = _discount_factor(r, T)
+    log_moneyness = math.log(max(S0 / K, 1e-10))
+    sqrt_T = math.sqrt(T)
+    carry = r - q
+    n = sigmas.shape[0]
+    probs = np.empty(n)
+    pvs = np.empty(n)
+    for i in range(n):
+        probs[i], pvs[i], _, _ = _digital_from_terms(
+            log_moneyness, sqrt_T, T, carry, sigmas[i], above, df
+        )
+    return probs, pvs
+
+
+@njit(parallel=True, cache=True)
+def _digital_core_batch(S0, K, T, r, q, sigma, above):
+    """Probabilities and PVs for aligned 1-D input arrays, one row per element."""
+    n = S0.shape[0]
+    probs = np.empty(n)
+    pvs = np.empty(n)
+    for i in prange(n):
+        probs[i], pvs[i], _, _ = _digital_core(
+            S0[i], K[i], T[i], r, q, sigma[i], above[i] != 0
+        )
+    return probs, pvs
+
+
 def digital_price(
     S0: float,
     K: float,
@@ -67,28 +154,9 @@ def digital_price(
     if direction not in ("above", "below"):
         raise DigitalPricingError(f"Direction must be 'above' or 'below', got {direction}")
 
-    # Compute risk-neutral drift
-    drift = r - q - 0.5 * sigma * sigma
-
-    # Compute d2 parameter
-    # d2 = (ln(S0/K) + (r - q - 0.5σ²)T) / (σ√T)
-    log_moneyness = safe_log(S0 / K)
-    variance_term = sigma * math.sqrt(T)
-
-    d2 = (log_moneyness + drift * T) / variance_term
-
-    # Compute probability using standard normal CDF
-    if direction == "above":
-        probability = norm.cdf(d2)
-    else:  # direction == "below"
-        probability = norm.cdf(-d2)
-
-    # Clamp probability to [0, 1] to handle numerical edge cases
-    probability = max(0.0, min(1.0, probability))
-
-    # Compute present value: PV = exp(-rT) * P(event)
-    discount_factor = safe_exp(-r * T)
-    pv = discount_factor * probability
+    probability, pv, d2, drift = _digital_core(
+        float(S0), float(K), float(T), float(r), float(q), float(sigma), direction == "above"
+    )
 
     return PricingResult(
         probability=probability,
@@ -99,6 +167,69 @@ def digital_price(
     )
 
 
+def make_digital_pricer(
+    T: float,
+    r: float,
+    q: float
+) -> Callable[[float, float, float, Literal["above", "below"]], PricingResult]:
+    """
+    Specialize digital_price to one expiry and rate environment.
+
+    The discount factor, √T and carry r - q are computed once here, so a scan
+    pricing many contracts at the same expiry only pays for the strike- and
+    sigma-dependent terms on each call.
+
+    Args:
+        T: Time to expiry in years
+        r: Risk-free rate (annual, decimal)
+        q: Dividend yield (annual, decimal)
+
+    Returns:
+        Function pricer(S0, K, sigma, direction) returning the same
+        PricingResult as digital_price(S0, K, T, r, q, sigma, direction)
+
+    Raises:
+        DigitalPricingError: If T is invalid (the returned pricer raises it
+            for invalid S0, K, sigma or direction)
+    """
+    if T <= 0:
+        raise DigitalPricingError(f"Time to expiry must be positive, got {T}")
+
+    T = float(T)
+    sqrt_T = math.sqrt(T)
+    carry = float(r) - float(q)
+    df = _discount_factor(float(r), T)
+
+    def pricer(
+        S0: float,
+        K: float,
+        sigma: float,
+        direction: Literal["above", "below"]
+    ) -> PricingResult:
+        if S0 <= 0:
+            raise DigitalPricingError(f"Spot price must be positive, got {S0}")
+        if K <= 0:
+            raise DigitalPricingError(f"Strike must be positive, got {K}")
+        if sigma <= 0:
+            raise DigitalPricingError(f"Volatility must be positive, got {sigma}")
+        if direction not in ("above", "below"):
+            raise DigitalPricingError(f"Direction must be 'above' or 'below', got {direction}")
+
+        log_moneyness = math.log(max(S0 / K, 1e-10))
+        probability, pv, d2, drift = _digital_from_terms(
+            log_moneyness, sqrt_T, T, carry, float(sigma), direction == "above", df
+        )
+        return PricingResult(
+            probability=probability,
+            pv=pv,
+            d2=d2,
+            drift=drift,
+            sensitivity={}
+        )
+
+    return pricer
+
+
 def digital_price_with_sensitivity(
     S0: float,
     K: float,
@@ -127,7 +258,7 @@ def digital_price_with_sensitivity(
                      Defaults to [-0.03, -0.02, 0.02, 0.03] if not provided
 
     Returns:
-        PricingResult with base pricing and sensitivity dict populated
+        PricingResult with base pricing and sensitivity (dict and grid) populated
 
     Sensitivity dict format:
         {"sigma-0.02": (prob, pv), "sigma+0.02": (prob, pv), ...}
@@ -138,29 +269,75 @@ def digital_price_with_sensitivity(
     # Compute base price
     base_result = digital_price(S0, K, T, r, q, sigma, direction)
 
-    # Compute sensitivity for each sigma shift
-    sensitivity = {}
-    for shift in sigma_shifts:
-        shifted_sigma = sigma + shift
-        # Ensure shifted sigma is positive (minimum 1%)
-        if shifted_sigma <= 0.01:
-            shifted_sigma = 0.01
-
-        # Format key
-        if shift >= 0:
-            key = f"sigma+{shift:.2f}"
-        else:
-            key = f"sigma{shift:.2f}"  # negative sign already in shift
-
-        # Compute shifted price
-        shifted_result = digital_price(S0, K, T, r, q, shifted_sigma, direction)
-        sensitivity[key] = (shifted_result.probability, shifted_result.pv)
+    # Reprice at every shifted sigma (floored at 1%) in one kernel call
+    shifts = np.asarray(sigma_shifts, dtype=np.float64)
+    shifted_sigmas = np.maximum(sigma + shifts, 0.01)
+    probs, pvs = _digital_core_many(
+        float(S0), float(K), float(T), float(r), float(q), shifted_sigmas, direction == "above"
+    )
+    grid = SensitivityGrid(shifts, shifted_sigmas, probs, pvs)
 
     # Update base result with sensitivity
-    base_result.sensitivity = sensitivity
+    base_result.sensitivity_grid = grid
+    base_result.sensitivity = grid.as_dict()
     return base_result
 
 
+def digital_price_batch(
+    S0: np.ndarray,
+    K: np.ndarray,
+    T: np.ndarray,
+    r: float,
+    q: float,
+    sigma: np.ndarray,
+    above: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Price many digital options at once, one per element of the input arrays.
+
+    Array inputs are broadcast against each other, so a scalar spot or
+    expiry can be shared across a book of strikes. Rows are priced in
+    parallel when Numba is available.
+
+    Args:
+        S0: Spot prices
+        K: Strike prices
+        T: Times to expiry in years
+        r: Risk-free rate (annual, decimal), shared by all rows
+        q: Dividend yield (annual, decimal), shared by all rows
+        sigma: Implied volatilities (annual, decimal)
+        above: Direction per row, 1 for "above" and 0 for "below"
+
+    Returns:
+        (probabilities, pvs) arrays with the broadcast shape of the inputs,
+        matching digital_price row by row
+
+    Raises:
+        DigitalPricingError: If any input is invalid or the shapes do not broadcast
+    """
+    try:
+        arrays = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.float64) for a in (S0, K, T, sigma)),
+            np.asarray(above),
+        )
+    except ValueError as e:
+        raise DigitalPricingError(f"Input shapes do not broadcast: {e}") from e
+    shape = arrays[0].shape
+    S0_arr, K_arr, T_arr, sigma_arr, above_arr = (np.ascontiguousarray(a).ravel() for a in arrays)
+
+    for name, arr in (("Spot price", S0_arr), ("Strike", K_arr),
+                      ("Time to expiry", T_arr), ("Volatility", sigma_arr)):
+        if not np.all(arr > 0):
+            raise DigitalPricingError(f"{name} must be positive, got {arr[~(arr > 0)][0]}")
+    if not np.all((above_arr == 0) | (above_arr == 1)):
+        raise DigitalPricingError("Direction flags must be 1 (above) or 0 (below)")
+
+    probs, pvs = _digital_core_batch(
+        S0_arr, K_arr, T_arr, float(r), float(q), sigma_arr, above_arr.astype(np.int8)
+    )
+    return probs.reshape(shape), pvs.reshape(shape)
+
+
 def compute_verdict(
     poly_price: float,
     fair_pv: float,
@@ -205,3 +382,54 @@ def compute_verdict(
         return "Cheap"
     else:
         return "Expensive"
+
+
+# Codes returned by compute_verdicts, indexing into VERDICT_LABELS
+VERDICT_FAIR, VERDICT_CHEAP, VERDICT_EXPENSIVE = 0, 1, 2
+VERDICT_LABELS = ("Fair", "Cheap", "Expensive")
+
+
+@njit(cache=True)
+def _verdicts(poly, fair, abs_tol, pct_tol, out):
+    """Fill ``out`` with compute_verdict's decision for each pair, as codes."""
+    for i in range(poly.shape[0]):
+        abs_diff = abs(poly[i] - fair[i])
+        pct_diff = abs_diff / fair[i] if fair[i] > 0 else math.inf
+        if abs_diff <= abs_tol or pct_diff <= pct_tol:
+            out[i] = VERDICT_FAIR
+        elif poly[i] < fair[i]:
+            out[i] = VERDICT_CHEAP
+        else:
+            out[i] = VERDICT_EXPENSIVE
+
+
+def compute_verdicts(
+    poly_prices: np.ndarray,
+    fair_pvs: np.ndarray,
+    abs_tol: float = 0.01,
+    pct_tol: float = 0.05
+) -> np.ndarray:
+    """
+    Batch version of compute_verdict over aligned arrays of prices.
+
+    Args:
+        poly_prices: Polymarket tradable prices
+        fair_pvs: Model fair present values, same shape as poly_prices
+        abs_tol: Absolute price difference tolerance (default 0.01 = 1 cent)
+        pct_tol: Percentage difference tolerance (default 0.05 = 5%)
+
+    Returns:
+        int8 array of verdict codes (VERDICT_FAIR, VERDICT_CHEAP,
+        VERDICT_EXPENSIVE); VERDICT_LABELS[code] gives compute_verdict's string
+
+    Raises:
+        ValueError: If the arrays have different shapes
+    """
+    poly = np.ascontiguousarray(poly_prices, dtype=np.float64)
+    fair = np.ascontiguousarray(fair_pvs, dtype=np.float64)
+    if poly.shape != fair.shape:
+        raise ValueError(f"Shape mismatch: {poly.shape} prices vs {fair.shape} fair values")
+
+    out = np.empty(poly.shape, dtype=np.int8)
+    _verdicts(poly.ravel(), fair.ravel(), float(abs_tol), float(pct_tol), out.ravel())
+    return out
@@ -5,12 +5,13 @@ occurs if the underlying hits a barrier level at any time before expiration.
 """
 
 import math
-from typing import Literal
 
-from scipy.stats import norm
+import numpy as np
 
-from polyarb.models import PricingResult
-from polyarb.util.math import safe_exp, safe_log
+from polyarb.models import PricingResult, SensitivityGrid
+from polyarb.util.jit import njit, prange
+
+_SQRT2 = math.sqrt(2.0)
 
 
 class TouchPricingError(Exception):
@@ -18,6 +19,87 @@ class TouchPricingError(Exception):
     pass
 
 
+@njit(cache=True)
+def _norm_cdf(x):
+    """Standard normal CDF via erfc, so kernels compile without SciPy."""
+    return 0.5 * math.erfc(-x / _SQRT2)
+
+
+@njit(cache=True)
+def _touch_core(S0, B, T, r, q, sigma):
+    """
+    Numerical core of touch_price on validated inputs.
+
+    Returns (probability, pv, drift). Mirrors safe_log/safe_exp clamping.
+    """
+    # Compute risk-neutral drift
+    # μ = r - q - 0.5σ²
+    drift = r - q - 0.5 * sigma * sigma
+    discount_factor = math.exp(min(-r * T, 700.0))
+
+    # Barrier equals spot - probability is 1 (already touched)
+    if abs(B - S0) / S0 < 1e-10:
+        return 1.0, discount_factor, drift
+
+    # Compute log-distance to barrier
+    # a = ln(B/S0)
+    a = math.log(max(B / S0, 1e-10))
+
+    # Compute variance term
+    # σ√T
+    sigma_sqrt_t = sigma * math.sqrt(T)
+
+    # Check for driftless case (μ ≈ 0)
+    if abs(drift) < 1e-10:
+        # Driftless case: simpler formula
+        # P(hit) = 2 * (1 - N(|a|/(σ√T))) for upper barrier
+        # P(hit) = 2 * N(-|a|/(σ√T)) for lower barrier (equivalent)
+        probability = 2.0 * _norm_cdf(-abs(a) / sigma_sqrt_t)
+    else:
+        # General case with drift
+        # λ = μ / σ²
+        lambda_param = drift / (sigma * sigma)
+        mu_t = drift * T
+
+        # Upper barrier (B > S0, a > 0):
+        #   N(-(a - μT)/(σ√T)) + exp(2λa) * N(-(a + μT)/(σ√T))
+        # Lower barrier (B < S0, a < 0): the same with the signs flipped
+        sign = -1.0 if B > S0 else 1.0
+        term1 = _norm_cdf(sign * (a - mu_t) / sigma_sqrt_t)
+        term2 = math.exp(min(2 * lambda_param * a, 700.0)) * _norm_cdf(
+            sign * (a + mu_t) / sigma_sqrt_t
+        )
+        probability = term1 + term2
+
+    # Clamp probability to [0, 1] to handle numerical edge cases
+    probability = max(0.0, min(1.0, probability))
+
+    # Compute present value: PV = exp(-rT) * P(hit)
+    return probability, discount_factor * probability, drift
+
+
+@njit(cache=True)
+def _touch_core_many(S0, B, T, r, q, sigmas):
+    """Probabilities and PVs for each sigma in ``sigmas``."""
+    n = sigmas.shape[0]
+    probs = np.empty(n)
+    pvs = np.empty(n)
+    for i in range(n):
+        probs[i], pvs[i], _ = _touch_core(S0, B, T, r, q, sigmas[i])
+    return probs, pvs
+
+
+@njit(parallel=True, cache=True)
+def _touch_core_batch(S0, B, T, r, q, sigma):
+    """Probabilities and PVs for aligned 1-D input arrays, one row per element."""
+    n = S0.shape[0]
+    probs = np.empty(n)
+    pvs = np.empty(n)
+    for i in prange(n):
+        probs[i], pvs[i], _ = _touch_core(S0[i], B[i], T[i], r[i], q[i], sigma[i])
+    return probs, pvs
+
+
 def touch_price(
     S0: float,
     B: float,
@@ -76,82 +158,66 @@ def touch_price(
     if sigma <= 0:
         raise TouchPricingError(f"Volatility must be positive, got {sigma}")
 
-    # Determine barrier direction
-    if abs(B - S0) / S0 < 1e-10:
-        # Barrier equals spot - probability is 1 (already touched)
-        probability = 1.0
-        discount_factor = safe_exp(-r * T)
-        pv = discount_factor * probability
-        return PricingResult(
-            probability=probability,
-            pv=pv,
-            d2=None,
-            drift=r - q - 0.5 * sigma * sigma,
-            sensitivity={}
-        )
-
-    barrier_direction: Literal["up", "down"] = "up" if B > S0 else "down"
-
-    # Compute log-distance to barrier
-    # a = ln(B/S0)
-    a = safe_log(B / S0)
-
-    # Compute risk-neutral drift
-    # μ = r - q - 0.5σ²
-    drift = r - q - 0.5 * sigma * sigma
+    probability, pv, drift = _touch_core(
+        float(S0), float(B), float(T), float(r), float(q), float(sigma)
+    )
 
-    # Compute variance term
-    # σ√T
-    sigma_sqrt_t = sigma * math.sqrt(T)
+    return PricingResult(
+        probability=probability,
+        pv=pv,
+        d2=None,  # d2 is not used for touch barriers
+        drift=drift,
+        sensitivity={}
+    )
 
-    # Check for driftless case (μ ≈ 0)
-    if abs(drift) < 1e-10:
-        # Driftless case: simpler formula
-        # P(hit) = 2 * (1 - N(|a|/(σ√T))) for upper barrier
-        # P(hit) = 2 * N(-|a|/(σ√T)) for lower barrier (equivalent)
-        abs_a = abs(a)
-        z = abs_a / sigma_sqrt_t
-        probability = 2.0 * norm.cdf(-z)
-    else:
-        # General case with drift
-        # λ = μ / σ²
-        lambda_param = drift / (sigma * sigma)
 
-        # Compute the two terms
-        # Term 1: N(-(a - μT)/(σ√T))  or  N((a - μT)/(σ√T)) for lower
-        # Term 2: exp(2λa) * N(-(a + μT)/(σ√T))  or  exp(2λa) * N((a + μT)/(σ√T)) for lower
+def touch_price_batch(
+    S0: np.ndarray,
+    B: np.ndarray,
+    T: np.ndarray,
+    r: np.ndarray,
+    q: np.ndarray,
+    sigma: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Price many touch barrier options at once with the touch_price formula.
 
-        mu_t = drift * T
+    Inputs are broadcast against each other, so scalars can be shared across
+    a batch of barriers or volatilities. Rows are priced with touch_price's
+    kernel, in parallel when Numba is available.
 
-        if barrier_direction == "up":
-            # Upper barrier: B > S0, a > 0
-            z1 = -(a - mu_t) / sigma_sqrt_t
-            z2 = -(a + mu_t) / sigma_sqrt_t
-            term1 = norm.cdf(z1)
-            term2 = safe_exp(2 * lambda_param * a) * norm.cdf(z2)
-        else:
-            # Lower barrier: B < S0, a < 0
-            z1 = (a - mu_t) / sigma_sqrt_t
-            z2 = (a + mu_t) / sigma_sqrt_t
-            term1 = norm.cdf(z1)
-            term2 = safe_exp(2 * lambda_param * a) * norm.cdf(z2)
+    Args:
+        S0: Current spot prices
+        B: Barrier levels
+        T: Times to expiry in years
+        r: Risk-free rates (annual, decimal)
+        q: Dividend yields (annual, decimal)
+        sigma: Implied volatilities (annual, decimal)
 
-        probability = term1 + term2
+    Returns:
+        (probabilities, pvs) arrays with the broadcast shape of the inputs,
+        matching touch_price element by element
 
-    # Clamp probability to [0, 1] to handle numerical edge cases
-    probability = max(0.0, min(1.0, probability))
+    Raises:
+        TouchPricingError: If any input is invalid or the shapes do not broadcast
+    """
+    try:
+        S0, B, T, r, q, sigma = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (S0, B, T, r, q, sigma))
+        )
+    except ValueError as e:
+        raise TouchPricingError(f"Input shapes do not broadcast: {e}") from e
 
-    # Compute present value: PV = exp(-rT) * P(hit)
-    discount_factor = safe_exp(-r * T)
-    pv = discount_factor * probability
+    for name, arr in (("Spot price", S0), ("Barrier", B),
+                      ("Time to expiry", T), ("Volatility", sigma)):
+        if not np.all(arr > 0):
+            raise TouchPricingError(f"{name} must be positive, got {arr[~(arr > 0)][0]}")
 
-    return PricingResult(
-        probability=probability,
-        pv=pv,
-        d2=None,  # d2 is not used for touch barriers
-        drift=drift,
-        sensitivity={}
+    shape = S0.shape
+    probs, pvs = _touch_core_batch(
+        *(np.ascontiguousarray(x).ravel() for x in (S0, B, T, r, q, sigma))
     )
+    return probs.reshape(shape), pvs.reshape(shape)
 
 
 def touch_price_with_sensitivity(
@@ -180,7 +246,7 @@ def touch_price_with_sensitivity(
                      Defaults to [-0.03, -0.02, 0.02, 0.03] if not provided
 
     Returns:
-        PricingResult with base pricing and sensitivity dict populated
+        PricingResult with base pricing and sensitivity (dict and grid) populated
 
     Sensitivity dict format:
         {"sigma-0.02": (prob, pv), "sigma+0.02": (prob, pv), ...}
@@ -191,24 +257,15 @@ def touch_price_with_sensitivity(
     # Compute base price
     base_result = touch_price(S0, B, T, r, q, sigma)
 
-    # Compute sensitivity for each sigma shift
-    sensitivity = {}
-    for shift in sigma_shifts:
-        shifted_sigma = sigma + shift
-        # Ensure shifted sigma is positive (minimum 1%)
-        if shifted_sigma <= 0.01:
-            shifted_sigma = 0.01
-
-        # Format key
-        if shift >= 0:
-            key = f"sigma+{shift:.2f}"
-        else:
-            key = f"sigma{shift:.2f}"  # negative sign already in shift
-
-        # Compute shifted price
-        shifted_result = touch_price(S0, B, T, r, q, shifted_sigma)
-        sensitivity[key] = (shifted_result.probability, shifted_result.pv)
+    # Reprice at every shifted sigma (floored at 1%) in one kernel call
+    shifts = np.asarray(sigma_shifts, dtype=np.float64)
+    shifted_sigmas = np.maximum(sigma + shifts, 0.01)
+    probs, pvs = _touch_core_many(
+        float(S0), float(B), float(T), float(r), float(q), shifted_sigmas
+    )
+    grid = SensitivityGrid(shifts, shifted_sigmas, probs, pvs)
 
     # Update base result with sensitivity
-    base_result.sensitivity = sensitivity
+    base_result.sensitivity_grid = grid
+    base_result.sensitivity = grid.as_dict()
     return base_result
@@ -315,14 +315,6 @@ def _render_section_d_comparison(ctx: ReportContext) -> str:
     """Section D: Fair vs Polymarket comparison table with verdict."""
     r = ctx.results
 
-    verdict_emoji = {
-        Verdict.CHEAP: "📉",
-        Verdict.FAIR: "✅",
-        Verdict.EXPENSIVE: "📈"
-    }
-
-    emoji = verdict_emoji.get(r.verdict, "")
-
     return f"""## D. Polymarket vs Fair Value Comparison
 
 | Metric | Value |
@@ -331,7 +323,7 @@ def _render_section_d_comparison(ctx: ReportContext) -> str:
 | **Polymarket Yes Price** | ${r.poly_yes_price:.6f} |
 | **Absolute Mispricing** | ${r.mispricing_abs:+.6f} |
 | **Percentage Mispricing** | {r.mispricing_pct * 100:+.2f}% |
-| **Verdict** | **{r.verdict.value}** {emoji} |
+| **Verdict** | **{r.verdict.value}** {r.verdict.emoji} |
 
 ### Interpretation
 
@@ -0,0 +1,24 @@
+"""Optional Numba JIT helpers.
+
+Numba is an optional dependency (the ``jit`` extra). When it is not installed,
+``njit`` leaves the decorated function untouched and ``prange`` falls back to
+``range``, so kernels written against these names still run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
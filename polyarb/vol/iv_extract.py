@@ -5,20 +5,229 @@ This module extracts implied volatility from option chain data, focusing on
 the strike region around a target level (barrier or strike).
 """
 
+import functools
+import hashlib
+import math
 import warnings
-from typing import Optional
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 
+from polyarb.util.jit import HAS_NUMBA
+from polyarb.vol.iv_extract_numba import batch_interp, batch_interp_numpy
+
 
 class IVExtractionError(Exception):
     """Raised when IV extraction fails."""
     pass
 
 
+# Sensitivity grid: vol-point shifts applied to the base IV, their labels,
+# and the floor for each shifted value (only downward shifts are clipped)
+SENS_LABELS = ('minus_3', 'minus_2', 'base', 'plus_2', 'plus_3')
+_SENS_OFFSETS = np.array([-0.03, -0.02, 0.0, 0.02, 0.03])
+_SENS_FLOORS = np.array([0.01, 0.01, 0.0, 0.0, 0.0])
+
+# Relative tolerance for treating a quoted strike as equal to the target
+_EXACT_STRIKE_RTOL = 1e-12
+
+# Chains shorter than this also keep their strikes as a tuple: for small
+# chains stdlib bisect beats np.searchsorted's per-call overhead
+_BISECT_MAX_STRIKES = 64
+
+# Without Numba the kernel would run as a Python loop; use the NumPy version
+_batch_interp = batch_interp if HAS_NUMBA else batch_interp_numpy
+
+
+@dataclass
+class Chain:
+    """
+    Option chain as bare arrays, for callers that do not need a DataFrame.
+
+    Fields mirror the chain DataFrame columns, so a Chain can be passed
+    anywhere a chain DataFrame is accepted without building one.
+    """
+    strike: np.ndarray
+    impliedVolatility: np.ndarray
+
+
+class ChainView(NamedTuple):
+    """
+    Option chain reduced to read-only float64 arrays sorted by strike.
+
+    Rows with missing IV are dropped. The extraction functions accept a
+    ChainView anywhere they accept a chain DataFrame; build one with
+    ``ChainView.from_frame`` to reuse it without the per-chain lookup.
+    """
+    strikes: np.ndarray
+    ivs: np.ndarray
+    log_strikes: np.ndarray  # ln(strike), precomputed for log-moneyness lookups
+    strike_tuple: Optional[tuple[float, ...]] = None  # Strikes for bisect on small chains
+
+    @classmethod
+    def from_frame(cls, chain_df: Union[pd.DataFrame, Chain]) -> "ChainView":
+        """
+        Build (or fetch the cached) view of an option chain DataFrame or Chain.
+
+        The view is cached per chain object and is not refreshed if the chain
+        is edited in place; call ``clear_chain_cache(chain)`` after editing.
+
+        Raises
+        ------
+        IVExtractionError
+            If the chain is missing required columns, they are not numeric,
+            or a Chain's arrays differ in length
+        """
+        return _get_sorted_chain(chain_df)
+
+
+ChainLike = Union[pd.DataFrame, Chain, ChainView]
+
+
+# Sorted chain arrays keyed by id(chain). Entries are evicted when the
+# DataFrame is garbage collected, or explicitly via clear_chain_cache() when
+# a chain is edited in place after its first extraction.
+_CHAIN_CACHE: dict[int, ChainView] = {}
+
+# Sorted chain arrays keyed by a digest of the quoted strikes and IVs, so a
+# refetched chain with unchanged quotes reuses the previous view. LRU-bounded.
+_CONTENT_CACHE: "OrderedDict[bytes, ChainView]" = OrderedDict()
+_CONTENT_CACHE_SIZE = 32
+
+
+def _validate_chain(chain_df: pd.DataFrame) -> None:
+    """Check the chain has numeric 'strike' and 'impliedVolatility' columns."""
+    if 'strike' not in chain_df.columns or 'impliedVolatility' not in chain_df.columns:
+        raise IVExtractionError(
+            "Chain must have 'strike' and 'impliedVolatility' columns"
+        )
+
+    for col in ('strike', 'impliedVolatility'):
+        if not pd.api.types.is_numeric_dtype(chain_df[col]):
+            raise IVExtractionError(
+                f"Chain column '{col}' must be numeric, got {chain_df[col].dtype}"
+            )
+
+
+def _chain_columns(chain: Union[pd.DataFrame, Chain]) -> tuple[np.ndarray, np.ndarray]:
+    """Validated float64 (strikes, ivs) arrays of a chain, in quoted order."""
+    if isinstance(chain, pd.DataFrame):
+        _validate_chain(chain)
+        chain_arr = chain[['strike', 'impliedVolatility']].to_numpy(dtype=np.float64)
+        return chain_arr[:, 0], chain_arr[:, 1]
+
+    columns = []
+    for col in ('strike', 'impliedVolatility'):
+        arr = np.asarray(getattr(chain, col))
+        if arr.dtype.kind not in 'iuf':
+            raise IVExtractionError(f"Chain column '{col}' must be numeric, got {arr.dtype}")
+        columns.append(arr.astype(np.float64, copy=False).ravel())
+    strikes, ivs = columns
+    if strikes.shape != ivs.shape:
+        raise IVExtractionError(
+            f"Chain columns differ in length: {strikes.size} strikes, {ivs.size} IVs"
+        )
+    return strikes, ivs
+
+
+def _get_sorted_chain(chain: Union[pd.DataFrame, Chain]) -> ChainView:
+    """
+    Return the chain's strikes, IVs and log-strikes sorted by strike.
+
+    Rows with missing IV are dropped. The result is cached per chain object
+    so repeated extractions from the same chain skip validation, conversion,
+    sort and logarithms. A new chain object with the same quotes as a recent
+    one reuses its view after validation and conversion.
+    """
+    key = id(chain)
+    cached = _CHAIN_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    strikes, ivs = _chain_columns(chain)
+    digest = _content_digest(strikes, ivs)
+    sorted_chain = _CONTENT_CACHE.get(digest)
+    if sorted_chain is not None:
+        _CONTENT_CACHE.move_to_end(digest)
+    else:
+        sorted_chain = _build_view(strikes, ivs)
+        _CONTENT_CACHE[digest] = sorted_chain
+        if len(_CONTENT_CACHE) > _CONTENT_CACHE_SIZE:
+            _CONTENT_CACHE.popitem(last=False)
+
+    _CHAIN_CACHE[key] = sorted_chain
+    weakref.finalize(chain, _CHAIN_CACHE.pop, key, None)
+    return sorted_chain
+
+
+def clear_chain_cache(chain: Optional[Union[pd.DataFrame, Chain]] = None) -> None:
+    """
+    Forget cached chain views so edited chains are re-read.
+
+    Parameters
+    ----------
+    chain : pd.DataFrame or Chain, optional
+        Chain edited in place since it was last extracted from. If omitted,
+        every cached view is dropped.
+    """
+    if chain is None:
+        _CHAIN_CACHE.clear()
+        _CONTENT_CACHE.clear()
+    else:
+        _CHAIN_CACHE.pop(id(chain), None)
+
+
+def _content_digest(strikes: np.ndarray, ivs: np.ndarray) -> bytes:
+    """Digest identifying a chain by its quoted strikes and IVs."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(strikes).tobytes())
+    h.update(np.ascontiguousarray(ivs).tobytes())
+    return h.digest()
+
+
+def _build_view(strikes: np.ndarray, ivs: np.ndarray) -> ChainView:
+    """Sort validated chain columns by strike and drop rows with missing IV."""
+    keep = ~np.isnan(ivs)
+    strikes, ivs = strikes[keep], ivs[keep]
+    order = np.argsort(strikes)
+    strikes = np.ascontiguousarray(strikes[order])
+    ivs = np.ascontiguousarray(ivs[order])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_strikes = np.log(strikes)
+    # Shared across calls, so guard against accidental in-place edits
+    for arr in (strikes, ivs, log_strikes):
+        arr.flags.writeable = False
+    strike_tuple = tuple(strikes.tolist()) if len(strikes) < _BISECT_MAX_STRIKES else None
+    return ChainView(strikes, ivs, log_strikes, strike_tuple)
+
+
+def _region_bounds(view: ChainView, lower: float, upper: float) -> tuple[int, int]:
+    """Slice bounds of the view's strikes lying in [lower, upper]."""
+    if view.strike_tuple is not None:
+        return bisect_left(view.strike_tuple, lower), bisect_right(view.strike_tuple, upper)
+    return (
+        int(np.searchsorted(view.strikes, lower, side='left')),
+        int(np.searchsorted(view.strikes, upper, side='right')),
+    )
+
+
+def _chain_view(chain: ChainLike) -> Optional[ChainView]:
+    """View of ``chain``, or None if it is an empty DataFrame or Chain."""
+    if isinstance(chain, ChainView):
+        return chain
+    if chain.empty if isinstance(chain, pd.DataFrame) else np.size(chain.strike) == 0:
+        return None
+    # Validates the columns the first time this chain is seen
+    return _get_sorted_chain(chain)
+
+
 def extract_strike_region_iv(
-    chain_df: pd.DataFrame,
+    chain_df: ChainLike,
     strike_level: float,
     window_pct: float = 0.05,
     min_strikes: int = 2
@@ -31,8 +240,9 @@ def extract_strike_region_iv(
 
     Parameters
     ----------
-    chain_df : pd.DataFrame
+    chain_df : pd.DataFrame, Chain or ChainView
         Option chain DataFrame with columns: 'strike', 'impliedVolatility'
+        (or a Chain of those arrays, or a prebuilt ChainView).
         IV should be in decimal form (0.25 for 25%)
     strike_level : float
         Target strike/barrier level to extract IV at
@@ -58,14 +268,15 @@ def extract_strike_region_iv(
     2. Drops strikes with missing IV
     3. Interpolates IV at exact strike using log-moneyness
     4. Falls back to nearest strike if only one strike available
+
+    The chain's sorted view is cached per chain object, so a DataFrame or
+    Chain edited in place afterwards keeps returning its old quotes. Pass a
+    fresh object, or call ``clear_chain_cache(chain)`` after editing.
     """
-    if chain_df.empty:
+    view = _chain_view(chain_df)
+    if view is None:
         raise IVExtractionError("Option chain is empty")
-
-    if 'strike' not in chain_df.columns or 'impliedVolatility' not in chain_df.columns:
-        raise IVExtractionError(
-            "Chain must have 'strike' and 'impliedVolatility' columns"
-        )
+    all_strikes, all_ivs, all_log_strikes = view.strikes, view.ivs, view.log_strikes
 
     if strike_level <= 0:
         raise IVExtractionError(f"Strike level must be positive, got {strike_level}")
@@ -73,87 +284,101 @@ def extract_strike_region_iv(
     if window_pct <= 0 or window_pct >= 1:
         raise IVExtractionError(f"Window percentage must be in (0, 1), got {window_pct}")
 
-    # Filter to strike region
+    # Filter to strike region (strikes are sorted, so the region is a slice)
     lower_bound = strike_level * (1 - window_pct)
     upper_bound = strike_level * (1 + window_pct)
+    lo, hi = _region_bounds(view, lower_bound, upper_bound)
 
-    region_df = chain_df[
-        (chain_df['strike'] >= lower_bound) &
-        (chain_df['strike'] <= upper_bound)
-    ].copy()
-
-    # Drop missing IVs
-    region_df = region_df.dropna(subset=['impliedVolatility'])
-
-    if len(region_df) == 0:
+    if lo == hi:
         # Try expanding the window
-        warnings.warn(
-            f"No strikes with valid IV in ±{window_pct*100:.1f}% window around {strike_level}. "
-            f"Trying wider window (±20%)."
-        )
+        _warn_widening_window(strike_level, window_pct)
         window_pct = 0.20
         lower_bound = strike_level * (1 - window_pct)
         upper_bound = strike_level * (1 + window_pct)
+        lo, hi = _region_bounds(view, lower_bound, upper_bound)
 
-        region_df = chain_df[
-            (chain_df['strike'] >= lower_bound) &
-            (chain_df['strike'] <= upper_bound)
-        ].copy()
-        region_df = region_df.dropna(subset=['impliedVolatility'])
-
-        if len(region_df) == 0:
+        if lo == hi:
             raise IVExtractionError(
                 f"No strikes with valid IV found near {strike_level} "
                 f"(tried ±{window_pct*100:.0f}% window)"
             )
 
-    if len(region_df) < min_strikes:
-        warnings.warn(
-            f"Only {len(region_df)} strike(s) available in region (min {min_strikes} preferred). "
-            f"Using available data."
-        )
+    strikes = all_strikes[lo:hi]
+    ivs = all_ivs[lo:hi]
+    log_strikes = all_log_strikes[lo:hi]
 
-    # Sort by strike
-    region_df = region_df.sort_values('strike')
+    if len(strikes) < min_strikes:
+        _warn_sparse_region(len(strikes), min_strikes)
 
     # If only one strike, use it directly
-    if len(region_df) == 1:
-        iv = float(region_df.iloc[0]['impliedVolatility'])
-        strike = float(region_df.iloc[0]['strike'])
-        warnings.warn(
-            f"Only one strike ({strike:.2f}) available. Using IV={iv:.4f} directly."
-        )
+    if len(strikes) == 1:
+        iv = float(ivs[0])
+        _warn_single_strike(float(strikes[0]), iv)
         return iv
 
-    # Interpolate using log-moneyness
-    # Log-moneyness: m = ln(K / K_target)
-    strikes = region_df['strike'].values
-    ivs = region_df['impliedVolatility'].values
-
-    log_moneyness = np.log(strikes / strike_level)
-    target_log_moneyness = 0.0  # ln(K_target / K_target) = 0
+    # Fast path: a quoted strike at the target (common for round barriers)
+    # skips the range checks and the log-moneyness interpolation
+    idx = int(np.searchsorted(strikes, strike_level))
+    for k in (idx, idx - 1):
+        if 0 <= k < len(strikes) and math.isclose(
+            strikes[k], strike_level, rel_tol=_EXACT_STRIKE_RTOL
+        ):
+            return _check_extracted_iv(float(ivs[k]))
 
     # Linear interpolation in log-moneyness space
     # If target is outside the range, use nearest neighbor (no extrapolation)
-    if target_log_moneyness < log_moneyness[0]:
+    if strike_level < strikes[0]:
         # Below all strikes, use lowest
         iv = float(ivs[0])
-        warnings.warn(
-            f"Target strike {strike_level} below available range. "
-            f"Using IV from nearest strike {strikes[0]:.2f}"
-        )
-    elif target_log_moneyness > log_moneyness[-1]:
+        _warn_outside_range(strike_level, "below", float(strikes[0]))
+    elif strike_level > strikes[-1]:
         # Above all strikes, use highest
         iv = float(ivs[-1])
-        warnings.warn(
-            f"Target strike {strike_level} above available range. "
-            f"Using IV from nearest strike {strikes[-1]:.2f}"
-        )
+        _warn_outside_range(strike_level, "above", float(strikes[-1]))
     else:
-        # Interpolate
-        iv = float(np.interp(target_log_moneyness, log_moneyness, ivs))
+        # Strictly between strikes[idx - 1] and strikes[idx] (exact matches
+        # returned above); only the bracketing pair needs a log
+        # Position of the target in log-moneyness: ln(K_target/K0) / ln(K1/K0)
+        log_k0, log_k1 = float(log_strikes[idx - 1]), float(log_strikes[idx])
+        iv0, iv1 = float(ivs[idx - 1]), float(ivs[idx])
+        t = (math.log(strike_level) - log_k0) / (log_k1 - log_k0)
+        iv = iv0 + t * (iv1 - iv0)
+
+    return _check_extracted_iv(iv)
+
 
-    # Validate result
+# Warning helpers: messages are only formatted on the (rare) paths that warn,
+# keeping f-string construction out of the body of extract_strike_region_iv
+
+def _warn_widening_window(strike_level: float, window_pct: float) -> None:
+    warnings.warn(
+        f"No strikes with valid IV in ±{window_pct*100:.1f}% window around {strike_level}. "
+        f"Trying wider window (±20%)."
+    )
+
+
+def _warn_sparse_region(n_strikes: int, min_strikes: int) -> None:
+    warnings.warn(
+        f"Only {n_strikes} strike(s) available in region (min {min_strikes} preferred). "
+        f"Using available data."
+    )
+
+
+def _warn_single_strike(strike: float, iv: float) -> None:
+    warnings.warn(
+        f"Only one strike ({strike:.2f}) available. Using IV={iv:.4f} directly."
+    )
+
+
+def _warn_outside_range(strike_level: float, side: str, nearest: float) -> None:
+    warnings.warn(
+        f"Target strike {strike_level} {side} available range. "
+        f"Using IV from nearest strike {nearest:.2f}"
+    )
+
+
+def _check_extracted_iv(iv: float) -> float:
+    """Reject a non-positive IV and warn on an implausibly high one."""
     if iv <= 0:
         raise IVExtractionError(f"Extracted IV is non-positive: {iv}")
 
@@ -163,10 +388,72 @@ def extract_strike_region_iv(
     return iv
 
 
-def compute_sensitivity_ivs(base_iv: float) -> dict[str, float]:
+def extract_strike_region_iv_many(
+    chain_df: ChainLike,
+    strike_levels: Sequence[float],
+    window_pct: float = 0.05
+) -> np.ndarray:
+    """
+    Extract implied volatility at many strike levels from one option chain.
+
+    Batch counterpart of ``extract_strike_region_iv``: the chain is filtered
+    and sorted once, then every level is evaluated in one vectorized pass
+    (a JIT-compiled kernel when Numba is installed, NumPy otherwise).
+    Unlike the scalar function, no warnings are issued per level.
+
+    Parameters
+    ----------
+    chain_df : pd.DataFrame, Chain or ChainView
+        Option chain DataFrame with columns: 'strike', 'impliedVolatility'
+        (or a Chain of those arrays, or a prebuilt ChainView)
+    strike_levels : Sequence[float]
+        Target strike/barrier levels to extract IV at
+    window_pct : float, default=0.05
+        Moneyness window as a percentage (0.05 = ±5%)
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated IV per level, in the order given. Levels with no usable
+        strikes (even in the widened ±20% window) or a non-positive result
+        are NaN.
+
+    Raises
+    ------
+    IVExtractionError
+        If the chain is empty or malformed, or any level/window is invalid
+
+    Notes
+    -----
+    As in ``extract_strike_region_iv``, the chain's view is cached per
+    object; call ``clear_chain_cache(chain)`` after editing it in place.
+    """
+    view = _chain_view(chain_df)
+    if view is None:
+        raise IVExtractionError("Option chain is empty")
+    strikes, ivs, log_strikes = view.strikes, view.ivs, view.log_strikes
+
+    if window_pct <= 0 or window_pct >= 1:
+        raise IVExtractionError(f"Window percentage must be in (0, 1), got {window_pct}")
+
+    levels = np.asarray(strike_levels, dtype=np.float64)
+    if np.any(levels <= 0):
+        raise IVExtractionError(f"Strike levels must be positive, got {levels[levels <= 0]}")
+
+    result = _batch_interp(strikes, ivs, log_strikes, levels, window_pct)
+    result[result <= 0] = np.nan
+
+    return result
+
+
+@functools.lru_cache(maxsize=256)
+def compute_sensitivity_ivs(base_iv: float) -> np.ndarray:
     """
     Compute a set of IVs for sensitivity analysis.
 
+    Results are memoized per ``base_iv``, so the returned array is
+    read-only and shared between callers.
+
     Parameters
     ----------
     base_iv : float
@@ -174,29 +461,51 @@ def compute_sensitivity_ivs(base_iv: float) -> dict[str, float]:
 
     Returns
     -------
-    dict[str, float]
-        Dictionary with keys: 'base', 'minus_3', 'minus_2', 'plus_2', 'plus_3'
-        Values are clipped to be positive (minimum 0.01)
+    np.ndarray
+        IVs in ``SENS_LABELS`` order: base -3, -2, +0, +2, +3 vol points.
+        Shifted-down values are clipped to be positive (minimum 0.01)
 
     Examples
     --------
     >>> compute_sensitivity_ivs(0.25)
-    {'base': 0.25, 'minus_3': 0.22, 'minus_2': 0.23, 'plus_2': 0.27, 'plus_3': 0.28}
+    array([0.22, 0.23, 0.25, 0.27, 0.28])
     """
     if base_iv <= 0:
         raise ValueError(f"Base IV must be positive, got {base_iv}")
 
-    return {
-        'base': base_iv,
-        'minus_3': max(base_iv - 0.03, 0.01),
-        'minus_2': max(base_iv - 0.02, 0.01),
-        'plus_2': base_iv + 0.02,
-        'plus_3': base_iv + 0.03,
-    }
+    ivs = np.maximum(base_iv + _SENS_OFFSETS, _SENS_FLOORS)
+    ivs.flags.writeable = False
+    return ivs
+
+
+def compute_sensitivity_ivs_dict(base_iv: float) -> dict[str, float]:
+    """
+    Compute sensitivity IVs keyed by label.
+
+    Dictionary form of ``compute_sensitivity_ivs`` for callers that look
+    IVs up by name.
+
+    Parameters
+    ----------
+    base_iv : float
+        Base implied volatility in decimal form
+
+    Returns
+    -------
+    dict[str, float]
+        Dictionary with keys: 'base', 'minus_3', 'minus_2', 'plus_2', 'plus_3'
+        Values are clipped to be positive (minimum 0.01)
+
+    Examples
+    --------
+    >>> compute_sensitivity_ivs_dict(0.25)
+    {'minus_3': 0.22, 'minus_2': 0.23, 'base': 0.25, 'plus_2': 0.27, 'plus_3': 0.28}
+    """
+    return dict(zip(SENS_LABELS, compute_sensitivity_ivs(base_iv).tolist()))
 
 
 def get_average_iv_from_region(
-    chain_df: pd.DataFrame,
+    chain_df: ChainLike,
     strike_level: float,
     window_pct: float = 0.05
 ) -> Optional[float]:
@@ -207,8 +516,9 @@ def get_average_iv_from_region(
 
     Parameters
     ----------
-    chain_df : pd.DataFrame
+    chain_df : pd.DataFrame, Chain or ChainView
         Option chain DataFrame with 'strike' and 'impliedVolatility'
+        (or a Chain of those arrays, or a prebuilt ChainView)
     strike_level : float
         Target strike level
     window_pct : float, default=0.05
@@ -218,26 +528,32 @@ def get_average_iv_from_region(
     -------
     float or None
         Average IV if available, None otherwise
+
+    Raises
+    ------
+    IVExtractionError
+        If the chain is missing required columns
+
+    Notes
+    -----
+    As in ``extract_strike_region_iv``, the chain's view is cached per
+    object; call ``clear_chain_cache(chain)`` after editing it in place.
     """
-    if chain_df.empty:
+    view = _chain_view(chain_df)
+    if view is None:
         return None
-
     lower_bound = strike_level * (1 - window_pct)
     upper_bound = strike_level * (1 + window_pct)
+    lo, hi = _region_bounds(view, lower_bound, upper_bound)
 
-    region_df = chain_df[
-        (chain_df['strike'] >= lower_bound) &
-        (chain_df['strike'] <= upper_bound)
-    ].copy()
-
-    region_df = region_df.dropna(subset=['impliedVolatility'])
-
-    if len(region_df) == 0:
+    if lo == hi:
         return None
 
-    avg_iv = float(region_df['impliedVolatility'].mean())
+    with np.errstate(invalid='ignore'):
+        avg_iv = float(view.ivs[lo:hi].mean())
 
-    if avg_iv <= 0:
+    # Also rejects NaN
+    if not avg_iv > 0:
         return None
 
     return avg_iv
@@ -0,0 +1,139 @@
+"""
+Numba kernels for batch IV extraction.
+
+These kernels work on a chain that has already been reduced to float64 arrays
+of strikes (sorted ascending) and IVs with missing values dropped, so many
+target levels can be evaluated against one chain without re-filtering it.
+The per-level logic mirrors ``extract_strike_region_iv``: an exact strike
+match wins, otherwise the IV is interpolated linearly in log-moneyness between
+the bracketing strikes inside the window, falling back to the nearest strike
+in the window when only one side is available.
+
+``batch_interp_numpy`` is a vectorized NumPy equivalent of ``batch_interp``
+used when Numba is not installed, where the kernel would run as a plain
+Python loop.
+"""
+
+import math
+
+import numpy as np
+
+from polyarb.util.jit import njit, prange
+
+# Window used when nothing is found in the requested one
+# (matches the widening step in extract_strike_region_iv)
+FALLBACK_WINDOW_PCT = 0.20
+
+
+@njit(cache=True)
+def _bisect_left(a, x):
+    """Index of the first element of sorted ``a`` that is >= ``x``."""
+    lo = 0
+    hi = a.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a[mid] < x:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@njit(cache=True)
+def _interp_one(strikes, ivs, log_strikes, target, window_pct):
+    """IV at ``target`` using strikes within ±window_pct, or NaN if none."""
+    n = strikes.shape[0]
+    idx = _bisect_left(strikes, target)
+
+    if idx < n and strikes[idx] == target:
+        return ivs[idx]
+
+    lower = target * (1.0 - window_pct)
+    upper = target * (1.0 + window_pct)
+    has_lo = idx > 0 and strikes[idx - 1] >= lower
+    has_hi = idx < n and strikes[idx] <= upper
+
+    if has_lo and has_hi:
+        log_k0 = log_strikes[idx - 1]
+        log_k1 = log_strikes[idx]
+        t = (math.log(target) - log_k0) / (log_k1 - log_k0)
+        return ivs[idx - 1] + t * (ivs[idx] - ivs[idx - 1])
+    if has_hi:
+        return ivs[idx]
+    if has_lo:
+        return ivs[idx - 1]
+    return np.nan
+
+
+@njit(parallel=True, cache=True)
+def batch_interp(strikes, ivs, log_strikes, targets, window_pct):
+    """
+    Interpolate IVs at many target levels over one sorted chain.
+
+    Parameters
+    ----------
+    strikes : np.ndarray
+        Strikes sorted ascending (float64, no NaNs)
+    ivs : np.ndarray
+        IVs aligned with ``strikes`` (float64, no NaNs)
+    log_strikes : np.ndarray
+        ``np.log(strikes)``, precomputed once per chain
+    targets : np.ndarray
+        Target strike/barrier levels (float64, positive)
+    window_pct : float
+        Moneyness window as a percentage (0.05 = ±5%)
+
+    Returns
+    -------
+    np.ndarray
+        IV per target; NaN where no strike falls in the window even after
+        widening to ``FALLBACK_WINDOW_PCT``
+    """
+    out = np.empty(targets.shape[0])
+    for i in prange(targets.shape[0]):
+        iv = _interp_one(strikes, ivs, log_strikes, targets[i], window_pct)
+        if np.isnan(iv):
+            iv = _interp_one(strikes, ivs, log_strikes, targets[i], FALLBACK_WINDOW_PCT)
+        out[i] = iv
+    return out
+
+
+def _interp_numpy(strikes, ivs, log_strikes, targets, window_pct):
+    """Vectorized ``_interp_one`` over all ``targets``."""
+    n = strikes.shape[0]
+    idx = np.searchsorted(strikes, targets, side='left')
+    lo_idx = np.maximum(idx - 1, 0)
+    hi_idx = np.minimum(idx, n - 1)
+
+    has_lo = (idx > 0) & (strikes[lo_idx] >= targets * (1.0 - window_pct))
+    has_hi = (idx < n) & (strikes[hi_idx] <= targets * (1.0 + window_pct))
+    exact = (idx < n) & (strikes[hi_idx] == targets)
+
+    log_k0 = log_strikes[lo_idx]
+    log_k1 = log_strikes[hi_idx]
+    both = has_lo & has_hi & ~exact
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(both, (np.log(targets) - log_k0) / (log_k1 - log_k0), 0.0)
+    lerp = ivs[lo_idx] + t * (ivs[hi_idx] - ivs[lo_idx])
+
+    out = np.full(targets.shape[0], np.nan)
+    out = np.where(has_lo, ivs[lo_idx], out)
+    out = np.where(has_hi | exact, ivs[hi_idx], out)
+    return np.where(both, lerp, out)
+
+
+def batch_interp_numpy(strikes, ivs, log_strikes, targets, window_pct):
+    """
+    NumPy implementation of ``batch_interp`` with identical results.
+
+    Parameters and return value are as for ``batch_interp``.
+    """
+    if strikes.shape[0] == 0:
+        return np.full(targets.shape[0], np.nan)
+    out = _interp_numpy(strikes, ivs, log_strikes, targets, window_pct)
+    missing = np.isnan(out)
+    if missing.any():
+        out[missing] = _interp_numpy(
+            strikes, ivs, log_strikes, targets[missing], FALLBACK_WINDOW_PCT
+        )
+    return out
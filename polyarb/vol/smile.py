@@ -0,0 +1,138 @@
+"""
+SVI smile fitting for a single option chain.
+
+Fits Gatheral's raw SVI parameterization of total implied variance,
+
+    w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2)),
+
+to one expiry's (strike, IV) quotes, with k = ln(K / reference). Unlike
+the piecewise-linear interpolation in ``iv_extract``, the fitted curve is
+smooth and cheap to evaluate at any number of strikes once fitted.
+"""
+
+import math
+from typing import NamedTuple, Union
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from polyarb.vol.iv_extract import ChainLike, ChainView
+
+# SVI has five parameters, so fewer quotes leave the fit underdetermined
+MIN_SVI_STRIKES = 5
+
+
+class SmileFitError(Exception):
+    """Raised when a smile cannot be fitted to an option chain."""
+    pass
+
+
+def svi_total_variance(
+    k: Union[float, np.ndarray],
+    a: float,
+    b: float,
+    rho: float,
+    m: float,
+    sigma: float
+) -> Union[float, np.ndarray]:
+    """
+    Raw SVI total implied variance at log-moneyness ``k``.
+
+    Parameters
+    ----------
+    k : float or np.ndarray
+        Log-moneyness ln(K / reference)
+    a, b, rho, m, sigma : float
+        Raw SVI parameters (level, slope, skew, shift, curvature)
+
+    Returns
+    -------
+    float or np.ndarray
+        Total implied variance w(k) = σ_IV(k)² · T
+    """
+    x = k - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+class SmileFit(NamedTuple):
+    """Fitted raw SVI parameters for one expiry."""
+    a: float
+    b: float
+    rho: float
+    m: float
+    sigma: float
+    reference: float  # Price that defines log-moneyness (spot or forward)
+    time_to_expiry: float  # Years
+
+    def total_variance(self, strike: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Fitted total implied variance at ``strike`` (floored at zero)."""
+        k = np.log(np.asarray(strike, dtype=np.float64) / self.reference)
+        w = svi_total_variance(k, self.a, self.b, self.rho, self.m, self.sigma)
+        w = np.maximum(w, 0.0)
+        return float(w) if w.ndim == 0 else w
+
+    def iv(self, strike: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Fitted implied volatility at ``strike`` in decimal form."""
+        return np.sqrt(self.total_variance(strike) / self.time_to_expiry)
+
+
+def fit_smile(chain: ChainLike, time_to_expiry: float, reference: float) -> SmileFit:
+    """
+    Fit a raw SVI smile to an option chain by least squares on total variance.
+
+    Fit once per chain and reuse the returned ``SmileFit`` for every strike
+    query; evaluating it is a closed-form expression.
+
+    Parameters
+    ----------
+    chain : pd.DataFrame, Chain or ChainView
+        Option chain with 'strike' and 'impliedVolatility' (NaN IVs ignored)
+    time_to_expiry : float
+        Time to expiry in years
+    reference : float
+        Price defining log-moneyness, typically spot or forward
+
+    Returns
+    -------
+    SmileFit
+        Fitted parameters with helpers to evaluate IV and total variance
+
+    Raises
+    ------
+    SmileFitError
+        If inputs are invalid, the chain has fewer than MIN_SVI_STRIKES usable
+        quotes, or the optimizer does not converge
+    IVExtractionError
+        If a DataFrame chain is missing required columns
+    """
+    if time_to_expiry <= 0:
+        raise SmileFitError(f"Time to expiry must be positive, got {time_to_expiry}")
+    if reference <= 0:
+        raise SmileFitError(f"Reference price must be positive, got {reference}")
+
+    view = chain if isinstance(chain, ChainView) else ChainView.from_frame(chain)
+    usable = (view.strikes > 0) & (view.ivs > 0) & np.isfinite(view.ivs)
+    if np.count_nonzero(usable) < MIN_SVI_STRIKES:
+        raise SmileFitError(
+            f"Need at least {MIN_SVI_STRIKES} strikes with positive IV to fit SVI, "
+            f"got {np.count_nonzero(usable)}"
+        )
+
+    k = view.log_strikes[usable] - math.log(reference)
+    w = view.ivs[usable] ** 2 * time_to_expiry
+
+    def residuals(params: np.ndarray) -> np.ndarray:
+        return svi_total_variance(k, *params) - w
+
+    k_span = max(float(k.max() - k.min()), 1e-4)
+    w_max = float(w.max())
+    initial = np.array([float(w.min()), 0.1, 0.0, float(k[np.argmin(w)]), 0.1 * k_span])
+    lower = [-w_max, 0.0, -0.999, float(k.min()) - k_span, 1e-6]
+    upper = [w_max, np.inf, 0.999, float(k.max()) + k_span, 10.0 * k_span]
+
+    result = least_squares(residuals, np.clip(initial, lower, upper), bounds=(lower, upper))
+    if not result.success:
+        raise SmileFitError(f"SVI fit did not converge: {result.message}")
+
+    a, b, rho, m, sigma = (float(p) for p in result.x)
+    return SmileFit(a, b, rho, m, sigma, float(reference), float(time_to_expiry))
@@ -5,22 +5,36 @@ This module handles interpolation of implied volatility across different
 time horizons using total variance interpolation.
 """
 
+import bisect
+import functools
+import math
 import warnings
-from datetime import date
-from typing import Optional
+from datetime import date, timedelta
+from typing import NamedTuple, Optional, Sequence
 
 import numpy as np
 
+from polyarb.util.jit import njit, prange
+
+# Day-count convention for year fractions: ACT/365 fixed
+DAYS_PER_YEAR = 365.0
+
 
 class TermStructureError(Exception):
     """Raised when term structure interpolation fails."""
     pass
 
 
+class Bracket(NamedTuple):
+    """Expiries bracketing a target date (``after`` is None on an exact match)."""
+    before: Optional[date]
+    after: Optional[date]
+
+
 def find_bracketing_expiries(
     target_date: date,
     available_expiries: list[date]
-) -> tuple[Optional[date], Optional[date]]:
+) -> Bracket:
     """
     Find expiries that bracket the target date.
 
@@ -33,8 +47,8 @@ def find_bracketing_expiries(
 
     Returns
     -------
-    tuple[Optional[date], Optional[date]]
-        (before_date, after_date) tuple:
+    Bracket
+        (before, after) named tuple:
         - Exact match: (target_date, None)
         - Normal case: (nearest_before, nearest_after)
         - Only before: (nearest_before, None)
@@ -48,21 +62,259 @@ def find_bracketing_expiries(
     >>> find_bracketing_expiries(date(2024, 5, 1), expiries)
     (date(2024, 3, 15), date(2024, 6, 21))
     """
-    if not available_expiries:
-        return (None, None)
+    # Single pass over unsorted input; sorted callers should use
+    # find_bracketing_expiries_sorted instead
+    nearest_before = None
+    nearest_after = None
+
+    for exp_date in available_expiries:
+        if exp_date == target_date:
+            return Bracket(target_date, None)
+        if exp_date < target_date:
+            if nearest_before is None or exp_date > nearest_before:
+                nearest_before = exp_date
+        elif nearest_after is None or exp_date < nearest_after:
+            nearest_after = exp_date
+
+    return Bracket(nearest_before, nearest_after)
+
+
+def find_bracketing_expiries_sorted(
+    target_date: date,
+    sorted_expiries: Sequence[date]
+) -> Bracket:
+    """
+    Find expiries that bracket the target date in an already-sorted sequence.
+
+    Same contract as ``find_bracketing_expiries`` but skips the sort, so
+    callers that hold a sorted expiry list get an O(log N) lookup.
+
+    Parameters
+    ----------
+    target_date : date
+        Target expiration date to interpolate to
+    sorted_expiries : Sequence[date]
+        Available option expiration dates, sorted ascending
+
+    Returns
+    -------
+    Bracket
+        (before, after) named tuple, as for ``find_bracketing_expiries``
+    """
+    i = bisect.bisect_left(sorted_expiries, target_date)
 
     # Check for exact match
-    if target_date in available_expiries:
-        return (target_date, None)
+    if i < len(sorted_expiries) and sorted_expiries[i] == target_date:
+        return Bracket(target_date, None)
+
+    nearest_before = sorted_expiries[i - 1] if i > 0 else None
+    nearest_after = sorted_expiries[i] if i < len(sorted_expiries) else None
+
+    return Bracket(nearest_before, nearest_after)
 
-    # Separate into before and after
-    before = [exp for exp in available_expiries if exp < target_date]
-    after = [exp for exp in available_expiries if exp > target_date]
 
-    nearest_before = max(before) if before else None
-    nearest_after = min(after) if after else None
+def _expiries_to_ordinals(expiries: Sequence[date]) -> np.ndarray:
+    """Distinct expiry dates as sorted int64 proleptic ordinals."""
+    return np.unique(np.fromiter(
+        (d.toordinal() for d in expiries), dtype=np.int64, count=len(expiries)
+    ))
+
+
+def find_bracketing_expiries_many(
+    target_dates: Sequence[date],
+    available_expiries: Sequence[date]
+) -> list[Bracket]:
+    """
+    Find the bracketing expiries for many target dates at once.
+
+    The expiries are converted to a sorted int64 ordinal array once and all
+    targets are located with a single ``np.searchsorted``, so date
+    comparisons run in C rather than as Python ``date`` comparisons.
+
+    Parameters
+    ----------
+    target_dates : Sequence[date]
+        Target expiration dates to interpolate to
+    available_expiries : Sequence[date]
+        Available option expiration dates, in any order
+
+    Returns
+    -------
+    list[Bracket]
+        One (before, after) ``Bracket`` per target, as for
+        ``find_bracketing_expiries``
+    """
+    ordinals = _expiries_to_ordinals(available_expiries)
+    n = len(ordinals)
+    targets = np.fromiter(
+        (d.toordinal() for d in target_dates), dtype=np.int64, count=len(target_dates)
+    )
+    idx = np.searchsorted(ordinals, targets, side='left')
+
+    result: list[Bracket] = []
+    for target_date, target, i in zip(target_dates, targets.tolist(), idx.tolist()):
+        if i < n and ordinals[i] == target:
+            result.append(Bracket(target_date, None))
+            continue
+        before = date.fromordinal(int(ordinals[i - 1])) if i > 0 else None
+        after = date.fromordinal(int(ordinals[i])) if i < n else None
+        result.append(Bracket(before, after))
+    return result
+
+
+class BracketingCache:
+    """
+    Sorted expiries that remember where the last bracket was found.
+
+    ``find`` has the same contract as ``find_bracketing_expiries``. When
+    targets arrive in increasing order (e.g. walking a calibration grid),
+    most lookups land in the previous or the next bracket and are answered
+    with two integer comparisons instead of a binary search.
+
+    Parameters
+    ----------
+    available_expiries : Sequence[date]
+        Available option expiration dates, in any order
+    """
+
+    __slots__ = ("_ordinals", "_last")
 
-    return (nearest_before, nearest_after)
+    def __init__(self, available_expiries: Sequence[date]):
+        self._ordinals: tuple[int, ...] = tuple(_expiries_to_ordinals(available_expiries).tolist())
+        self._last = 0  # Insertion index of the previous target
+
+    def _in_bracket(self, i: int, target: int) -> bool:
+        """Whether ``i`` is the bisect_left insertion index of ``target``."""
+        ordinals = self._ordinals
+        return (i == 0 or ordinals[i - 1] < target) and (
+            i == len(ordinals) or target <= ordinals[i]
+        )
+
+    def find(self, target_date: date) -> Bracket:
+        """Find expiries that bracket ``target_date``; see ``find_bracketing_expiries``."""
+        ordinals = self._ordinals
+        n = len(ordinals)
+        target = target_date.toordinal()
+
+        i = self._last
+        if not self._in_bracket(i, target):
+            if i < n and self._in_bracket(i + 1, target):
+                i += 1
+            else:
+                i = bisect.bisect_left(ordinals, target)
+            self._last = i
+
+        if i < n and ordinals[i] == target:
+            return Bracket(target_date, None)
+        before = date.fromordinal(ordinals[i - 1]) if i > 0 else None
+        after = date.fromordinal(ordinals[i]) if i < n else None
+        return Bracket(before, after)
+
+
+def _raise_invalid_variance_inputs(
+    iv1: float,
+    t1: float,
+    iv2: float,
+    t2: float,
+    target_t: float
+) -> None:
+    """Raise a TermStructureError describing why variance inputs are invalid."""
+    if t1 <= 0 or t2 <= 0 or target_t <= 0:
+        raise TermStructureError(
+            f"All times must be positive: t1={t1}, t2={t2}, target_t={target_t}"
+        )
+
+    if iv1 <= 0 or iv2 <= 0:
+        raise TermStructureError(
+            f"All IVs must be positive: iv1={iv1}, iv2={iv2}"
+        )
+
+    if t1 >= t2:
+        raise TermStructureError(
+            f"First expiry must be before second: t1={t1} >= t2={t2}"
+        )
+
+    if target_t < t1 or target_t > t2:
+        raise TermStructureError(
+            f"Target time {target_t} must be between t1={t1} and t2={t2}"
+        )
+
+    # Only NaN inputs get here
+    raise TermStructureError(
+        f"Invalid inputs: iv1={iv1}, t1={t1}, iv2={iv2}, t2={t2}, target_t={target_t}"
+    )
+
+
+def _total_variance_unchecked(
+    iv1: float,
+    t1: float,
+    iv2: float,
+    t2: float,
+    target_t: float
+) -> float:
+    """Linear total-variance interpolation on inputs that are already validated."""
+    # Compute total variances
+    w1 = iv1 ** 2 * t1
+    w2 = iv2 ** 2 * t2
+
+    # Linear interpolation of variance
+    return w1 + (w2 - w1) * (target_t - t1) / (t2 - t1)
+
+
+def interpolate_total_variance(
+    iv1: float,
+    t1: float,
+    iv2: float,
+    t2: float,
+    target_t: float
+) -> float:
+    """
+    Interpolate total variance w(T) = σ²T linearly between two expiries.
+
+    Use this instead of ``interpolate_variance`` when the caller needs σ²T
+    itself (e.g. to feed a pricer or another interpolation step), which
+    saves the square root and the squaring that would undo it.
+
+    Parameters
+    ----------
+    iv1 : float
+        Implied volatility at time t1 (in decimal, e.g., 0.25)
+    t1 : float
+        Time to first expiry (in years)
+    iv2 : float
+        Implied volatility at time t2 (in decimal, e.g., 0.30)
+    t2 : float
+        Time to second expiry (in years)
+    target_t : float
+        Target time to interpolate to (in years)
+
+    Returns
+    -------
+    float
+        Interpolated total variance at target_t
+
+    Raises
+    ------
+    TermStructureError
+        If times are non-positive or if interpolation fails
+
+    Examples
+    --------
+    >>> interpolate_total_variance(0.20, 0.25, 0.30, 0.50, 0.40)
+    0.031...
+    """
+    # Validate inputs (one check on the fast path; details only on failure)
+    if not (0 < t1 < t2 and t1 <= target_t <= t2 and iv1 > 0 and iv2 > 0):
+        _raise_invalid_variance_inputs(iv1, t1, iv2, t2, target_t)
+
+    w_target = _total_variance_unchecked(iv1, t1, iv2, t2, target_t)
+
+    if w_target <= 0:
+        raise TermStructureError(
+            f"Interpolated variance is non-positive: {w_target}"
+        )
+
+    return float(w_target)
 
 
 def interpolate_variance(
@@ -109,48 +361,295 @@ def interpolate_variance(
         w_target = w1 + (w2 - w1) * (t_target - t1) / (t2 - t1)
         σ_target = sqrt(w_target / t_target)
 
+    At t_target == t1 or t2 the quoted IV is returned exactly.
+    See ``interpolate_total_variance`` for the w_target step alone.
+
     Examples
     --------
     >>> interpolate_variance(0.20, 0.25, 0.30, 0.50, 0.40)
-    0.262...
+    0.278...
     """
-    # Validate inputs
-    if t1 <= 0 or t2 <= 0 or target_t <= 0:
-        raise TermStructureError(
-            f"All times must be positive: t1={t1}, t2={t2}, target_t={target_t}"
-        )
+    if not (0 < t1 < t2 and t1 <= target_t <= t2 and iv1 > 0 and iv2 > 0):
+        _raise_invalid_variance_inputs(iv1, t1, iv2, t2, target_t)
 
-    if iv1 <= 0 or iv2 <= 0:
-        raise TermStructureError(
-            f"All IVs must be positive: iv1={iv1}, iv2={iv2}"
+    # Endpoints return the quoted IV exactly, without a square/sqrt round trip
+    if target_t == t1:
+        return float(iv1)
+    if target_t == t2:
+        return float(iv2)
+
+    w_target = _total_variance_unchecked(iv1, t1, iv2, t2, target_t)
+
+    return math.sqrt(w_target / target_t)
+
+
+def _iv_from_total_variances(
+    w1: np.ndarray | float,
+    t1: np.ndarray | float,
+    w2: np.ndarray | float,
+    t2: np.ndarray | float,
+    target_ts: np.ndarray | float
+) -> np.ndarray:
+    """IV at ``target_ts`` from linear interpolation of validated total variances."""
+    w_target = w1 + (w2 - w1) * (target_ts - t1) / (t2 - t1)
+    return np.sqrt(w_target / target_ts)
+
+
+def interpolate_variance_vec(
+    iv1: np.ndarray | float,
+    t1: np.ndarray | float,
+    iv2: np.ndarray | float,
+    t2: np.ndarray | float,
+    target_ts: np.ndarray | float
+) -> np.ndarray:
+    """
+    Vectorized total variance interpolation.
+
+    Same formula as ``interpolate_variance`` evaluated over arrays. All
+    arguments broadcast against each other, so one bracketing pair can be
+    evaluated at many target times or each target can carry its own pair.
+
+    Parameters
+    ----------
+    iv1 : np.ndarray or float
+        Implied volatility at time t1 (in decimal, e.g., 0.25)
+    t1 : np.ndarray or float
+        Time to first expiry (in years)
+    iv2 : np.ndarray or float
+        Implied volatility at time t2 (in decimal, e.g., 0.30)
+    t2 : np.ndarray or float
+        Time to second expiry (in years)
+    target_ts : np.ndarray or float
+        Target times to interpolate to (in years)
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated implied volatility per target time
+
+    Raises
+    ------
+    TermStructureError
+        If any input violates the conditions checked by ``interpolate_variance``
+
+    Examples
+    --------
+    >>> interpolate_variance_vec(0.20, 0.25, 0.30, 0.50, np.array([0.25, 0.40]))
+    array([0.2       , 0.278...])
+    """
+    iv1, t1, iv2, t2, target_ts = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (iv1, t1, iv2, t2, target_ts))
+    )
+
+    # Validate inputs with a single combined mask
+    ok = (0 < t1) & (t1 < t2) & (t1 <= target_ts) & (target_ts <= t2) & (iv1 > 0) & (iv2 > 0)
+    if not ok.all():
+        k = int(np.argmin(ok))
+        _raise_invalid_variance_inputs(
+            float(iv1.flat[k]), float(t1.flat[k]), float(iv2.flat[k]),
+            float(t2.flat[k]), float(target_ts.flat[k])
         )
 
-    if t1 >= t2:
+    iv = _iv_from_total_variances(iv1 * iv1 * t1, t1, iv2 * iv2 * t2, t2, target_ts)
+
+    # Endpoints return the quoted IVs exactly, as in interpolate_variance
+    iv = np.where(target_ts == t1, iv1, iv)
+    return np.where(target_ts == t2, iv2, iv)
+
+
+@njit(cache=True)
+def _interp_iv_row(target_ts, ts, ivs, out):
+    """Fill ``out`` with ``interpolate_iv_times`` values for one term structure."""
+    n = ts.shape[0]
+    for i in range(target_ts.shape[0]):
+        tt = target_ts[i]
+        j = np.searchsorted(ts, tt)
+        if j < n and ts[j] == tt:
+            out[i] = ivs[j]
+        elif j == 0:
+            out[i] = ivs[0]
+        elif j == n:
+            out[i] = ivs[n - 1]
+        else:
+            t1 = ts[j - 1]
+            t2 = ts[j]
+            w1 = ivs[j - 1] * ivs[j - 1] * t1
+            w2 = ivs[j] * ivs[j] * t2
+            w_target = w1 + (w2 - w1) * (tt - t1) / (t2 - t1)
+            out[i] = math.sqrt(w_target / tt)
+
+
+@njit(cache=True)
+def _interp_iv_kernel(target_ts, ts, ivs):
+    """Loop form of ``interpolate_iv_times`` on validated float64 arrays."""
+    out = np.empty(target_ts.shape[0])
+    _interp_iv_row(target_ts, ts, ivs, out)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _interp_iv_surface_kernel(target_ts, ts_per_strike, ivs_per_strike):
+    """Loop form of ``interpolate_iv_surface``, parallel over strikes."""
+    n_strikes = ts_per_strike.shape[0]
+    out = np.empty((n_strikes, target_ts.shape[0]))
+    for s in prange(n_strikes):
+        _interp_iv_row(target_ts, ts_per_strike[s], ivs_per_strike[s], out[s])
+    return out
+
+
+def _validate_iv_times(target_ts: np.ndarray, ts: np.ndarray, ivs: np.ndarray) -> None:
+    """Raise TermStructureError unless the inputs suit the interpolation kernels."""
+    if ts.shape != ivs.shape or ts.size == 0 or ts.shape[-1] == 0:
         raise TermStructureError(
-            f"First expiry must be before second: t1={t1} >= t2={t2}"
+            f"Expiry times and IVs must be non-empty arrays of equal shape, "
+            f"got shapes {ts.shape} and {ivs.shape}"
         )
+    if not (np.all(ts > 0) and np.all(np.diff(ts, axis=-1) > 0)):
+        raise TermStructureError("Expiry times must be positive and strictly increasing")
+    if not np.all(ivs > 0):
+        raise TermStructureError("All IVs must be positive")
+    if not np.all(target_ts > 0):
+        raise TermStructureError("All target times must be positive")
 
-    if target_t < t1 or target_t > t2:
+
+def interpolate_iv_times(
+    target_ts: np.ndarray | Sequence[float],
+    ts: np.ndarray | Sequence[float],
+    ivs: np.ndarray | Sequence[float]
+) -> np.ndarray:
+    """
+    Interpolate IV at many target times in total variance, like ``np.interp``.
+
+    Between two expiries the total variance σ²T is interpolated linearly (as
+    in ``interpolate_variance``); outside the expiry range the nearest IV is
+    used, matching ``np.interp``'s clamping. No warnings are emitted, so this
+    suits tight loops such as surface calibration.
+
+    Parameters
+    ----------
+    target_ts : array-like
+        Target times to interpolate to (in years)
+    ts : array-like
+        Expiry times (in years), strictly increasing and positive
+    ivs : array-like
+        Implied volatilities aligned with ``ts`` (in decimal)
+
+    Returns
+    -------
+    np.ndarray
+        Implied volatility per target time
+
+    Raises
+    ------
+    TermStructureError
+        If the inputs are empty, misaligned, not increasing, or not positive
+    """
+    target_ts = np.ascontiguousarray(target_ts, dtype=np.float64)
+    ts = np.ascontiguousarray(ts, dtype=np.float64)
+    ivs = np.ascontiguousarray(ivs, dtype=np.float64)
+
+    if ts.ndim != 1:
+        raise TermStructureError(f"Expiry times must be a 1-D array, got shape {ts.shape}")
+    _validate_iv_times(target_ts, ts, ivs)
+
+    return _interp_iv_kernel(target_ts.ravel(), ts, ivs).reshape(target_ts.shape)
+
+
+def interpolate_iv_surface(
+    target_ts: np.ndarray | Sequence[float],
+    ts_per_strike: np.ndarray,
+    ivs_per_strike: np.ndarray
+) -> np.ndarray:
+    """
+    Interpolate a per-strike term structure onto a (strike × target time) grid.
+
+    Row ``s`` of the result is ``interpolate_iv_times(target_ts,
+    ts_per_strike[s], ivs_per_strike[s])``. Strikes are independent, so with
+    Numba installed the rows are filled in parallel.
+
+    Parameters
+    ----------
+    target_ts : array-like
+        Target times to interpolate to (in years), shared by every strike
+    ts_per_strike : np.ndarray
+        2-D array (n_strikes, n_expiries) of expiry times in years, each row
+        strictly increasing and positive
+    ivs_per_strike : np.ndarray
+        2-D array of implied volatilities aligned with ``ts_per_strike``
+
+    Returns
+    -------
+    np.ndarray
+        2-D array (n_strikes, n_targets) of implied volatilities
+
+    Raises
+    ------
+    TermStructureError
+        If the inputs are empty, misaligned, not increasing, or not positive
+    """
+    target_ts = np.ascontiguousarray(target_ts, dtype=np.float64)
+    ts_per_strike = np.ascontiguousarray(ts_per_strike, dtype=np.float64)
+    ivs_per_strike = np.ascontiguousarray(ivs_per_strike, dtype=np.float64)
+
+    if target_ts.ndim != 1 or ts_per_strike.ndim != 2:
         raise TermStructureError(
-            f"Target time {target_t} must be between t1={t1} and t2={t2}"
+            f"Expected 1-D target times and 2-D expiry times, "
+            f"got shapes {target_ts.shape} and {ts_per_strike.shape}"
         )
+    _validate_iv_times(target_ts, ts_per_strike, ivs_per_strike)
 
-    # Compute total variances
-    w1 = iv1 ** 2 * t1
-    w2 = iv2 ** 2 * t2
+    return _interp_iv_surface_kernel(target_ts, ts_per_strike, ivs_per_strike)
 
-    # Linear interpolation of variance
-    w_target = w1 + (w2 - w1) * (target_t - t1) / (t2 - t1)
 
-    # Convert back to volatility
-    if w_target <= 0:
+def _prepare_term_structure(
+    expiry_iv_pairs: list[tuple[date, float]],
+    reference_date: date
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse (expiry, iv) pairs once into day offsets and IVs sorted by expiry.
+
+    Parameters
+    ----------
+    expiry_iv_pairs : list[tuple[date, float]]
+        List of (expiry_date, implied_vol) tuples
+    reference_date : date
+        Date the day offsets are measured from
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        (days, ivs) where ``days`` is int64 days from ``reference_date``
+        sorted ascending and ``ivs`` is the aligned float64 IVs. A repeated
+        expiry keeps its last IV.
+
+    Raises
+    ------
+    TermStructureError
+        If no pairs are given or any IV is not positive
+    """
+    if not expiry_iv_pairs:
+        raise TermStructureError("No expiry-IV pairs provided")
+
+    n = len(expiry_iv_pairs)
+    ordinals = np.fromiter((p[0].toordinal() for p in expiry_iv_pairs), dtype=np.int64, count=n)
+    ivs = np.fromiter((p[1] for p in expiry_iv_pairs), dtype=np.float64, count=n)
+
+    bad = ivs <= 0
+    if bad.any():
+        exp_date, iv = expiry_iv_pairs[int(np.argmax(bad))]
         raise TermStructureError(
-            f"Interpolated variance is non-positive: {w_target}"
+            f"All IVs must be positive, got {iv} for expiry {exp_date}"
         )
 
-    target_iv = np.sqrt(w_target / target_t)
+    # Stable sort keeps repeated expiries in input order; keep the last of each
+    order = np.argsort(ordinals, kind='stable')
+    ordinals = ordinals[order]
+    ivs = ivs[order]
+    last = np.append(ordinals[1:] != ordinals[:-1], True)
 
-    return float(target_iv)
+    days = ordinals[last] - reference_date.toordinal()
+    ivs = ivs[last]
+    return days, ivs
 
 
 def interpolate_iv_term_structure(
@@ -200,43 +699,34 @@ def interpolate_iv_term_structure(
     >>> interpolate_iv_term_structure(date(2024, 5, 1), pairs, date(2024, 1, 1))
     0.262...
     """
-    if not expiry_iv_pairs:
-        raise TermStructureError("No expiry-IV pairs provided")
-
     if reference_date is None:
         from datetime import date as date_class
         reference_date = date_class.today()
 
-    # Validate all IVs are positive
-    for exp_date, iv in expiry_iv_pairs:
-        if iv <= 0:
-            raise TermStructureError(
-                f"All IVs must be positive, got {iv} for expiry {exp_date}"
-            )
+    days, ivs = _prepare_term_structure(expiry_iv_pairs, reference_date)
+    n = len(days)
 
-    # Extract expiries
-    expiries = [exp_date for exp_date, _ in expiry_iv_pairs]
-    iv_map = dict(expiry_iv_pairs)
-
-    # Find bracketing expiries
-    before, after = find_bracketing_expiries(target_date, expiries)
+    target_days = (target_date - reference_date).days
+    i = int(np.searchsorted(days, target_days))
 
     # Case 1: Exact match
-    if before == target_date and after is None:
-        return iv_map[before]
+    if i < n and days[i] == target_days:
+        return float(ivs[i])
 
     # Case 2: Only one expiry or target outside range
-    if before is None and after is not None:
+    if i == 0:
         # Target before all expiries
+        after = reference_date + timedelta(days=int(days[0]))
         warnings.warn(
             f"Target date {target_date} is before all available expiries. "
             f"Using IV from nearest expiry {after}."
         )
-        return iv_map[after]
+        return float(ivs[0])
 
-    if after is None and before is not None:
+    if i == n:
         # Target after all expiries or only one expiry exists
-        if len(expiries) == 1:
+        before = reference_date + timedelta(days=int(days[-1]))
+        if n == 1:
             warnings.warn(
                 f"Only one expiry available ({before}). "
                 f"Using its IV for target date {target_date}."
@@ -246,41 +736,210 @@ def interpolate_iv_term_structure(
                 f"Target date {target_date} is after all available expiries. "
                 f"Using IV from farthest expiry {before}."
             )
-        return iv_map[before]
-
-    if before is None and after is None:
-        raise TermStructureError("No expiries available")
+        return float(ivs[-1])
 
     # Case 3: Normal interpolation between two expiries
-    iv1 = iv_map[before]
-    iv2 = iv_map[after]
-
-    # Calculate times in years (assuming 365 days per year)
-    t1 = (before - reference_date).days / 365.0
-    t2 = (after - reference_date).days / 365.0
-    target_t = (target_date - reference_date).days / 365.0
-
-    # Validate times are positive
-    if target_t <= 0:
+    if target_days <= 0:
         raise TermStructureError(
             f"Target date {target_date} is not after reference date {reference_date}"
         )
 
-    if t1 <= 0:
+    if days[i - 1] <= 0:
         # This can happen if 'before' expiry is on or before reference date
         # Use the 'after' expiry instead
+        before = reference_date + timedelta(days=int(days[i - 1]))
+        after = reference_date + timedelta(days=int(days[i]))
         warnings.warn(
             f"Bracketing expiry {before} is not after reference date {reference_date}. "
             f"Using nearest future expiry {after}."
         )
-        return iv_map[after]
+        return float(ivs[i])
+
+    # Calculate times in years (DAYS_PER_YEAR days per year)
+    t1 = int(days[i - 1]) / DAYS_PER_YEAR
+    t2 = int(days[i]) / DAYS_PER_YEAR
+    target_t = target_days / DAYS_PER_YEAR
 
     # Perform variance interpolation
-    target_iv = interpolate_variance(iv1, t1, iv2, t2, target_t)
+    target_iv = interpolate_variance(float(ivs[i - 1]), t1, float(ivs[i]), t2, target_t)
 
     return target_iv
 
 
+def interpolate_iv_term_structure_many(
+    target_dates: Sequence[date],
+    expiry_iv_pairs: list[tuple[date, float]],
+    reference_date: Optional[date] = None
+) -> np.ndarray:
+    """
+    Interpolate IV to many target dates over one set of expiries.
+
+    Vectorized counterpart of ``interpolate_iv_term_structure``: the expiry
+    list is parsed once and all targets are bracketed with a single
+    ``np.searchsorted``. Edge cases are handled the same way, with one
+    warning per case rather than one per target date.
+
+    Parameters
+    ----------
+    target_dates : Sequence[date]
+        Target expiration dates
+    expiry_iv_pairs : list[tuple[date, float]]
+        List of (expiry_date, implied_vol) tuples
+        IVs must be in decimal form (0.25 for 25%)
+    reference_date : date, optional
+        Reference date for time calculations (default: today)
+
+    Returns
+    -------
+    np.ndarray
+        Interpolated implied volatility per target date
+
+    Raises
+    ------
+    TermStructureError
+        If insufficient data or a target that needs interpolation is not
+        after the reference date
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    return TermStructure(expiry_iv_pairs, reference_date).iv_at_many(target_dates)
+
+
+class TermStructure:
+    """
+    Parsed IV term structure for repeated interpolation.
+
+    Parses the (expiry, iv) pairs once and precomputes each expiry's total
+    variance w = σ²T, so every later lookup is a search plus one linear
+    interpolation. Results and edge-case handling match
+    ``interpolate_iv_term_structure_many``.
+
+    Parameters
+    ----------
+    expiry_iv_pairs : list[tuple[date, float]]
+        List of (expiry_date, implied_vol) tuples
+        IVs must be in decimal form (0.25 for 25%)
+    reference_date : date, optional
+        Reference date for time calculations (default: today)
+
+    Raises
+    ------
+    TermStructureError
+        If no pairs are given or any IV is not positive
+    """
+
+    __slots__ = ("reference_date", "days", "ivs", "total_variances")
+
+    def __init__(
+        self,
+        expiry_iv_pairs: list[tuple[date, float]],
+        reference_date: Optional[date] = None
+    ):
+        if reference_date is None:
+            reference_date = date.today()
+        self.reference_date = reference_date
+        self.days, self.ivs = _prepare_term_structure(expiry_iv_pairs, reference_date)
+        self.total_variances = self.ivs * self.ivs * (self.days / DAYS_PER_YEAR)
+
+    def iv_at(self, target_date: date) -> float:
+        """Interpolated IV at ``target_date``; see ``iv_at_many``."""
+        return float(self.iv_at_many([target_date])[0])
+
+    def iv_at_many(self, target_dates: Sequence[date]) -> np.ndarray:
+        """
+        Interpolate IV to many target dates.
+
+        Parameters
+        ----------
+        target_dates : Sequence[date]
+            Target expiration dates
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated implied volatility per target date
+
+        Raises
+        ------
+        TermStructureError
+            If a target that needs interpolation is not after the reference date
+        """
+        reference_date = self.reference_date
+        days, ivs, w = self.days, self.ivs, self.total_variances
+        n = len(days)
+
+        target_days = np.fromiter(
+            (d.toordinal() for d in target_dates),
+            dtype=np.int64,
+            count=len(target_dates),
+        ) - reference_date.toordinal()
+        idx = np.searchsorted(days, target_days)
+        result = np.empty(len(target_days))
+
+        exact = (idx < n) & (days[np.minimum(idx, n - 1)] == target_days)
+        below = (idx == 0) & ~exact
+        above = idx == n
+        inside = ~(exact | below | above)
+
+        # Case 1: Exact matches
+        result[exact] = ivs[idx[exact]]
+
+        # Case 2: Only one expiry or targets outside range
+        if below.any():
+            after = reference_date + timedelta(days=int(days[0]))
+            warnings.warn(
+                f"{int(below.sum())} target date(s) are before all available expiries. "
+                f"Using IV from nearest expiry {after}."
+            )
+            result[below] = ivs[0]
+
+        if above.any():
+            before = reference_date + timedelta(days=int(days[-1]))
+            if n == 1:
+                warnings.warn(
+                    f"Only one expiry available ({before}). "
+                    f"Using its IV for {int(above.sum())} target date(s)."
+                )
+            else:
+                warnings.warn(
+                    f"{int(above.sum())} target date(s) are after all available expiries. "
+                    f"Using IV from farthest expiry {before}."
+                )
+            result[above] = ivs[-1]
+
+        # Case 3: Normal interpolation between two expiries
+        if inside.any():
+            j = idx[inside]
+            t_days = target_days[inside]
+
+            if np.any(t_days <= 0):
+                bad = reference_date + timedelta(days=int(t_days.min()))
+                raise TermStructureError(
+                    f"Target date {bad} is not after reference date {reference_date}"
+                )
+
+            d1 = days[j - 1]
+            stale = d1 <= 0
+            if stale.any():
+                warnings.warn(
+                    f"{int(stale.sum())} target date(s) are bracketed by an expiry not after "
+                    f"reference date {reference_date}. Using nearest future expiry instead."
+                )
+
+            interp = ivs[j]
+            live = ~stale
+            # Linear in total variance between the bracketing expiries
+            jl = j[live]
+            t1 = d1[live] / DAYS_PER_YEAR
+            t2 = days[jl] / DAYS_PER_YEAR
+            target_t = t_days[live] / DAYS_PER_YEAR
+            interp[live] = _iv_from_total_variances(w[jl - 1], t1, w[jl], t2, target_t)
+            result[inside] = interp
+
+        return result
+
+
 def compute_time_to_expiry(
     expiry_date: date,
     reference_date: Optional[date] = None
@@ -315,11 +974,78 @@ def compute_time_to_expiry(
         from datetime import date as date_class
         reference_date = date_class.today()
 
-    days_to_expiry = (expiry_date - reference_date).days
+    return _time_to_expiry(expiry_date, reference_date)
+
+
+def compute_time_to_expiry_batch(
+    expiry_dates: Sequence[date],
+    reference_date: Optional[date] = None
+) -> np.ndarray:
+    """
+    Compute time to expiry in years for many expiries at once.
+
+    Vectorized counterpart of ``compute_time_to_expiry``: the expiries are
+    converted to int64 ordinals once and differenced against the reference
+    in a single array operation.
+
+    Parameters
+    ----------
+    expiry_dates : Sequence[date]
+        Expiration dates
+    reference_date : date, optional
+        Reference date (default: today)
+
+    Returns
+    -------
+    np.ndarray
+        float64 times to expiry in years (365 days = 1 year), aligned with
+        ``expiry_dates``
+
+    Raises
+    ------
+    TermStructureError
+        If any expiry is not after the reference date
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    days = np.fromiter(
+        (d.toordinal() for d in expiry_dates), dtype=np.int64, count=len(expiry_dates)
+    ) - reference_date.toordinal()
+
+    if np.any(days <= 0):
+        bad = expiry_dates[int(np.argmax(days <= 0))]
+        raise TermStructureError(
+            f"Expiry date {bad} is not after reference date {reference_date}"
+        )
+
+    return days / DAYS_PER_YEAR
+
+
+@functools.lru_cache(maxsize=256)
+def _time_to_expiry(expiry_date: date, reference_date: date) -> float:
+    """Cached core of ``compute_time_to_expiry`` with an explicit reference date."""
+    days_to_expiry = expiry_date.toordinal() - reference_date.toordinal()
 
     if days_to_expiry <= 0:
         raise TermStructureError(
             f"Expiry date {expiry_date} is not after reference date {reference_date}"
         )
 
-    return days_to_expiry / 365.0
+    return days_to_expiry / DAYS_PER_YEAR
+
+
+def warm_up() -> None:
+    """
+    Compile the term-structure kernels now rather than on first use.
+
+    With Numba installed the first call to ``interpolate_iv_times`` or
+    ``interpolate_iv_surface`` pays the JIT compile (or on-disk cache load).
+    Long-running services can call this at startup to keep that off the
+    request path; it is a cheap no-op without Numba.
+    """
+    ts = np.array([0.25, 0.5])
+    ivs = np.array([0.2, 0.3])
+    targets = np.array([0.1, 0.4, 1.0])
+    _interp_iv_kernel(targets, ts, ivs)
+    _interp_iv_surface_kernel(targets, ts.reshape(1, -1), ivs.reshape(1, -1))
@@ -0,0 +1,105 @@
+"""Shared pytest fixtures."""
+
+import functools
+import importlib
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from polyarb.models import PricingResult
+
+# (module, attribute, key in the mock dict) for everything the analyze
+# command reaches for after fetching the market. Modules are imported on
+# first use so collecting tests does not pay for pandas/scipy/yfinance.
+_ORCHESTRATION_TARGETS = [
+    ('polyarb.clients.polymarket_clob', 'ClobClient', 'clob'),
+    ('polyarb.clients.yfinance_md', 'YFMarketData', 'yf'),
+    ('polyarb.pricing.touch_barrier', 'touch_price_with_sensitivity', 'touch_pricing'),
+    ('polyarb.pricing.digital_bs', 'digital_price_with_sensitivity', 'digital_pricing'),
+    ('polyarb.vol.iv_extract', 'extract_strike_region_iv', 'iv_extract'),
+    ('polyarb.vol.term_structure', 'interpolate_iv_term_structure', 'iv_interp'),
+    ('polyarb.clients.fred', 'FredClient', 'fred'),
+]
+
+# Mock pricing result returned by both pricers
+_MOCK_PRICING_RESULT = PricingResult(
+    probability=0.65,
+    pv=0.63,
+    d2=None,
+    drift=-0.02,
+    sensitivity={
+        'sigma-0.03': (0.60, 0.58),
+        'sigma-0.02': (0.62, 0.60),
+        'sigma+0.02': (0.68, 0.66),
+        'sigma+0.03': (0.70, 0.68),
+    }
+)
+
+
+@functools.cache
+def _chain_dfs():
+    """Mock (calls, puts) option chain data, built once; consumers must not mutate."""
+    import pandas as pd
+
+    calls_df = pd.DataFrame({
+        'strike': [90000, 95000, 100000, 105000, 110000],
+        'impliedVolatility': [0.55, 0.50, 0.45, 0.42, 0.40]
+    })
+    puts_df = pd.DataFrame({
+        'strike': [90000, 95000, 100000, 105000, 110000],
+        'impliedVolatility': [0.40, 0.42, 0.45, 0.50, 0.55]
+    })
+    return calls_df, puts_df
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_cli():
+    """Import the CLI and resolve its command tree once, before any test runs."""
+    from polyarb.cli import main
+
+    main.make_context("polyarb", ["analyze", "--help"], resilient_parsing=True)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Click test runner shared across the session (stderr captured separately)."""
+    return CliRunner()
+
+
+def _configure_orchestration_mocks(mocks: dict[str, Mock]) -> None:
+    """Apply the canned return values used by the CLI happy-path tests."""
+    mocks['clob'].return_value.get_yes_price.return_value = 0.65
+    mocks['yf'].return_value.get_spot.return_value = 95000.0
+    mocks['yf'].return_value.get_option_expiries.return_value = [
+        date.today() + timedelta(days=7),
+        date.today() + timedelta(days=30),
+        date.today() + timedelta(days=60),
+    ]
+    mocks['yf'].return_value.get_chain.return_value = _chain_dfs()
+    mocks['iv_extract'].return_value = 0.45
+    mocks['iv_interp'].return_value = 0.45
+    mocks['touch_pricing'].return_value = _MOCK_PRICING_RESULT
+    mocks['digital_pricing'].return_value = _MOCK_PRICING_RESULT
+    mocks['fred'].return_value.get_latest_observation.return_value = (4.0, date.today())
+
+
+@pytest.fixture(scope="session")
+def orchestration_mocks():
+    """Mocks for the analyze pipeline, created once per session."""
+    return {key: Mock() for _, _, key in _ORCHESTRATION_TARGETS}
+
+
+@pytest.fixture
+def mock_orch(orchestration_mocks, monkeypatch):
+    """Install the orchestration mocks for one test, with fresh call state."""
+    for mock in orchestration_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    _configure_orchestration_mocks(orchestration_mocks)
+
+    for module_name, attr, key in _ORCHESTRATION_TARGETS:
+        module = importlib.import_module(module_name)
+        monkeypatch.setattr(module, attr, orchestration_mocks[key])
+
+    return orchestration_mocks
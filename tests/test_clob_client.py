@@ -1,82 +1,115 @@
 """Tests for Polymarket CLOB API client."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from datetime import datetime
+from types import SimpleNamespace
 import httpx
 
 from polyarb.clients.polymarket_clob import ClobClient, ClobClientError, NoOrderbookError
 from polyarb.models import TokenPrice, OrderBook, OrderBookLevel, Side
 
+pytestmark = pytest.mark.xdist_group("clob")
+
+
+# 404 errors shared by the error-path tests
+_NOT_FOUND_ERR = httpx.HTTPStatusError(
+    "Not Found",
+    request=SimpleNamespace(),
+    response=SimpleNamespace(status_code=404, text="Not Found"),
+)
+_NO_ORDERBOOK_ERR = httpx.HTTPStatusError(
+    "Not Found",
+    request=SimpleNamespace(),
+    response=SimpleNamespace(
+        status_code=404,
+        text='{"error":"No orderbook exists for the requested token id"}',
+    ),
+)
+
+
+class _FakeResponse:
+    """Plain stand-in for httpx.Response carrying a JSON payload."""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class _CM:
+    """Minimal context manager yielding a fixed object."""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __enter__(self):
+        return self._obj
+
+    def __exit__(self, *exc_info):
+        return False
 
-@pytest.fixture
-def mock_httpx_client():
-    """Create a mock httpx.Client."""
-    with patch("httpx.Client") as mock_client_class:
-        mock_client = Mock()
-        mock_client_class.return_value.__enter__.return_value = mock_client
-        yield mock_client
 
+@pytest.fixture(scope="session")
+def _httpx_stub():
+    """One stub client (with its context manager) shared by the session."""
+    stub = SimpleNamespace(get=Mock())
+    stub_cm = _CM(stub)
+    return stub, lambda *args, **kwargs: stub_cm
 
-def test_get_price_success(mock_httpx_client):
-    """Test successful price fetch."""
+
+@pytest.fixture
+def mock_httpx_client(_httpx_stub, monkeypatch):
+    """Replace httpx.Client with the shared stub, with fresh ``get`` state."""
+    stub, client_factory = _httpx_stub
+    stub.get.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(httpx, "Client", client_factory)
+    return stub
+
+
+@pytest.mark.parametrize(
+    "field, raw, expected, side",
+    [
+        ("price", "0.55", 0.55, Side.BUY),
+        ("mid", "0.45", 0.45, Side.SELL),
+        ("best_price", "0.67", 0.67, Side.BUY),
+    ],
+)
+def test_get_price_field_variants(mock_httpx_client, field, raw, expected, side):
+    """Test successful price fetch with each accepted price field name."""
     # Mock response
-    mock_response = Mock()
-    mock_response.json.return_value = {"price": "0.55"}
-    mock_response.raise_for_status.return_value = None
+    mock_response = _FakeResponse({field: raw})
     mock_httpx_client.get.return_value = mock_response
 
     # Create client and fetch price
     client = ClobClient()
-    result = client.get_price("token123", Side.BUY)
+    result = client.get_price("token123", side)
 
     # Verify
     assert isinstance(result, TokenPrice)
     assert result.token_id == "token123"
-    assert result.side == Side.BUY
-    assert result.price == 0.55
+    assert result.side == side
+    assert result.price == expected
 
     # Verify API call
     mock_httpx_client.get.assert_called_once()
     call_args = mock_httpx_client.get.call_args
     assert "/price" in call_args[0][0]
     assert call_args[1]["params"]["token_id"] == "token123"
-    assert call_args[1]["params"]["side"] == "BUY"
-
-
-def test_get_price_alternate_field_names(mock_httpx_client):
-    """Test price parsing with alternate field names."""
-    # Test with "mid" field
-    mock_response = Mock()
-    mock_response.json.return_value = {"mid": "0.45"}
-    mock_response.raise_for_status.return_value = None
-    mock_httpx_client.get.return_value = mock_response
-
-    client = ClobClient()
-    result = client.get_price("token456", Side.SELL)
-
-    assert result.price == 0.45
-    assert result.side == Side.SELL
-
-
-def test_get_price_best_price_field(mock_httpx_client):
-    """Test price parsing with best_price field."""
-    mock_response = Mock()
-    mock_response.json.return_value = {"best_price": "0.67"}
-    mock_response.raise_for_status.return_value = None
-    mock_httpx_client.get.return_value = mock_response
-
-    client = ClobClient()
-    result = client.get_price("token789", Side.BUY)
-
-    assert result.price == 0.67
+    assert call_args[1]["params"]["side"] == side.value
 
 
 def test_get_price_invalid_range(mock_httpx_client):
     """Test price validation for out-of-range values."""
-    mock_response = Mock()
-    mock_response.json.return_value = {"price": "1.5"}  # Invalid: > 1
-    mock_response.raise_for_status.return_value = None
+    mock_response = _FakeResponse({"price": "1.5"})  # Invalid: > 1
     mock_httpx_client.get.return_value = mock_response
 
     client = ClobClient()
@@ -86,9 +119,7 @@ def test_get_price_invalid_range(mock_httpx_client):
 
 def test_get_price_missing_price(mock_httpx_client):
     """Test error when price field is missing."""
-    mock_response = Mock()
-    mock_response.json.return_value = {}  # No price field
-    mock_response.raise_for_status.return_value = None
+    mock_response = _FakeResponse({})  # No price field
     mock_httpx_client.get.return_value = mock_response
 
     client = ClobClient()
@@ -98,12 +129,7 @@ def test_get_price_missing_price(mock_httpx_client):
 
 def test_get_price_404_error(mock_httpx_client):
     """Test handling of 404 error (token not found)."""
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.text = "Not Found"
-    mock_httpx_client.get.side_effect = httpx.HTTPStatusError(
-        "Not Found", request=Mock(), response=mock_response
-    )
+    mock_httpx_client.get.side_effect = _NOT_FOUND_ERR
 
     client = ClobClient()
     with pytest.raises(ClobClientError, match="not found"):
@@ -113,8 +139,7 @@ def test_get_price_404_error(mock_httpx_client):
 def test_get_book_success_list_format(mock_httpx_client):
     """Test successful order book fetch with list format."""
     # Mock response with [price, size] format
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = _FakeResponse({
         "bids": [
             ["0.60", "100"],
             ["0.59", "200"],
@@ -126,8 +151,7 @@ def test_get_book_success_list_format(mock_httpx_client):
             ["0.63", "90"],
         ],
         "timestamp": 1234567890,
-    }
-    mock_response.raise_for_status.return_value = None
+    })
     mock_httpx_client.get.return_value = mock_response
 
     # Create client and fetch book
@@ -162,8 +186,7 @@ def test_get_book_success_list_format(mock_httpx_client):
 def test_get_book_dict_format(mock_httpx_client):
     """Test order book parsing with dict format."""
     # Mock response with {"price": x, "size": y} format
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = _FakeResponse({
         "bids": [
             {"price": "0.55", "size": "300"},
             {"price": "0.54", "size": "250"},
@@ -172,8 +195,7 @@ def test_get_book_dict_format(mock_httpx_client):
             {"price": "0.56", "size": "200"},
             {"price": "0.57", "size": "400"},
         ],
-    }
-    mock_response.raise_for_status.return_value = None
+    })
     mock_httpx_client.get.return_value = mock_response
 
     client = ClobClient()
@@ -190,12 +212,10 @@ def test_get_book_dict_format(mock_httpx_client):
 
 def test_get_book_empty(mock_httpx_client):
     """Test order book with no orders."""
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = _FakeResponse({
         "bids": [],
         "asks": [],
-    }
-    mock_response.raise_for_status.return_value = None
+    })
     mock_httpx_client.get.return_value = mock_response
 
     client = ClobClient()
@@ -210,8 +230,7 @@ def test_get_book_empty(mock_httpx_client):
 
 def test_get_book_unsorted_input(mock_httpx_client):
     """Test that order book is sorted even if API returns unsorted data."""
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = _FakeResponse({
         "bids": [
             ["0.50", "100"],
             ["0.60", "200"],  # Higher price, should be first after sorting
@@ -222,8 +241,7 @@ def test_get_book_unsorted_input(mock_httpx_client):
             ["0.62", "200"],  # Lower price, should be first after sorting
             ["0.65", "150"],
         ],
-    }
-    mock_response.raise_for_status.return_value = None
+    })
     mock_httpx_client.get.return_value = mock_response
 
     client = ClobClient()
@@ -243,12 +261,10 @@ def test_get_book_unsorted_input(mock_httpx_client):
 def test_get_yes_price_from_book(mock_httpx_client):
     """Test get_yes_price using order book best ask."""
     # Mock book response
-    mock_book_response = Mock()
-    mock_book_response.json.return_value = {
+    mock_book_response = _FakeResponse({
         "bids": [["0.58", "100"]],
         "asks": [["0.62", "150"]],
-    }
-    mock_book_response.raise_for_status.return_value = None
+    })
     mock_httpx_client.get.return_value = mock_book_response
 
     client = ClobClient()
@@ -260,38 +276,25 @@ def test_get_yes_price_from_book(mock_httpx_client):
 
 def test_get_yes_price_fallback_to_price_endpoint(mock_httpx_client):
     """Test get_yes_price fallback when book fails."""
-    call_count = [0]
-
-    def mock_get(url, **kwargs):
-        call_count[0] += 1
-        if "/book" in url:
-            # First call to /book fails
-            raise httpx.RequestError("Connection failed")
-        else:
-            # Second call to /price succeeds
-            response = Mock()
-            response.json.return_value = {"price": "0.65"}
-            response.raise_for_status.return_value = None
-            return response
-
-    mock_httpx_client.get.side_effect = mock_get
+    # /book fails first, then /price succeeds
+    mock_httpx_client.get.side_effect = [
+        httpx.RequestError("Connection failed"),
+        _FakeResponse({"price": "0.65"}),
+    ]
 
     client = ClobClient()
     price = client.get_yes_price("token_fallback")
 
     # Should fall back to /price endpoint
     assert price == 0.65
-    assert call_count[0] == 2  # Called both /book and /price
+    assert mock_httpx_client.get.call_count == 2  # Called both /book and /price
+    assert "/book" in mock_httpx_client.get.call_args_list[0][0][0]
+    assert "/price" in mock_httpx_client.get.call_args_list[1][0][0]
 
 
 def test_get_book_404_error(mock_httpx_client):
     """Test handling of 404 error for order book."""
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.text = "Not Found"
-    mock_httpx_client.get.side_effect = httpx.HTTPStatusError(
-        "Not Found", request=Mock(), response=mock_response
-    )
+    mock_httpx_client.get.side_effect = _NOT_FOUND_ERR
 
     client = ClobClient()
     with pytest.raises(ClobClientError, match="not found"):
@@ -300,12 +303,7 @@ def test_get_book_404_error(mock_httpx_client):
 
 def test_get_price_no_orderbook_error(mock_httpx_client):
     """Test that NoOrderbookError is raised when API returns 'No orderbook exists'."""
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.text = '{"error":"No orderbook exists for the requested token id"}'
-    mock_httpx_client.get.side_effect = httpx.HTTPStatusError(
-        "Not Found", request=Mock(), response=mock_response
-    )
+    mock_httpx_client.get.side_effect = _NO_ORDERBOOK_ERR
 
     client = ClobClient()
     with pytest.raises(NoOrderbookError, match="No active orderbook"):
@@ -314,12 +312,7 @@ def test_get_price_no_orderbook_error(mock_httpx_client):
 
 def test_get_book_no_orderbook_error(mock_httpx_client):
     """Test that NoOrderbookError is raised for get_book when no orderbook exists."""
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_response.text = '{"error":"No orderbook exists for the requested token id"}'
-    mock_httpx_client.get.side_effect = httpx.HTTPStatusError(
-        "Not Found", request=Mock(), response=mock_response
-    )
+    mock_httpx_client.get.side_effect = _NO_ORDERBOOK_ERR
 
     client = ClobClient()
     with pytest.raises(NoOrderbookError, match="No active orderbook"):
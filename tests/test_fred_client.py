@@ -1,26 +1,96 @@
 """Tests for FRED API client."""
 
+import asyncio
 import os
+import re
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import httpx
 import pytest
 
 from polyarb.clients.fred import FredClient, FredClientError
 
+OBSERVATIONS = "series/observations"
+SERIES = "series"
+SEARCH = "series/search"
 
-@pytest.fixture
+# Canned HTTP error responses as (status code, body)
+_E404 = (404, "Series not found")
+_E400_BAD = (400, "Bad Request: series does not exist")
+_E500 = (500, "Internal Server Error")
+
+
+class _FredRouter:
+    """In-memory FRED server for httpx.MockTransport.
+
+    Each endpoint maps to a JSON payload, a (status, text) error response,
+    an exception to raise, or a callable taking the request and returning
+    one of those.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.calls = []
+
+    def reset(self) -> None:
+        self.routes.clear()
+        self.calls.clear()
+
+    def route(self, endpoint: str, result) -> None:
+        self.routes[f"/fred/{endpoint}"] = result
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request)
+        result = self.routes[request.url.path]
+        if callable(result):
+            result = result(request)
+        if isinstance(result, Exception):
+            raise result
+        if isinstance(result, tuple):
+            status, text = result
+            return httpx.Response(status, text=text)
+        return httpx.Response(200, json=result)
+
+
+@pytest.fixture(autouse=True)
+def _no_cache(tmp_path, monkeypatch):
+    """Point the on-disk response cache at a per-test directory."""
+    monkeypatch.setenv("POLYARB_CACHE_DIR", str(tmp_path))
+
+
+@pytest.fixture(scope="session")
 def fred_client():
-    """Create FRED client with test API key."""
-    return FredClient(api_key="test_api_key")
+    """FRED client with a test API key, shared across the session."""
+    with FredClient(api_key="test_api_key") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def _router(fred_client):
+    """Router and mock-transport clients, built once per session."""
+    router = _FredRouter()
+    transport = httpx.MockTransport(router)
+    with httpx.Client(transport=transport, params=fred_client._base_params) as client:
+        yield router, client, transport
 
 
 @pytest.fixture
-def mock_httpx_client():
-    """Mock httpx.Client for isolated testing."""
-    with patch("httpx.Client") as mock:
-        yield mock
+def fred_http(_router, fred_client, monkeypatch):
+    """Serve the shared client's requests (sync and async) from the router."""
+    router, client, transport = _router
+    router.reset()
+    monkeypatch.setattr(fred_client, "_client", client)
+    async_client_cls = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient",
+        lambda **kwargs: async_client_cls(**{**kwargs, "transport": transport}),
+    )
+    return router
+
+
+def _observation(value: str, date: str = "2026-01-09") -> dict:
+    return {"observations": [{"date": date, "value": value}]}
 
 
 def test_fred_client_init_with_api_key():
@@ -44,132 +114,61 @@ def test_fred_client_init_no_api_key():
             FredClient()
 
 
-def test_get_latest_observation_success(fred_client, mock_httpx_client):
+def test_get_latest_observation_success(fred_client, fred_http):
     """Test successful retrieval of latest observation."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "observations": [
-            {
-                "value": "4.25",
-                "date": "2026-01-15",
-            }
-        ]
-    }
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
+    fred_http.route(OBSERVATIONS, _observation("4.25", "2026-01-15"))
 
     value, obs_date = fred_client.get_latest_observation("DGS10")
 
     assert value == 4.25
     assert obs_date == datetime(2026, 1, 15)
-    assert mock_httpx_client.return_value.__enter__.return_value.get.call_count == 1
-
-
-def test_get_latest_observation_missing_value(fred_client, mock_httpx_client):
-    """Test handling of missing observation value (FRED uses '.')."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "observations": [
-            {
-                "value": ".",
-                "date": "2026-01-15",
-            }
-        ]
-    }
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
-
-    with pytest.raises(FredClientError, match="Latest observation.*is missing"):
-        fred_client.get_latest_observation("DGS10")
-
-
-def test_get_latest_observation_no_observations(fred_client, mock_httpx_client):
-    """Test handling of empty observations list."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"observations": []}
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
-
-    with pytest.raises(FredClientError, match="No observations found"):
-        fred_client.get_latest_observation("INVALID")
-
-
-def test_get_latest_observation_invalid_value(fred_client, mock_httpx_client):
-    """Test handling of non-numeric value."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "observations": [
-            {
-                "value": "not_a_number",
-                "date": "2026-01-15",
-            }
-        ]
-    }
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
-
-    with pytest.raises(FredClientError, match="Invalid value"):
-        fred_client.get_latest_observation("DGS10")
-
-
-def test_get_latest_observation_invalid_date(fred_client, mock_httpx_client):
-    """Test handling of invalid date format."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "observations": [
-            {
-                "value": "4.25",
-                "date": "invalid-date",
-            }
-        ]
-    }
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
-
-    with pytest.raises(FredClientError, match="Invalid date"):
+    (request,) = fred_http.calls
+    assert request.url.params["series_id"] == "DGS10"
+    assert request.url.params["sort_order"] == "desc"
+    assert request.url.params["api_key"] == "test_api_key"
+
+
+# (router result, expected error pattern) for get_latest_observation
+_OBSERVATION_FAILURES = (
+    pytest.param(
+        _observation("."), re.compile(r"Latest observation.*is missing"),
+        id="missing_value",
+    ),
+    pytest.param({"observations": []}, re.compile(r"No observations found"), id="no_observations"),
+    pytest.param(_observation("not_a_number"), re.compile(r"Invalid value"), id="invalid_value"),
+    pytest.param(
+        _observation("4.25", "invalid-date"), re.compile(r"Invalid date"),
+        id="invalid_date",
+    ),
+    pytest.param(
+        _observation("4.25", "20240115"), re.compile(r"Invalid date"),
+        id="basic_format_date",
+    ),
+    pytest.param(
+        _observation("4.25", "2024-01-15T09:30"), re.compile(r"Invalid date"),
+        id="datetime_not_date",
+    ),
+    pytest.param(_E404, re.compile(r"HTTP error"), id="http_404"),
+    pytest.param(_E400_BAD, re.compile(r"Invalid series ID"), id="http_400_bad_series"),
+    pytest.param(
+        httpx.RequestError("Connection failed"), re.compile(r"Request error"),
+        id="request_error",
+    ),
+)
+
+
+@pytest.mark.parametrize("result,match", _OBSERVATION_FAILURES)
+def test_get_latest_observation_failures(fred_client, fred_http, result, match):
+    """Test that bad payloads and HTTP failures raise FredClientError."""
+    fred_http.route(OBSERVATIONS, result)
+
+    with pytest.raises(FredClientError, match=match):
         fred_client.get_latest_observation("DGS10")
 
 
-def test_get_latest_observation_http_404(fred_client, mock_httpx_client):
-    """Test handling of 404 HTTP error."""
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.text = "Series not found"
-    mock_get = mock_httpx_client.return_value.__enter__.return_value.get
-    mock_get.side_effect = httpx.HTTPStatusError(
-        "Not Found",
-        request=MagicMock(),
-        response=mock_response,
-    )
-
-    with pytest.raises(FredClientError, match="HTTP error"):
-        fred_client.get_latest_observation("INVALID")
-
-
-def test_get_latest_observation_http_400_bad_series(fred_client, mock_httpx_client):
-    """Test handling of 400 error for invalid series ID."""
-    mock_response = MagicMock()
-    mock_response.status_code = 400
-    mock_response.text = "Bad Request: series does not exist"
-    mock_get = mock_httpx_client.return_value.__enter__.return_value.get
-    mock_get.side_effect = httpx.HTTPStatusError(
-        "Bad Request",
-        request=MagicMock(),
-        response=mock_response,
-    )
-
-    with pytest.raises(FredClientError, match="Invalid series ID"):
-        fred_client.get_latest_observation("BAD_SERIES")
-
-
-def test_get_latest_observation_request_error(fred_client, mock_httpx_client):
-    """Test handling of network request error."""
-    mock_get = mock_httpx_client.return_value.__enter__.return_value.get
-    mock_get.side_effect = httpx.RequestError("Connection failed")
-
-    with pytest.raises(FredClientError, match="Request error"):
-        fred_client.get_latest_observation("DGS10")
-
-
-def test_get_series_info_success(fred_client, mock_httpx_client):
+def test_get_series_info_success(fred_client, fred_http):
     """Test successful retrieval of series metadata."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
+    fred_http.route(SERIES, {
         "seriess": [
             {
                 "id": "DGS10",
@@ -179,8 +178,7 @@ def test_get_series_info_success(fred_client, mock_httpx_client):
                 "seasonal_adjustment": "Not Seasonally Adjusted",
             }
         ]
-    }
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
+    })
 
     info = fred_client.get_series_info("DGS10")
 
@@ -189,35 +187,25 @@ def test_get_series_info_success(fred_client, mock_httpx_client):
     assert info["units"] == "Percent"
 
 
-def test_get_series_info_not_found(fred_client, mock_httpx_client):
+def test_get_series_info_not_found(fred_client, fred_http):
     """Test handling of series not found."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"seriess": []}
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
+    fred_http.route(SERIES, {"seriess": []})
 
     with pytest.raises(FredClientError, match="Series.*not found"):
         fred_client.get_series_info("INVALID")
 
 
-def test_get_series_info_http_400(fred_client, mock_httpx_client):
+def test_get_series_info_http_400(fred_client, fred_http):
     """Test handling of 400 error for get_series_info."""
-    mock_response = MagicMock()
-    mock_response.status_code = 400
-    mock_get = mock_httpx_client.return_value.__enter__.return_value.get
-    mock_get.side_effect = httpx.HTTPStatusError(
-        "Bad Request",
-        request=MagicMock(),
-        response=mock_response,
-    )
+    fred_http.route(SERIES, _E400_BAD)
 
     with pytest.raises(FredClientError, match="Invalid series ID"):
         fred_client.get_series_info("BAD")
 
 
-def test_search_series_success(fred_client, mock_httpx_client):
+def test_search_series_success(fred_client, fred_http):
     """Test successful search for series."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
+    fred_http.route(SEARCH, {
         "seriess": [
             {
                 "id": "DGS10",
@@ -228,52 +216,118 @@ def test_search_series_success(fred_client, mock_httpx_client):
                 "title": "5-Year Treasury Constant Maturity Rate",
             },
         ]
-    }
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
+    })
 
     results = fred_client.search_series("treasury rate")
 
     assert len(results) == 2
     assert results[0]["id"] == "DGS10"
     assert results[1]["id"] == "DGS5"
+    assert fred_http.calls[0].url.params["search_text"] == "treasury rate"
 
 
-def test_search_series_no_results(fred_client, mock_httpx_client):
+def test_search_series_no_results(fred_client, fred_http):
     """Test search with no results."""
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"seriess": []}
-    mock_httpx_client.return_value.__enter__.return_value.get.return_value = mock_response
+    fred_http.route(SEARCH, {"seriess": []})
 
     results = fred_client.search_series("nonexistent query xyz")
 
     assert results == []
 
 
-def test_search_series_http_error(fred_client, mock_httpx_client):
+def test_search_series_http_error(fred_client, fred_http):
     """Test handling of HTTP error during search."""
-    mock_response = MagicMock()
-    mock_response.status_code = 500
-    mock_get = mock_httpx_client.return_value.__enter__.return_value.get
-    mock_get.side_effect = httpx.HTTPStatusError(
-        "Internal Server Error",
-        request=MagicMock(),
-        response=mock_response,
-    )
+    fred_http.route(SEARCH, _E500)
 
     with pytest.raises(FredClientError, match="HTTP error searching"):
         fred_client.search_series("test")
 
 
-def test_search_series_request_error(fred_client, mock_httpx_client):
+def test_search_series_request_error(fred_client, fred_http):
     """Test handling of request error during search."""
-    mock_get = mock_httpx_client.return_value.__enter__.return_value.get
-    mock_get.side_effect = httpx.RequestError("Network timeout")
+    fred_http.route(SEARCH, httpx.RequestError("Network timeout"))
 
     with pytest.raises(FredClientError, match="Request error searching"):
         fred_client.search_series("test")
 
 
-def test_custom_timeout(mock_httpx_client):
+def test_custom_timeout():
     """Test that custom timeout is used."""
     client = FredClient(api_key="test_key", timeout=60.0)
     assert client.timeout == 60.0
+
+
+def test_close_releases_pooled_client():
+    """Test that leaving the context manager closes the connection pool."""
+    with FredClient(api_key="test_key") as client:
+        assert not client._client.is_closed
+    assert client._client.is_closed
+
+
+def test_aget_latest_observation_many(fred_client, fred_http):
+    """Test that all series are fetched concurrently."""
+    values = {"DGS1MO": "4.30", "DGS3MO": "4.33", "DGS10": "4.10"}
+    fred_http.route(
+        OBSERVATIONS, lambda request: _observation(values[request.url.params["series_id"]])
+    )
+
+    results = asyncio.run(fred_client.aget_latest_observation_many(list(values)))
+
+    assert len(fred_http.calls) == len(values)
+    assert all(r.url.params["api_key"] == "test_api_key" for r in fred_http.calls)
+    assert [value for value, _ in results] == [4.30, 4.33, 4.10]
+    assert results[0][1] == datetime(2026, 1, 9)
+
+
+def test_get_latest_observation_many_sync_wrapper(fred_client, fred_http):
+    """Test the synchronous wrapper returns results in input order."""
+    fred_http.route(OBSERVATIONS, _observation("4.33"))
+
+    results = fred_client.get_latest_observation_many(["DGS3MO", "DGS10"])
+
+    assert results == [(4.33, datetime(2026, 1, 9))] * 2
+
+
+def test_aget_latest_observation_many_error(fred_client, fred_http):
+    """Test that a failed request surfaces as FredClientError."""
+    fred_http.route(OBSERVATIONS, httpx.RequestError("Network timeout"))
+
+    with pytest.raises(FredClientError, match="Request error fetching series DGS10"):
+        asyncio.run(fred_client.aget_latest_observation("DGS10"))
+
+
+def test_get_latest_observation_cached(fred_client, fred_http):
+    """Test that a warm call is served from the disk cache without HTTP."""
+    fred_http.route(OBSERVATIONS, _observation("4.10"))
+
+    first = fred_client.get_latest_observation("DGS10")
+    second = fred_client.get_latest_observation("DGS10")
+
+    assert first == second == (4.10, datetime(2026, 1, 9))
+    assert len(fred_http.calls) == 1
+
+
+def test_cache_expires_after_ttl(fred_client, fred_http, monkeypatch):
+    """Test that an expired entry is refetched."""
+    fred_http.route(OBSERVATIONS, _observation("4.10"))
+    fred_client.get_latest_observation("DGS10")
+
+    monkeypatch.setattr(fred_client._observation_cache, "ttl", -1)
+    fred_client.get_latest_observation("DGS10")
+
+    assert len(fred_http.calls) == 2
+
+
+def test_get_series_info_cached(fred_client, fred_http):
+    """Test that series metadata is cached and errors are not."""
+    fred_http.route(SERIES, {"seriess": [{"id": "DGS10", "title": "10-Year"}]})
+
+    assert fred_client.get_series_info("DGS10")["id"] == "DGS10"
+    assert fred_client.get_series_info("DGS10")["id"] == "DGS10"
+    assert len(fred_http.calls) == 1
+
+    fred_http.route(SERIES, {"seriess": []})
+    for _ in range(2):
+        with pytest.raises(FredClientError, match="not found"):
+            fred_client.get_series_info("MISSING")
+    assert len(fred_http.calls) == 3
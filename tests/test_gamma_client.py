@@ -1,12 +1,49 @@
 """Tests for Polymarket Gamma API client."""
 
+import httpx
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock
 
 from polyarb.clients.polymarket_gamma import GammaClient, GammaClientError
 from polyarb.models import Market
 
+_NOT_FOUND_ERR = httpx.HTTPStatusError(
+    "404",
+    request=SimpleNamespace(),
+    response=SimpleNamespace(status_code=404, text="Not Found"),
+)
+
+
+@pytest.fixture(scope="session")
+def gamma_client():
+    """GammaClient shared across the session; tests swap in a mock HTTP client."""
+    with GammaClient() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def _httpx_mock():
+    """Stand-in for the pooled httpx.Client, built once per session."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_client(_httpx_mock, gamma_client, monkeypatch):
+    """Install the shared httpx.Client mock on the client with fresh call state."""
+    _httpx_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(gamma_client, "_client", _httpx_mock)
+    return _httpx_mock
+
+
+def set_response(mock_client: MagicMock, *, json=None, error=None) -> None:
+    """Make GETs on ``mock_client`` return ``json`` or fail raise_for_status with ``error``."""
+    mock_client.get.return_value = Mock(
+        json=Mock(return_value=json),
+        raise_for_status=Mock(side_effect=error),
+    )
+
 
 @pytest.fixture
 def sample_market_response():
@@ -59,24 +96,13 @@ class TestGammaClient:
         client_custom = GammaClient(timeout=60.0)
         assert client_custom.timeout == 60.0
 
-    @patch("httpx.Client")
-    def test_get_market_success(self, mock_client_class, sample_market_response):
+    def test_get_market_success(self, gamma_client, mock_client, sample_market_response):
         """Test successful market fetch."""
         # Setup mock
-        mock_response = Mock()
-        mock_response.json.return_value = sample_market_response
-        mock_response.raise_for_status = Mock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-
-        mock_client_class.return_value = mock_client
+        set_response(mock_client, json=sample_market_response)
 
         # Test
-        client = GammaClient()
-        market = client.get_market("0x123abc")
+        market = gamma_client.get_market("0x123abc")
 
         # Verify
         assert isinstance(market, Market)
@@ -95,50 +121,21 @@ class TestGammaClient:
             "https://gamma-api.polymarket.com/markets/0x123abc"
         )
 
-    @patch("httpx.Client")
-    def test_get_market_not_found(self, mock_client_class):
+    def test_get_market_not_found(self, gamma_client, mock_client):
         """Test market not found error."""
-        # Setup mock for 404
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = Exception("404")
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-
-        # Need to make raise_for_status raise HTTPStatusError
-        import httpx
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "404", request=Mock(), response=mock_response
-        )
-
-        mock_client_class.return_value = mock_client
+        set_response(mock_client, error=_NOT_FOUND_ERR)
 
         # Test
-        client = GammaClient()
         with pytest.raises(GammaClientError, match="not found"):
-            client.get_market("0xnonexistent")
+            gamma_client.get_market("0xnonexistent")
 
-    @patch("httpx.Client")
-    def test_search_markets_success(self, mock_client_class, sample_markets_list_response):
+    def test_search_markets_success(self, gamma_client, mock_client, sample_markets_list_response):
         """Test successful market search routes through /public-search."""
         # Setup mock — /public-search returns {events: [{markets: [...]}]}
-        mock_response = Mock()
-        mock_response.json.return_value = {"events": [{"markets": sample_markets_list_response}]}
-        mock_response.raise_for_status = Mock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-
-        mock_client_class.return_value = mock_client
+        set_response(mock_client, json={"events": [{"markets": sample_markets_list_response}]})
 
         # Test
-        client = GammaClient()
-        markets = client.search_markets(query="BTC", limit=10)
+        markets = gamma_client.search_markets(query="BTC", limit=10)
 
         # Verify
         assert len(markets) == 2
@@ -153,31 +150,19 @@ class TestGammaClient:
         assert call_args[1]["params"]["q"] == "BTC"
         assert call_args[1]["params"]["limit"] == 10
 
-    @patch("httpx.Client")
-    def test_search_markets_with_data_wrapper(self, mock_client_class, sample_markets_list_response):
+    def test_search_markets_with_data_wrapper(self, gamma_client, mock_client, sample_markets_list_response):
         """Test market search when response has data wrapper."""
         # Setup mock with data wrapper
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_markets_list_response}
-        mock_response.raise_for_status = Mock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-
-        mock_client_class.return_value = mock_client
+        set_response(mock_client, json={"data": sample_markets_list_response})
 
         # Test
-        client = GammaClient()
-        markets = client.search_markets()
+        markets = gamma_client.search_markets()
 
         # Verify
         assert len(markets) == 2
 
     def test_parse_market_missing_id(self):
         """Test parsing market with missing ID."""
-        client = GammaClient()
         data = {
             "title": "Test Market",
             "endDate": "2024-12-31T23:59:59Z",
@@ -185,11 +170,10 @@ class TestGammaClient:
         }
 
         with pytest.raises(GammaClientError, match="Missing market ID"):
-            client._parse_market(data)
+            GammaClient._parse_market(data)
 
     def test_parse_market_missing_end_date(self):
         """Test parsing market with missing end date."""
-        client = GammaClient()
         data = {
             "id": "0x123",
             "title": "Test Market",
@@ -197,11 +181,10 @@ class TestGammaClient:
         }
 
         with pytest.raises(GammaClientError, match="Missing end date"):
-            client._parse_market(data)
+            GammaClient._parse_market(data)
 
     def test_parse_market_missing_outcomes(self):
         """Test parsing market with missing outcomes."""
-        client = GammaClient()
         data = {
             "id": "0x123",
             "title": "Test Market",
@@ -209,11 +192,10 @@ class TestGammaClient:
         }
 
         with pytest.raises(GammaClientError, match="Missing outcomes"):
-            client._parse_market(data)
+            GammaClient._parse_market(data)
 
     def test_parse_market_dict_token_ids(self):
         """Test parsing market with dict-format token IDs."""
-        client = GammaClient()
         data = {
             "id": "0x123",
             "title": "Test Market",
@@ -222,12 +204,11 @@ class TestGammaClient:
             "clobTokenIds": {"Yes": "0xa", "No": "0xb"},
         }
 
-        market = client._parse_market(data)
+        market = GammaClient._parse_market(data)
         assert market.clob_token_ids == {"Yes": "0xa", "No": "0xb"}
 
     def test_parse_market_json_string_fields(self):
         """Test parsing market when outcomes and clobTokenIds are JSON strings (real API format)."""
-        client = GammaClient()
         data = {
             "id": "0x789",
             "title": "JSON String Test",
@@ -236,12 +217,11 @@ class TestGammaClient:
             "clobTokenIds": '["0xaaa", "0xbbb"]',
         }
 
-        market = client._parse_market(data)
+        market = GammaClient._parse_market(data)
         assert market.outcomes == ["Yes", "No"]
         assert market.clob_token_ids == {"Yes": "0xaaa", "No": "0xbbb"}
 
-    @patch("httpx.Client")
-    def test_search_markets_filters_expired(self, mock_client_class):
+    def test_search_markets_filters_expired(self, gamma_client, mock_client):
         """Test that search_markets excludes expired markets by default and includes them when asked."""
         past_market = {
             "id": "0xold",
@@ -258,25 +238,15 @@ class TestGammaClient:
             "clobTokenIds": ["0x3", "0x4"],
         }
 
-        mock_response = Mock()
-        mock_response.json.return_value = [past_market, future_market]
-        mock_response.raise_for_status = Mock()
-
-        mock_client = MagicMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-        mock_client_class.return_value = mock_client
-
-        client = GammaClient()
+        set_response(mock_client, json=[past_market, future_market])
 
         # Default: expired market filtered out
-        markets = client.search_markets()
+        markets = gamma_client.search_markets()
         assert len(markets) == 1
         assert markets[0].id == "0xnew"
 
         # include_expired=True: both returned
-        markets = client.search_markets(include_expired=True)
+        markets = gamma_client.search_markets(include_expired=True)
         assert len(markets) == 2
         ids = {m.id for m in markets}
         assert "0xold" in ids
@@ -284,7 +254,6 @@ class TestGammaClient:
 
     def test_parse_market_alternate_field_names(self):
         """Test parsing market with alternate API field names."""
-        client = GammaClient()
         data = {
             "conditionId": "0x456",  # alternate for id
             "question": "Will it rain?",  # alternate for title
@@ -293,7 +262,7 @@ class TestGammaClient:
             "tokens": ["0xa", "0xb"],  # alternate for clobTokenIds
         }
 
-        market = client._parse_market(data)
+        market = GammaClient._parse_market(data)
         assert market.id == "0x456"
         assert market.title == "Will it rain?"
         assert market.end_date.year == 2024
@@ -6,12 +6,22 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from polyarb.vol import iv_extract
 from polyarb.vol.iv_extract import (
+    _CHAIN_CACHE,
+    Chain,
+    ChainView,
     IVExtractionError,
+    _get_sorted_chain,
+    SENS_LABELS,
+    clear_chain_cache,
     compute_sensitivity_ivs,
+    compute_sensitivity_ivs_dict,
     extract_strike_region_iv,
+    extract_strike_region_iv_many,
     get_average_iv_from_region,
 )
+from polyarb.vol.iv_extract_numba import batch_interp, batch_interp_numpy
 
 
 @pytest.fixture
@@ -23,6 +33,15 @@ def sample_chain():
     })
 
 
+@pytest.fixture
+def sample_chain_arr():
+    """sample_chain as a pandas-free Chain."""
+    return Chain(
+        strike=np.array([90, 95, 100, 105, 110, 115, 120], dtype=np.float64),
+        impliedVolatility=np.array([0.30, 0.28, 0.25, 0.24, 0.26, 0.28, 0.30]),
+    )
+
+
 @pytest.fixture
 def sparse_chain():
     """Chain with some missing IVs."""
@@ -90,6 +109,11 @@ class TestExtractStrikeRegionIV:
             iv = extract_strike_region_iv(single_strike_chain, strike_level=100.0)
         assert iv == 0.25
 
+    def test_exact_match_tolerates_float_drift(self, sample_chain):
+        """Test that a target within float drift of a strike uses that strike's IV."""
+        iv = extract_strike_region_iv(sample_chain, strike_level=100.0 * (1 + 1e-14))
+        assert iv == 0.25
+
     def test_below_all_strikes(self, sample_chain):
         """Test when target is below all available strikes."""
         with pytest.warns(UserWarning, match="below available range"):
@@ -185,12 +209,66 @@ class TestExtractStrikeRegionIV:
         assert 0.25 <= iv_95 <= 0.30
 
 
+class TestExtractStrikeRegionIVMany:
+    """Tests for extract_strike_region_iv_many function."""
+
+    def test_matches_scalar_extraction(self, sample_chain):
+        """Test that batch results agree with per-level extraction."""
+        levels = [90.0, 97.5, 100.0, 102.5, 108.0, 120.0]
+        batch = extract_strike_region_iv_many(sample_chain, levels)
+
+        for level, iv in zip(levels, batch):
+            assert iv == pytest.approx(extract_strike_region_iv(sample_chain, level))
+
+    def test_nearest_strike_outside_range(self, sample_chain):
+        """Test nearest-strike fallback below and above the chain."""
+        ivs = extract_strike_region_iv_many(sample_chain, [85.0, 125.0], window_pct=0.02)
+        assert ivs[0] == 0.30
+        assert ivs[1] == 0.30
+
+    def test_missing_ivs_dropped(self, sparse_chain):
+        """Test that strikes with missing IVs are skipped."""
+        ivs = extract_strike_region_iv_many(sparse_chain, [95.0, 110.0], window_pct=0.10)
+        assert not np.isnan(ivs).any()
+
+    def test_no_strikes_in_window_is_nan(self):
+        """Test that levels with no strikes even after widening return NaN."""
+        chain = pd.DataFrame({
+            'strike': [50, 60, 140, 150],
+            'impliedVolatility': [0.30, 0.28, 0.26, 0.24],
+        })
+        ivs = extract_strike_region_iv_many(chain, [100.0, 55.0])
+        assert np.isnan(ivs[0])
+        assert ivs[1] > 0
+
+    def test_invalid_inputs_raise_error(self, sample_chain):
+        """Test validation of chain, levels and window."""
+        with pytest.raises(IVExtractionError, match="empty"):
+            extract_strike_region_iv_many(pd.DataFrame({'strike': [], 'impliedVolatility': []}), [100.0])
+        with pytest.raises(IVExtractionError, match="must be positive"):
+            extract_strike_region_iv_many(sample_chain, [100.0, -5.0])
+        with pytest.raises(IVExtractionError, match="Window percentage"):
+            extract_strike_region_iv_many(sample_chain, [100.0], window_pct=1.5)
+
+    def test_numpy_fallback_matches_kernel(self):
+        """Test that the NumPy batch path agrees with the kernel."""
+        rng = np.random.default_rng(7)
+        strikes = np.unique(rng.uniform(50.0, 150.0, 40).round(1))
+        ivs = rng.uniform(0.2, 0.6, strikes.size)
+        targets = np.concatenate([rng.uniform(20.0, 200.0, 500), strikes[::3]])
+        args = (strikes, ivs, np.log(strikes), targets, 0.03)
+
+        np.testing.assert_allclose(
+            batch_interp_numpy(*args), batch_interp(*args), rtol=1e-12, equal_nan=True
+        )
+
+
 class TestComputeSensitivityIVs:
     """Tests for compute_sensitivity_ivs function."""
 
     def test_basic_sensitivity(self):
         """Test basic sensitivity computation."""
-        result = compute_sensitivity_ivs(0.25)
+        result = compute_sensitivity_ivs_dict(0.25)
 
         assert result['base'] == 0.25
         assert result['minus_3'] == 0.22
@@ -200,7 +278,7 @@ class TestComputeSensitivityIVs:
 
     def test_low_base_iv_clipping(self):
         """Test that low IVs are clipped at minimum."""
-        result = compute_sensitivity_ivs(0.02)
+        result = compute_sensitivity_ivs_dict(0.02)
 
         assert result['base'] == 0.02
         assert result['minus_3'] == 0.01  # max(0.02 - 0.03, 0.01) = 0.01
@@ -220,7 +298,7 @@ class TestComputeSensitivityIVs:
 
     def test_high_iv(self):
         """Test with high IV values."""
-        result = compute_sensitivity_ivs(1.0)
+        result = compute_sensitivity_ivs_dict(1.0)
 
         assert result['base'] == 1.0
         assert result['minus_3'] == 0.97
@@ -230,11 +308,26 @@ class TestComputeSensitivityIVs:
 
     def test_all_keys_present(self):
         """Test that all expected keys are present."""
-        result = compute_sensitivity_ivs(0.25)
+        result = compute_sensitivity_ivs_dict(0.25)
 
         expected_keys = {'base', 'minus_3', 'minus_2', 'plus_2', 'plus_3'}
         assert set(result.keys()) == expected_keys
 
+    def test_array_in_label_order(self):
+        """Test that the array form follows SENS_LABELS order."""
+        result = compute_sensitivity_ivs(0.25)
+
+        assert SENS_LABELS == ('minus_3', 'minus_2', 'base', 'plus_2', 'plus_3')
+        np.testing.assert_array_equal(result, [0.22, 0.23, 0.25, 0.27, 0.28])
+
+    def test_cached_result_is_read_only(self):
+        """Test that repeated calls share one read-only array."""
+        result = compute_sensitivity_ivs(0.25)
+
+        assert compute_sensitivity_ivs(0.25) is result
+        with pytest.raises(ValueError):
+            result[0] = 0.5
+
 
 class TestGetAverageIVFromRegion:
     """Tests for get_average_iv_from_region function."""
@@ -296,3 +389,182 @@ class TestGetAverageIVFromRegion:
         })
         avg_iv = get_average_iv_from_region(chain, strike_level=100.0, window_pct=0.10)
         assert avg_iv is None
+
+    def test_undefined_average_returns_none(self):
+        """Test None returned when the average is NaN (inf and -inf IVs)."""
+        chain = pd.DataFrame({
+            'strike': [95, 100, 105],
+            'impliedVolatility': [np.inf, 0.25, -np.inf],
+        })
+        avg_iv = get_average_iv_from_region(chain, strike_level=100.0, window_pct=0.10)
+        assert avg_iv is None
+
+
+class TestChainView:
+    """Tests for passing a prebuilt ChainView instead of a DataFrame."""
+
+    def test_from_frame_uses_cache(self, sample_chain):
+        """Test that from_frame returns the cached per-chain view."""
+        view = ChainView.from_frame(sample_chain)
+        assert view is _get_sorted_chain(sample_chain)
+
+    def test_view_matches_dataframe(self, sparse_chain):
+        """Test that every extraction function gives the same result for a view."""
+        view = ChainView.from_frame(sparse_chain)
+        for level in (95.0, 102.0, 110.0):
+            assert extract_strike_region_iv(view, level, window_pct=0.10) == \
+                extract_strike_region_iv(sparse_chain, level, window_pct=0.10)
+            assert get_average_iv_from_region(view, level) == \
+                get_average_iv_from_region(sparse_chain, level)
+        np.testing.assert_array_equal(
+            extract_strike_region_iv_many(view, [95.0, 110.0]),
+            extract_strike_region_iv_many(sparse_chain, [95.0, 110.0]),
+        )
+
+
+    def test_bisect_bounds_match_searchsorted(self):
+        """Test that small chains keep a strike tuple whose bounds match NumPy's."""
+        small = _get_sorted_chain(pd.DataFrame({
+            'strike': np.arange(80.0, 121.0), 'impliedVolatility': 0.25,
+        }))
+        large = _get_sorted_chain(pd.DataFrame({
+            'strike': np.arange(50.0, 150.0), 'impliedVolatility': 0.25,
+        }))
+        assert small.strike_tuple == tuple(small.strikes.tolist())
+        assert large.strike_tuple is None
+
+        plain = small._replace(strike_tuple=None)
+        for lower, upper in [(95.0, 105.0), (79.0, 80.0), (90.5, 90.9), (120.0, 200.0)]:
+            assert iv_extract._region_bounds(small, lower, upper) == \
+                iv_extract._region_bounds(plain, lower, upper)
+
+
+class TestChainArrays:
+    """Tests for passing a Chain of bare arrays instead of a DataFrame."""
+
+    def test_chain_matches_dataframe(self, sample_chain, sample_chain_arr):
+        """Test that every extraction function gives the same result for a Chain."""
+        for level in (97.5, 102.0, 117.0):
+            assert extract_strike_region_iv(sample_chain_arr, level) == \
+                extract_strike_region_iv(sample_chain, level)
+            assert get_average_iv_from_region(sample_chain_arr, level) == \
+                get_average_iv_from_region(sample_chain, level)
+        np.testing.assert_array_equal(
+            extract_strike_region_iv_many(sample_chain_arr, [95.0, 110.0]),
+            extract_strike_region_iv_many(sample_chain, [95.0, 110.0]),
+        )
+
+    def test_chain_view_cached(self, sample_chain_arr):
+        """Test that a Chain's view is built once and cached like a DataFrame's."""
+        view = ChainView.from_frame(sample_chain_arr)
+        assert view is _get_sorted_chain(sample_chain_arr)
+        assert view.strikes.tolist() == sample_chain_arr.strike.tolist()
+
+    def test_empty_chain(self):
+        """Test that an empty Chain is treated like an empty DataFrame."""
+        chain = Chain(strike=np.array([]), impliedVolatility=np.array([]))
+        with pytest.raises(IVExtractionError, match="empty"):
+            extract_strike_region_iv(chain, 100.0)
+        assert get_average_iv_from_region(chain, 100.0) is None
+
+    def test_length_mismatch(self):
+        """Test that misaligned Chain arrays are rejected."""
+        chain = Chain(strike=np.array([95.0, 100.0]), impliedVolatility=np.array([0.25]))
+        with pytest.raises(IVExtractionError, match="differ in length"):
+            extract_strike_region_iv(chain, 100.0)
+
+    def test_non_numeric(self):
+        """Test that non-numeric Chain arrays are rejected."""
+        chain = Chain(strike=np.array(['95', '100']), impliedVolatility=np.array([0.25, 0.24]))
+        with pytest.raises(IVExtractionError, match="must be numeric"):
+            extract_strike_region_iv(chain, 100.0)
+
+
+class TestSortedChainCache:
+    """Tests for the per-chain sorted array cache."""
+
+    def test_sorted_and_missing_dropped(self):
+        """Test that cached arrays are sorted by strike with NaN IVs removed."""
+        chain = pd.DataFrame({
+            'strike': [110, 90, 100, 95],
+            'impliedVolatility': [0.26, 0.30, np.nan, 0.28],
+        })
+        sorted_chain = _get_sorted_chain(chain)
+        assert sorted_chain.strikes.tolist() == [90.0, 95.0, 110.0]
+        assert sorted_chain.ivs.tolist() == [0.30, 0.28, 0.26]
+        assert sorted_chain.log_strikes == pytest.approx(np.log([90.0, 95.0, 110.0]))
+
+    def test_reused_then_evicted(self):
+        """Test that the same chain hits the cache and is evicted on collection."""
+        chain = pd.DataFrame({'strike': [95, 100], 'impliedVolatility': [0.28, 0.25]})
+        first = _get_sorted_chain(chain)
+        assert _get_sorted_chain(chain) is first
+
+        key = id(chain)
+        del chain
+        assert key not in _CHAIN_CACHE
+
+    def test_in_place_edit_needs_clear(self):
+        """Test that an in-place edit is only seen after clear_chain_cache."""
+        chain = pd.DataFrame({
+            'strike': [95.0, 100.0, 105.0],
+            'impliedVolatility': [0.28, 0.25, 0.24],
+        })
+        assert extract_strike_region_iv(chain, 100.0) == 0.25
+
+        chain.loc[1, 'impliedVolatility'] = 0.60
+        # Cached per chain object: the edit is not picked up
+        assert extract_strike_region_iv(chain, 100.0) == 0.25
+
+        clear_chain_cache(chain)
+        assert extract_strike_region_iv(chain, 100.0) == 0.60
+
+    def test_clear_all(self):
+        """Test that clearing without a chain drops every cached view."""
+        chain = pd.DataFrame({'strike': [95, 100], 'impliedVolatility': [0.28, 0.25]})
+        first = _get_sorted_chain(chain)
+
+        clear_chain_cache()
+
+        assert id(chain) not in _CHAIN_CACHE
+        assert _get_sorted_chain(chain) is not first
+
+    def test_same_quotes_share_view(self):
+        """Test that a refetched chain with identical quotes reuses the view."""
+        data = {'strike': [95, 100, 105], 'impliedVolatility': [0.28, 0.25, 0.24]}
+        first = _get_sorted_chain(pd.DataFrame(data))
+        assert _get_sorted_chain(pd.DataFrame(data)) is first
+
+        changed = dict(data, impliedVolatility=[0.28, 0.25, 0.23])
+        assert _get_sorted_chain(pd.DataFrame(changed)) is not first
+
+    def test_content_cache_bounded(self, monkeypatch):
+        """Test that the content cache evicts its least recently used view."""
+        monkeypatch.setattr(iv_extract, '_CONTENT_CACHE', iv_extract.OrderedDict())
+        monkeypatch.setattr(iv_extract, '_CONTENT_CACHE_SIZE', 2)
+
+        def chain(iv):
+            return Chain(strike=np.array([100.0]), impliedVolatility=np.array([iv]))
+
+        oldest = _get_sorted_chain(chain(0.1))
+        _get_sorted_chain(chain(0.2))
+        _get_sorted_chain(chain(0.3))
+
+        assert len(iv_extract._CONTENT_CACHE) == 2
+        assert _get_sorted_chain(chain(0.1)) is not oldest
+
+    def test_non_numeric_column_raises_error(self):
+        """Test that a non-numeric strike column is rejected on first use."""
+        chain = pd.DataFrame({'strike': ['95', '100'], 'impliedVolatility': [0.28, 0.25]})
+        with pytest.raises(IVExtractionError, match="must be numeric"):
+            _get_sorted_chain(chain)
+
+    def test_validated_once_per_chain(self, mocker):
+        """Test that column validation runs only on the first lookup."""
+        chain = pd.DataFrame({'strike': [95, 100], 'impliedVolatility': [0.28, 0.25]})
+        spy = mocker.spy(iv_extract, '_validate_chain')
+
+        _get_sorted_chain(chain)
+        _get_sorted_chain(chain)
+
+        assert spy.call_count == 1
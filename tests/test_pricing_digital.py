@@ -1,14 +1,20 @@
 """Tests for digital option pricing module."""
 
 import math
+
+import numpy as np
 import pytest
 from scipy.stats import norm
 
 from polyarb.pricing.digital_bs import (
+    VERDICT_LABELS,
     DigitalPricingError,
     compute_verdict,
+    compute_verdicts,
     digital_price,
+    digital_price_batch,
     digital_price_with_sensitivity,
+    make_digital_pricer,
 )
 
 
@@ -237,6 +243,15 @@ class TestDigitalPrice:
             assert 0.0 <= result_above.pv <= 1.0
             assert 0.0 <= result_below.pv <= 1.0
 
+    def test_matches_scipy_normal_cdf(self):
+        """Test that the erfc-based probability matches scipy's N(d2)."""
+        for K in (50.0, 90.0, 100.0, 110.0, 200.0):
+            for sigma in (0.05, 0.3, 1.5):
+                result = digital_price(100.0, K, 0.5, 0.04, 0.01, sigma, "above")
+                assert result.probability == pytest.approx(norm.cdf(result.d2), abs=1e-15)
+                below = digital_price(100.0, K, 0.5, 0.04, 0.01, sigma, "below")
+                assert below.probability == pytest.approx(norm.cdf(-result.d2), abs=1e-15)
+
     def test_invalid_spot(self):
         """Test error handling for invalid spot price."""
         with pytest.raises(DigitalPricingError, match="Spot price must be positive"):
@@ -378,6 +393,89 @@ class TestDigitalPriceWithSensitivity:
         assert result_with_sens.d2 == pytest.approx(result_direct.d2)
         assert result_with_sens.drift == pytest.approx(result_direct.drift)
 
+    def test_sensitivity_grid_matches_dict(self):
+        """Test that the array grid carries the same values as the dict."""
+        result = digital_price_with_sensitivity(
+            100.0, 105.0, 0.5, 0.04, 0.0, 0.02, "above", sigma_shifts=[-0.03, 0.02]
+        )
+        grid = result.sensitivity_grid
+
+        np.testing.assert_array_equal(grid.shifts, [-0.03, 0.02])
+        np.testing.assert_array_equal(grid.sigmas, [0.01, 0.04])
+        assert grid.as_dict() == result.sensitivity
+        for sigma, prob, pv in zip(grid.sigmas, grid.probabilities, grid.pvs):
+            direct = digital_price(100.0, 105.0, 0.5, 0.04, 0.0, sigma, "above")
+            assert (prob, pv) == pytest.approx((direct.probability, direct.pv))
+
+
+class TestDigitalPriceBatch:
+    """Tests for digital_price_batch."""
+
+    def test_batch_matches_scalar(self):
+        """Test that each row matches digital_price with the same inputs."""
+        K = np.array([90.0, 100.0, 110.0, 120.0])
+        T = np.array([0.1, 0.5, 1.0, 2.0])
+        sigma = np.array([0.2, 0.3, 0.4, 0.5])
+        above = np.array([1, 0, 1, 0], dtype=np.int8)
+
+        probs, pvs = digital_price_batch(100.0, K, T, 0.05, 0.01, sigma, above)
+
+        for i in range(K.size):
+            direction = "above" if above[i] else "below"
+            direct = digital_price(100.0, K[i], T[i], 0.05, 0.01, sigma[i], direction)
+            assert (probs[i], pvs[i]) == pytest.approx((direct.probability, direct.pv))
+
+    def test_batch_broadcasts_shape(self):
+        """Test that scalar inputs broadcast and the output keeps the input shape."""
+        K = np.linspace(80.0, 120.0, 6).reshape(2, 3)
+
+        probs, pvs = digital_price_batch(100.0, K, 0.5, 0.04, 0.0, 0.3, 1)
+
+        assert probs.shape == pvs.shape == (2, 3)
+        assert np.all(np.diff(probs.ravel()) < 0)  # P(above) falls as strike rises
+
+    @pytest.mark.parametrize("kwargs, match", [
+        ({"K": np.array([100.0, -1.0])}, "Strike must be positive"),
+        ({"sigma": np.array([0.3, 0.0])}, "Volatility must be positive"),
+        ({"above": np.array([1, 2])}, "Direction flags"),
+        ({"K": np.ones(3)}, "do not broadcast"),
+    ])
+    def test_batch_invalid_inputs(self, kwargs, match):
+        """Test that invalid rows or mismatched shapes are rejected."""
+        inputs = {"S0": 100.0, "K": np.array([95.0, 105.0]), "T": 0.5, "r": 0.04,
+                  "q": 0.0, "sigma": np.array([0.3, 0.3]), "above": np.array([1, 0])}
+        inputs.update(kwargs)
+        with pytest.raises(DigitalPricingError, match=match):
+            digital_price_batch(**inputs)
+
+
+class TestMakeDigitalPricer:
+    """Tests for make_digital_pricer."""
+
+    def test_pricer_matches_digital_price(self):
+        """Test that the specialized pricer agrees with digital_price."""
+        pricer = make_digital_pricer(0.5, 0.05, 0.01)
+
+        for K, sigma, direction in [(90.0, 0.2, "above"), (110.0, 0.4, "below")]:
+            result = pricer(100.0, K, sigma, direction)
+            direct = digital_price(100.0, K, 0.5, 0.05, 0.01, sigma, direction)
+            assert (result.probability, result.pv, result.d2, result.drift) == pytest.approx(
+                (direct.probability, direct.pv, direct.d2, direct.drift)
+            )
+
+    def test_invalid_expiry(self):
+        """Test that a non-positive expiry is rejected when specializing."""
+        with pytest.raises(DigitalPricingError, match="Time to expiry must be positive"):
+            make_digital_pricer(0.0, 0.05, 0.0)
+
+    def test_pricer_validates_inputs(self):
+        """Test that the pricer rejects invalid per-call inputs."""
+        pricer = make_digital_pricer(0.5, 0.05, 0.0)
+        with pytest.raises(DigitalPricingError, match="Volatility must be positive"):
+            pricer(100.0, 100.0, 0.0, "above")
+        with pytest.raises(DigitalPricingError, match="Direction must be"):
+            pricer(100.0, 100.0, 0.2, "sideways")
+
 
 class TestComputeVerdict:
     """Tests for compute_verdict function."""
@@ -443,3 +541,20 @@ class TestComputeVerdict:
         # Both should be outside tolerance
         assert verdict_low == "Cheap"
         assert verdict_high == "Expensive"
+
+    def test_batch_verdicts_match_scalar(self):
+        """Test that compute_verdicts agrees with compute_verdict element-wise."""
+        poly = np.array([0.505, 0.45, 0.55, 0.005, 0.02, 0.50])
+        fair = np.array([0.50, 0.50, 0.50, 0.0, 0.0, 0.50])
+
+        codes = compute_verdicts(poly, fair)
+
+        assert codes.dtype == np.int8
+        assert [VERDICT_LABELS[c] for c in codes] == [
+            compute_verdict(p, f) for p, f in zip(poly, fair)
+        ]
+
+    def test_batch_verdicts_shape_mismatch(self):
+        """Test that misaligned inputs are rejected."""
+        with pytest.raises(ValueError, match="Shape mismatch"):
+            compute_verdicts(np.zeros(3), np.zeros(4))
@@ -1,12 +1,15 @@
 """Tests for touch barrier pricing module."""
 
 import math
+
+import numpy as np
 import pytest
-from scipy.stats import norm
+from scipy.special import ndtr
 
 from polyarb.pricing.touch_barrier import (
     TouchPricingError,
     touch_price,
+    touch_price_batch,
     touch_price_with_sensitivity,
 )
 
@@ -43,7 +46,7 @@ class TestTouchPrice:
         # Driftless formula: P(hit) = 2 * (1 - N(|a|/(σ√T)))
         a = math.log(B / S0)
         z = abs(a) / (sigma * math.sqrt(T))
-        expected_prob = 2.0 * norm.cdf(-z)
+        expected_prob = 2.0 * ndtr(-z)
 
         assert result.probability == pytest.approx(expected_prob, abs=1e-8)
         assert result.drift == pytest.approx(0.0, abs=1e-10)
@@ -64,7 +67,7 @@ class TestTouchPrice:
         # Driftless formula: P(hit) = 2 * N(-|a|/(σ√T))
         a = math.log(B / S0)
         z = abs(a) / (sigma * math.sqrt(T))
-        expected_prob = 2.0 * norm.cdf(-z)
+        expected_prob = 2.0 * ndtr(-z)
 
         assert result.probability == pytest.approx(expected_prob, abs=1e-8)
         assert result.drift == pytest.approx(0.0, abs=1e-10)
@@ -207,10 +210,32 @@ class TestTouchPrice:
             (50.0, 40.0, 0.5, 0.02, 0.08, 0.40),
         ]
 
-        for S0, B, T, r, q, sigma in scenarios:
-            result = touch_price(S0, B, T, r, q, sigma)
-            assert 0.0 <= result.probability <= 1.0
-            assert 0.0 <= result.pv <= 1.0  # Max payout is $1
+        probs, pvs = touch_price_batch(*np.array(scenarios).T)
+
+        assert np.all((probs >= 0.0) & (probs <= 1.0))
+        assert np.all((pvs >= 0.0) & (pvs <= 1.0))  # Max payout is $1
+
+    def test_batch_matches_scalar(self):
+        """Test that touch_price_batch agrees with touch_price on every branch."""
+        scenarios = np.array([
+            # (S0, B, T, r, q, sigma)
+            (100.0, 120.0, 1.0, 0.05, 0.02, 0.20),  # Upper barrier
+            (100.0, 80.0, 1.0, 0.05, 0.02, 0.20),  # Lower barrier
+            (100.0, 110.0, 1.0, 0.02, 0.0, 0.20),  # Driftless
+            (100.0, 100.0, 0.5, 0.05, 0.0, 0.30),  # Barrier at spot
+            (50.0, 40.0, 0.5, 0.02, 0.08, 0.40),
+        ])
+
+        probs, pvs = touch_price_batch(*scenarios.T)
+
+        for row, prob, pv in zip(scenarios, probs, pvs):
+            result = touch_price(*row)
+            assert (prob, pv) == pytest.approx((result.probability, result.pv), abs=1e-12)
+
+    def test_batch_invalid_inputs(self):
+        """Test that touch_price_batch rejects invalid rows."""
+        with pytest.raises(TouchPricingError, match="Volatility must be positive"):
+            touch_price_batch(100.0, 110.0, 1.0, 0.05, 0.0, np.array([0.2, -0.1]))
 
     def test_drift_calculation(self):
         """Test that drift is calculated correctly."""
@@ -1,6 +1,14 @@
 """Tests for markdown report generation (A-G sections)."""
 
+import functools
+import re
+from collections import Counter
 from datetime import date, datetime
+
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
 from polyarb.models import (
     AnalysisInputs,
     AnalysisResults,
@@ -13,6 +21,9 @@ from polyarb.models import (
 from polyarb.report.markdown_report import render
 import math
 
+# Lettered H2 section headers, e.g. "## A. Analysis Inputs" -> ("A", "Analysis Inputs")
+_SECTION_RE = re.compile(r"^## ([A-G])\. (.+)$", re.MULTILINE)
+
 
 def create_test_report_context(
     event_type: EventType = EventType.ABOVE,
@@ -52,13 +63,14 @@ def create_test_report_context(
     r = 0.05
     q = 0.02
     sigma = 0.25
+    sqrt_T = math.sqrt(T)
+    disc = math.exp(-r * T)
+    log_moneyness = math.log(spot_price / level)
 
     if event_type == EventType.TOUCH:
         # Touch barrier pricing
-        S0 = spot_price
-        B = level
         prob = 0.60
-        pv = math.exp(-r * T) * prob
+        pv = disc * prob
         drift = r - q - 0.5 * sigma**2
 
         pricing = PricingResult(
@@ -69,19 +81,15 @@ def create_test_report_context(
         )
     else:
         # Digital option pricing
-        S0 = spot_price
-        K = level
         drift = r - q - 0.5 * sigma**2
-        d2 = (math.log(S0 / K) + drift * T) / (sigma * math.sqrt(T))
+        d2 = (log_moneyness + drift * T) / (sigma * sqrt_T)
 
         if event_type == EventType.ABOVE:
-            from scipy.stats import norm
-            prob = norm.cdf(d2)
+            prob = ndtr(d2)
         else:
-            from scipy.stats import norm
-            prob = norm.cdf(-d2)
+            prob = ndtr(-d2)
 
-        pv = math.exp(-r * T) * prob
+        pv = disc * prob
 
         pricing = PricingResult(
             probability=prob,
@@ -92,26 +100,20 @@ def create_test_report_context(
 
     # Add sensitivity analysis
     if include_sensitivity:
-        from scipy.stats import norm
-
-        shifts = [-0.03, -0.02, 0.02, 0.03]
-        for shift in shifts:
-            sigma_shifted = max(0.01, sigma + shift)
-            if event_type == EventType.TOUCH:
-                # Simplified touch calculation
-                prob_shifted = min(1.0, max(0.0, prob * (1 + shift * 2)))
-                pv_shifted = math.exp(-r * T) * prob_shifted
-            else:
-                drift_shifted = r - q - 0.5 * sigma_shifted**2
-                d2_shifted = (math.log(S0 / K) + drift_shifted * T) / (
-                    sigma_shifted * math.sqrt(T)
-                )
-                if event_type == EventType.ABOVE:
-                    prob_shifted = norm.cdf(d2_shifted)
-                else:
-                    prob_shifted = norm.cdf(-d2_shifted)
-                pv_shifted = math.exp(-r * T) * prob_shifted
-
+        shifts = np.array([-0.03, -0.02, 0.02, 0.03])
+        if event_type == EventType.TOUCH:
+            # Simplified touch calculation
+            probs_shifted = np.clip(prob * (1 + shifts * 2), 0.0, 1.0)
+        else:
+            sigma_shifted = np.maximum(0.01, sigma + shifts)
+            drift_shifted = r - q - 0.5 * sigma_shifted**2
+            d2_shifted = (log_moneyness + drift_shifted * T) / (sigma_shifted * sqrt_T)
+            probs_shifted = ndtr(d2_shifted if event_type == EventType.ABOVE else -d2_shifted)
+        pvs_shifted = disc * probs_shifted
+
+        for shift, prob_shifted, pv_shifted in zip(
+            shifts.tolist(), probs_shifted.tolist(), pvs_shifted.tolist()
+        ):
             key = f"sigma{shift:+.2f}"
             pricing.sensitivity[key] = (prob_shifted, pv_shifted)
 
@@ -144,8 +146,7 @@ def create_test_report_context(
     )
 
     # Create report context
-    log_moneyness = math.log(spot_price / level)
-    variance_term = sigma * math.sqrt(T)
+    variance_term = sigma * sqrt_T
 
     if event_type == EventType.TOUCH:
         model_name = "Touch Barrier Option"
@@ -165,77 +166,107 @@ def create_test_report_context(
     return ctx
 
 
-def test_render_returns_string():
+@functools.lru_cache(maxsize=None)
+def index_report(report: str) -> tuple[dict[str, str], frozenset[str]]:
+    """Split a rendered report into its lettered sections and its token set.
+
+    Returns ({"A": section_a_text, ...}, whitespace-separated tokens of the
+    whole report). Text before section A is keyed by "".
+    """
+    head, *parts = report.split("\n## ")
+    sections = {"": head}
+    for part in parts:
+        letter, _, _ = part.partition(".")
+        sections[letter] = part
+    return sections, frozenset(report.split())
+
+
+@pytest.fixture(scope="module")
+def rendered_report():
+    """Render reports lazily, once per distinct set of context arguments.
+
+    Tests that mutate the context before rendering build their own with
+    create_test_report_context instead.
+    """
+    cache = {}
+
+    def get(**kwargs) -> str:
+        key = tuple(sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = render(create_test_report_context(**kwargs))
+        return cache[key]
+
+    return get
+
+
+def test_render_returns_string(rendered_report):
     """Test that render returns a string."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    report = rendered_report()
     assert isinstance(report, str)
     assert len(report) > 0
 
 
-def test_all_sections_present():
+def test_all_sections_present(rendered_report):
     """Test that all A-G section headers are present."""
-    ctx = create_test_report_context()
-    report = render(ctx)
-
-    # Check for all required section headers
-    assert "# Polymarket Analysis Report" in report
-    assert "## A. Analysis Inputs" in report
-    assert "## B. Model Selection" in report
-    assert "## C. Mathematical Derivation" in report
-    assert "## D. Polymarket vs Fair Value Comparison" in report
-    assert "## E. Professional Conclusion" in report
-    assert "## F. Explanation for Non-Experts" in report
-    assert "## G. One-Sentence Takeaway" in report
-
-
-def test_section_a_contains_inputs():
+    report = rendered_report()
+
+    # Check for all required section headers, in order
+    assert report.startswith("# Polymarket Analysis Report")
+    assert _SECTION_RE.findall(report) == [
+        ("A", "Analysis Inputs"),
+        ("B", "Model Selection"),
+        ("C", "Mathematical Derivation"),
+        ("D", "Polymarket vs Fair Value Comparison"),
+        ("E", "Professional Conclusion"),
+        ("F", "Explanation for Non-Experts"),
+        ("G", "One-Sentence Takeaway"),
+    ]
+
+
+def test_section_a_contains_inputs(rendered_report):
     """Test that Section A contains key input parameters."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    sections, _ = index_report(rendered_report())
+    section_a_tokens = set(sections["A"].split())
 
     # Check for key inputs in Section A
-    assert "SPY" in report  # ticker
-    assert "$100.00" in report  # spot price
-    assert "$105.00" in report  # level
-    assert "2026-12-31" in report  # expiry
-    assert "5.00%" in report  # risk-free rate
-    assert "2.00%" in report  # div yield
-    assert "25.00%" in report  # IV
-
-
-def test_section_b_model_choice():
+    assert {
+        "SPY",  # ticker
+        "$100.00",  # spot price
+        "$105.00",  # level
+        "2026-12-31",  # expiry
+        "5.00%",  # risk-free rate
+        "2.00%",  # div yield
+        "25.00%",  # IV
+    } <= section_a_tokens
+
+
+def test_section_b_model_choice(rendered_report):
     """Test that Section B explains model choice."""
-    ctx_digital = create_test_report_context(event_type=EventType.ABOVE)
-    report_digital = render(ctx_digital)
+    report_digital = rendered_report(event_type=EventType.ABOVE)
     assert "Digital Option" in report_digital
 
-    ctx_touch = create_test_report_context(event_type=EventType.TOUCH)
-    report_touch = render(ctx_touch)
+    report_touch = rendered_report(event_type=EventType.TOUCH)
     assert "Touch Barrier" in report_touch
 
 
-def test_section_c_derivation_digital_above():
+def test_section_c_derivation_digital_above(rendered_report):
     """Test Section C derivation for digital option (above)."""
-    ctx = create_test_report_context(event_type=EventType.ABOVE)
-    report = render(ctx)
+    sections, tokens = index_report(rendered_report(event_type=EventType.ABOVE))
+    section_c = sections["C"]
 
     # Check for key formulas and terms
-    assert "Black-Scholes" in report
-    assert "Risk-Neutral Drift" in report
-    assert "μ = r - q - 0.5σ²" in report
-    assert "d₂" in report
-    assert "ln(S₀/K)" in report
-    assert "N(·)" in report  # Normal CDF
-    assert "Present Value" in report
-    assert "e^(-rT)" in report
-    assert "Sensitivity Analysis" in report
+    assert {"Black-Scholes", "d₂", "N(·)"} <= tokens  # N(·): normal CDF
+    assert "Risk-Neutral Drift" in section_c
+    assert "μ = r - q - 0.5σ²" in section_c
+    assert "ln(S₀/K)" in section_c
+    assert "Present Value" in section_c
+    assert "e^(-rT)" in section_c
+    assert "Sensitivity Analysis" in section_c
 
 
-def test_section_c_derivation_digital_below():
+def test_section_c_derivation_digital_below(rendered_report):
     """Test Section C derivation for digital option (below)."""
-    ctx = create_test_report_context(event_type=EventType.BELOW)
-    report = render(ctx)
+    report = rendered_report(event_type=EventType.BELOW)
 
     # Check for key formulas
     assert "Black-Scholes" in report
@@ -243,10 +274,9 @@ def test_section_c_derivation_digital_below():
     assert "N(-d₂)" in report or "N(" in report
 
 
-def test_section_c_derivation_touch():
+def test_section_c_derivation_touch(rendered_report):
     """Test Section C derivation for touch barrier."""
-    ctx = create_test_report_context(event_type=EventType.TOUCH, level=110.0)
-    report = render(ctx)
+    report = rendered_report(event_type=EventType.TOUCH, level=110.0)
 
     # Check for touch-specific terms
     assert "Touch Barrier" in report
@@ -256,10 +286,9 @@ def test_section_c_derivation_touch():
     assert "barrier" in report.lower()
 
 
-def test_section_d_comparison_fair():
+def test_section_d_comparison_fair(rendered_report):
     """Test Section D with fair verdict."""
-    ctx = create_test_report_context(verdict=Verdict.FAIR)
-    report = render(ctx)
+    report = rendered_report(verdict=Verdict.FAIR)
 
     # Check comparison table elements
     assert "Model Fair Value" in report
@@ -270,30 +299,27 @@ def test_section_d_comparison_fair():
     assert "✅" in report
 
 
-def test_section_d_comparison_cheap():
+def test_section_d_comparison_cheap(rendered_report):
     """Test Section D with cheap verdict."""
-    ctx = create_test_report_context(verdict=Verdict.CHEAP)
-    report = render(ctx)
+    report = rendered_report(verdict=Verdict.CHEAP)
 
     assert "Cheap" in report
     assert "📉" in report
     assert "below" in report.lower() or "underpricing" in report.lower()
 
 
-def test_section_d_comparison_expensive():
+def test_section_d_comparison_expensive(rendered_report):
     """Test Section D with expensive verdict."""
-    ctx = create_test_report_context(verdict=Verdict.EXPENSIVE)
-    report = render(ctx)
+    report = rendered_report(verdict=Verdict.EXPENSIVE)
 
     assert "Expensive" in report
     assert "📈" in report
     assert "above" in report.lower() or "overpricing" in report.lower()
 
 
-def test_section_e_conclusion_present():
+def test_section_e_conclusion_present(rendered_report):
     """Test that Section E contains professional conclusion."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    report = rendered_report()
 
     # Section E should contain technical language
     assert "## E. Professional Conclusion" in report
@@ -302,10 +328,9 @@ def test_section_e_conclusion_present():
     assert "fair value" in report.lower()
 
 
-def test_section_f_layman_present():
+def test_section_f_layman_present(rendered_report):
     """Test that Section F contains layman explanation."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    report = rendered_report()
 
     # Section F should use plain language
     assert "## F. Explanation for Non-Experts" in report
@@ -319,20 +344,18 @@ def test_section_f_layman_present():
         assert len(layman_section) > 200
 
 
-def test_section_g_takeaway_present():
+def test_section_g_takeaway_present(rendered_report):
     """Test that Section G contains one-liner takeaway."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    report = rendered_report()
 
     assert "## G. One-Sentence Takeaway" in report
     # Should mention key numbers
     assert "$" in report  # prices
 
 
-def test_sensitivity_table_included():
+def test_sensitivity_table_included(rendered_report):
     """Test that sensitivity analysis table is included."""
-    ctx = create_test_report_context(include_sensitivity=True)
-    report = render(ctx)
+    report = rendered_report(include_sensitivity=True)
 
     # Check for sensitivity table headers
     assert "Volatility Shift" in report
@@ -354,10 +377,9 @@ def test_sensitivity_table_absent_gracefully():
     # Should not crash
 
 
-def test_market_title_in_header():
+def test_market_title_in_header(rendered_report):
     """Test that market title appears in header."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    report = rendered_report()
 
     assert "Will SPY close above $105 by Dec 31, 2026?" in report
     assert "test-market-123" in report
@@ -390,59 +412,48 @@ def test_custom_takeaway_text():
     assert "Custom one-liner takeaway for testing." in report
 
 
-def test_touch_event_descriptions():
+def test_touch_event_descriptions(rendered_report):
     """Test proper description of touch events."""
-    ctx = create_test_report_context(event_type=EventType.TOUCH, level=120.0)
-    report = render(ctx)
+    report = rendered_report(event_type=EventType.TOUCH, level=120.0)
 
     # Should mention "touch" or "barrier"
     assert "touch" in report.lower() or "barrier" in report.lower()
     assert "$120.00" in report
 
 
-def test_above_event_descriptions():
+def test_above_event_descriptions(rendered_report):
     """Test proper description of above events."""
-    ctx = create_test_report_context(event_type=EventType.ABOVE, level=105.0)
-    report = render(ctx)
+    report = rendered_report(event_type=EventType.ABOVE, level=105.0)
 
     assert "above" in report.lower()
     assert "$105.00" in report
 
 
-def test_below_event_descriptions():
+def test_below_event_descriptions(rendered_report):
     """Test proper description of below events."""
-    ctx = create_test_report_context(event_type=EventType.BELOW, level=95.0)
-    report = render(ctx)
+    report = rendered_report(event_type=EventType.BELOW, level=95.0)
 
     assert "below" in report.lower()
     assert "$95.00" in report
 
 
-def test_report_markdown_structure():
+def test_report_markdown_structure(rendered_report):
     """Test that report has valid markdown structure."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    report = rendered_report()
 
     # Check for proper markdown headers
     assert report.count("# Polymarket Analysis Report") == 1  # Only one H1
-    # Multiple H2 sections
-    assert report.count("## A.") == 1
-    assert report.count("## B.") == 1
-    assert report.count("## C.") == 1
-    assert report.count("## D.") == 1
-    assert report.count("## E.") == 1
-    assert report.count("## F.") == 1
-    assert report.count("## G.") == 1
+    # Each lettered H2 section exactly once
+    assert Counter(letter for letter, _ in _SECTION_RE.findall(report)) == Counter("ABCDEFG")
 
     # Check for markdown tables (at least in Section A and D)
     assert "|" in report
     assert "---|" in report
 
 
-def test_numeric_formatting():
+def test_numeric_formatting(rendered_report):
     """Test that numbers are formatted consistently."""
-    ctx = create_test_report_context(spot_price=12345.67, level=12000.00)
-    report = render(ctx)
+    report = rendered_report(spot_price=12345.67, level=12000.00)
 
     # Check comma separators for large numbers
     assert "12,345.67" in report or "$12345.67" in report
@@ -475,30 +486,27 @@ def test_warnings_section_if_present():
     assert isinstance(report, str)
 
 
-def test_data_sources_in_section_a():
+def test_data_sources_in_section_a(rendered_report):
     """Test that data sources are documented in Section A."""
-    ctx = create_test_report_context()
-    report = render(ctx)
+    report = rendered_report()
 
     assert "Data Sources" in report
     assert "yfinance option chain interpolation" in report
     assert "manual input" in report
 
 
-def test_all_event_types_render():
+@pytest.mark.parametrize("event_type", [EventType.TOUCH, EventType.ABOVE, EventType.BELOW])
+def test_all_event_types_render(rendered_report, event_type):
     """Test that all event types can be rendered without errors."""
-    for event_type in [EventType.TOUCH, EventType.ABOVE, EventType.BELOW]:
-        ctx = create_test_report_context(event_type=event_type)
-        report = render(ctx)
-        assert len(report) > 1000  # Should be substantial
-        assert "## A." in report
-        assert "## G." in report
+    report = rendered_report(event_type=event_type)
+    assert len(report) > 1000  # Should be substantial
+    assert "## A." in report
+    assert "## G." in report
 
 
-def test_all_verdicts_render():
+@pytest.mark.parametrize("verdict", [Verdict.CHEAP, Verdict.FAIR, Verdict.EXPENSIVE])
+def test_all_verdicts_render(rendered_report, verdict):
     """Test that all verdicts can be rendered without errors."""
-    for verdict in [Verdict.CHEAP, Verdict.FAIR, Verdict.EXPENSIVE]:
-        ctx = create_test_report_context(verdict=verdict)
-        report = render(ctx)
-        assert len(report) > 1000
-        assert verdict.value in report
+    report = rendered_report(verdict=verdict)
+    assert len(report) > 1000
+    assert verdict.value in report
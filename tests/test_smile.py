@@ -0,0 +1,68 @@
+"""
+Tests for SVI smile fitting.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from polyarb.vol.iv_extract import ChainView
+from polyarb.vol.smile import SmileFitError, fit_smile, svi_total_variance
+
+SVI_PARAMS = (0.01, 0.08, -0.4, 0.02, 0.15)
+
+
+@pytest.fixture
+def svi_chain():
+    """Chain whose IVs lie exactly on a known SVI smile (T=0.25, ref=100)."""
+    strikes = np.linspace(70, 130, 25)
+    w = svi_total_variance(np.log(strikes / 100.0), *SVI_PARAMS)
+    return pd.DataFrame({'strike': strikes, 'impliedVolatility': np.sqrt(w / 0.25)})
+
+
+class TestFitSmile:
+    """Tests for fit_smile."""
+
+    def test_recovers_known_parameters(self, svi_chain):
+        """Fitting an exact SVI smile recovers its parameters."""
+        fit = fit_smile(svi_chain, 0.25, 100.0)
+        assert fit[:5] == pytest.approx(SVI_PARAMS, abs=1e-4)
+        np.testing.assert_allclose(
+            fit.iv(svi_chain['strike'].to_numpy()),
+            svi_chain['impliedVolatility'].to_numpy(),
+            atol=1e-6,
+        )
+
+    def test_accepts_chain_view(self, svi_chain):
+        """A prebuilt ChainView gives the same fit as the DataFrame."""
+        from_frame = fit_smile(svi_chain, 0.25, 100.0)
+        from_view = fit_smile(ChainView.from_frame(svi_chain), 0.25, 100.0)
+        assert from_view == pytest.approx(from_frame)
+
+    def test_scalar_and_array_evaluation(self, svi_chain):
+        """iv returns a float for a scalar strike and an array for arrays."""
+        fit = fit_smile(svi_chain, 0.25, 100.0)
+        assert isinstance(fit.iv(100.0), float)
+        assert fit.iv(np.array([95.0, 105.0])).shape == (2,)
+
+    def test_ignores_missing_ivs(self, svi_chain):
+        """NaN IVs are dropped before fitting."""
+        chain = svi_chain.copy()
+        chain.loc[::3, 'impliedVolatility'] = np.nan
+        fit = fit_smile(chain, 0.25, 100.0)
+        assert fit.iv(100.0) == pytest.approx(fit_smile(svi_chain, 0.25, 100.0).iv(100.0), abs=1e-4)
+
+    def test_too_few_strikes(self):
+        """Fewer than five usable quotes cannot determine the fit."""
+        chain = pd.DataFrame({
+            'strike': [90, 100, 110, 120],
+            'impliedVolatility': [0.30, 0.25, 0.26, 0.30],
+        })
+        with pytest.raises(SmileFitError, match="at least 5 strikes"):
+            fit_smile(chain, 0.25, 100.0)
+
+    @pytest.mark.parametrize("T, ref", [(0.0, 100.0), (0.25, -1.0)])
+    def test_invalid_inputs(self, svi_chain, T, ref):
+        """Non-positive time to expiry or reference price is rejected."""
+        with pytest.raises(SmileFitError, match="must be positive"):
+            fit_smile(svi_chain, T, ref)
@@ -5,14 +5,27 @@ Tests for term structure interpolation module.
 import warnings
 from datetime import date
 
+import numpy as np
 import pytest
 
 from polyarb.vol.term_structure import (
+    Bracket,
+    BracketingCache,
+    TermStructure,
     TermStructureError,
     compute_time_to_expiry,
+    compute_time_to_expiry_batch,
     find_bracketing_expiries,
+    find_bracketing_expiries_many,
+    find_bracketing_expiries_sorted,
     interpolate_iv_term_structure,
+    interpolate_iv_term_structure_many,
+    interpolate_iv_surface,
+    interpolate_iv_times,
+    interpolate_total_variance,
     interpolate_variance,
+    interpolate_variance_vec,
+    warm_up,
 )
 
 
@@ -29,6 +42,16 @@ class TestFindBracketingExpiries:
         assert before == date(2024, 6, 21)
         assert after is None
 
+    def test_returns_named_bracket(self):
+        """Test that the result exposes before/after by name."""
+        expiries = [date(2024, 3, 15), date(2024, 6, 21)]
+
+        bracket = find_bracketing_expiries(date(2024, 5, 1), expiries)
+
+        assert isinstance(bracket, Bracket)
+        assert bracket.before == date(2024, 3, 15)
+        assert bracket.after == date(2024, 6, 21)
+
     def test_between_two_expiries(self):
         """Test when target is between two expiries."""
         target = date(2024, 5, 1)
@@ -110,6 +133,76 @@ class TestFindBracketingExpiries:
         assert after == date(2024, 6, 21)
 
 
+class TestFindBracketingExpiriesSorted:
+    """Tests for find_bracketing_expiries_sorted function."""
+
+    expiries = [date(2024, 3, 15), date(2024, 6, 21), date(2024, 9, 20)]
+
+    def test_exact_match(self):
+        """Test exact match on a sorted sequence."""
+        assert find_bracketing_expiries_sorted(date(2024, 6, 21), self.expiries) == (
+            date(2024, 6, 21), None
+        )
+
+    def test_between_and_outside(self):
+        """Test bracketing inside and beyond the sorted range."""
+        assert find_bracketing_expiries_sorted(date(2024, 5, 1), self.expiries) == (
+            date(2024, 3, 15), date(2024, 6, 21)
+        )
+        assert find_bracketing_expiries_sorted(date(2024, 1, 1), self.expiries) == (
+            None, date(2024, 3, 15)
+        )
+        assert find_bracketing_expiries_sorted(date(2024, 12, 31), self.expiries) == (
+            date(2024, 9, 20), None
+        )
+
+    def test_empty(self):
+        """Test with no expiries."""
+        assert find_bracketing_expiries_sorted(date(2024, 5, 1), []) == (None, None)
+
+
+class TestFindBracketingExpiriesMany:
+    """Tests for find_bracketing_expiries_many function."""
+
+    def test_matches_scalar(self):
+        """Test that every target matches find_bracketing_expiries on unsorted input."""
+        expiries = [date(2024, 9, 20), date(2024, 3, 15), date(2024, 6, 21), date(2024, 3, 15)]
+        targets = [
+            date(2024, 1, 1), date(2024, 3, 15), date(2024, 5, 1),
+            date(2024, 9, 20), date(2024, 12, 31),
+        ]
+
+        assert find_bracketing_expiries_many(targets, expiries) == [
+            find_bracketing_expiries(target, expiries) for target in targets
+        ]
+
+    def test_empty(self):
+        """Test with no expiries or no targets."""
+        assert find_bracketing_expiries_many([date(2024, 5, 1)], []) == [(None, None)]
+        assert find_bracketing_expiries_many([], [date(2024, 5, 1)]) == []
+
+
+class TestBracketingCache:
+    """Tests for BracketingCache."""
+
+    expiries = [date(2024, 9, 20), date(2024, 3, 15), date(2024, 6, 21)]
+
+    def test_sequential_and_random_targets(self):
+        """Test that lookups in any order match find_bracketing_expiries."""
+        cache = BracketingCache(self.expiries)
+        targets = [
+            date(2024, 1, 1), date(2024, 3, 15), date(2024, 4, 1), date(2024, 5, 1),
+            date(2024, 7, 1), date(2024, 9, 20), date(2024, 12, 31),
+            date(2024, 2, 1), date(2024, 6, 21), date(2024, 6, 20),
+        ]
+        for target in targets:
+            assert cache.find(target) == find_bracketing_expiries(target, self.expiries)
+
+    def test_empty(self):
+        """Test with no expiries."""
+        assert BracketingCache([]).find(date(2024, 5, 1)) == (None, None)
+
+
 class TestInterpolateVariance:
     """Tests for interpolate_variance function."""
 
@@ -144,8 +237,8 @@ class TestInterpolateVariance:
 
         result = interpolate_variance(iv1, t1, iv2, t2, target_t)
 
-        # At t1, should return iv1
-        assert result == pytest.approx(iv1, abs=1e-6)
+        # At t1, should return iv1 exactly
+        assert result == iv1
 
     def test_interpolation_at_t2(self):
         """Test interpolation at second time point."""
@@ -157,8 +250,8 @@ class TestInterpolateVariance:
 
         result = interpolate_variance(iv1, t1, iv2, t2, target_t)
 
-        # At t2, should return iv2
-        assert result == pytest.approx(iv2, abs=1e-6)
+        # At t2, should return iv2 exactly
+        assert result == iv2
 
     def test_increasing_variance_term_structure(self):
         """Test with increasing variance (normal term structure)."""
@@ -224,6 +317,133 @@ class TestInterpolateVariance:
             interpolate_variance(0.20, 0.25, 0.30, 0.50, 0.75)
 
 
+class TestInterpolateTotalVariance:
+    """Tests for interpolate_total_variance function."""
+
+    def test_returns_total_variance(self):
+        """Test that the result is σ²T of the interpolated IV."""
+        w = interpolate_total_variance(0.20, 0.25, 0.30, 0.50, 0.40)
+        iv = interpolate_variance(0.20, 0.25, 0.30, 0.50, 0.40)
+
+        assert w == pytest.approx(iv ** 2 * 0.40)
+
+    def test_endpoints(self):
+        """Test that endpoints return the endpoint total variances."""
+        assert interpolate_total_variance(0.20, 0.25, 0.30, 0.50, 0.25) == pytest.approx(0.01)
+        assert interpolate_total_variance(0.20, 0.25, 0.30, 0.50, 0.50) == pytest.approx(0.045)
+
+    def test_error_on_reversed_times(self):
+        """Test that t1 >= t2 raises an error."""
+        with pytest.raises(TermStructureError, match="First expiry must be before second"):
+            interpolate_total_variance(0.20, 0.50, 0.30, 0.25, 0.40)
+
+    def test_error_on_nan_input(self):
+        """Test that NaN inputs are rejected rather than propagated."""
+        with pytest.raises(TermStructureError, match="Invalid inputs"):
+            interpolate_total_variance(float("nan"), 0.25, 0.30, 0.50, 0.40)
+
+
+class TestInterpolateVarianceVec:
+    """Tests for interpolate_variance_vec function."""
+
+    def test_matches_scalar(self):
+        """Test that each element matches interpolate_variance."""
+        target_ts = np.array([0.25, 0.3, 0.4, 0.5])
+
+        result = interpolate_variance_vec(0.20, 0.25, 0.30, 0.50, target_ts)
+
+        expected = [interpolate_variance(0.20, 0.25, 0.30, 0.50, t) for t in target_ts]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_per_target_brackets(self):
+        """Test that bracketing pairs broadcast element-wise with targets."""
+        result = interpolate_variance_vec(
+            np.array([0.20, 0.25]),
+            np.array([0.25, 0.50]),
+            np.array([0.30, 0.35]),
+            np.array([0.50, 1.00]),
+            np.array([0.40, 0.75]),
+        )
+
+        assert result[0] == pytest.approx(interpolate_variance(0.20, 0.25, 0.30, 0.50, 0.40))
+        assert result[1] == pytest.approx(interpolate_variance(0.25, 0.50, 0.35, 1.00, 0.75))
+
+    def test_error_on_target_outside_range(self):
+        """Test that any out-of-range target raises an error."""
+        with pytest.raises(TermStructureError, match="must be between"):
+            interpolate_variance_vec(0.20, 0.25, 0.30, 0.50, np.array([0.3, 0.6]))
+
+    def test_error_on_non_positive_iv(self):
+        """Test that a non-positive IV raises an error."""
+        with pytest.raises(TermStructureError, match="All IVs must be positive"):
+            interpolate_variance_vec(0.0, 0.25, 0.30, 0.50, np.array([0.3]))
+
+
+class TestInterpolateIVTimes:
+    """Tests for interpolate_iv_times function."""
+
+    ts = np.array([0.25, 0.50, 1.00])
+    ivs = np.array([0.20, 0.30, 0.25])
+
+    def test_matches_interpolate_variance_and_clamps(self):
+        """Test interior points against interpolate_variance and clamping outside."""
+        targets = np.array([0.10, 0.25, 0.40, 0.75, 1.00, 2.00])
+
+        result = interpolate_iv_times(targets, self.ts, self.ivs)
+
+        expected = [
+            0.20, 0.20,
+            interpolate_variance(0.20, 0.25, 0.30, 0.50, 0.40),
+            interpolate_variance(0.30, 0.50, 0.25, 1.00, 0.75),
+            0.25, 0.25,
+        ]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    @pytest.mark.parametrize("ts, ivs, targets, match", [
+        ([0.5, 0.25], [0.2, 0.3], [0.3], "strictly increasing"),
+        ([0.25, 0.5], [0.2, 0.0], [0.3], "IVs must be positive"),
+        ([0.25, 0.5], [0.2], [0.3], "equal shape"),
+        ([0.25, 0.5], [0.2, 0.3], [0.0], "target times must be positive"),
+    ])
+    def test_invalid_inputs(self, ts, ivs, targets, match):
+        """Test that malformed inputs are rejected."""
+        with pytest.raises(TermStructureError, match=match):
+            interpolate_iv_times(targets, ts, ivs)
+
+
+class TestInterpolateIVSurface:
+    """Tests for interpolate_iv_surface function."""
+
+    def test_rows_match_interpolate_iv_times(self):
+        """Test each strike row against the 1-D interpolator."""
+        ts = np.array([[0.25, 0.50, 1.00], [0.10, 0.50, 2.00]])
+        ivs = np.array([[0.20, 0.30, 0.25], [0.50, 0.45, 0.40]])
+        targets = np.array([0.05, 0.25, 0.40, 0.75, 1.50, 3.00])
+
+        result = interpolate_iv_surface(targets, ts, ivs)
+
+        assert result.shape == (2, 6)
+        for s in range(2):
+            np.testing.assert_allclose(
+                result[s], interpolate_iv_times(targets, ts[s], ivs[s]), rtol=1e-12
+            )
+
+    def test_invalid_inputs(self):
+        """Test shape and monotonicity checks."""
+        with pytest.raises(TermStructureError, match="2-D expiry times"):
+            interpolate_iv_surface([0.3], [0.25, 0.5], [0.2, 0.3])
+        with pytest.raises(TermStructureError, match="strictly increasing"):
+            interpolate_iv_surface([0.3], [[0.25, 0.5], [0.5, 0.25]], [[0.2, 0.3], [0.2, 0.3]])
+
+    def test_warm_up(self):
+        """Test that compiling the kernels ahead of time leaves results unchanged."""
+        warm_up()
+
+        result = interpolate_iv_surface([0.4], [[0.25, 0.5]], [[0.2, 0.3]])
+
+        assert result[0, 0] == pytest.approx(interpolate_variance(0.20, 0.25, 0.30, 0.50, 0.40))
+
+
 class TestInterpolateIVTermStructure:
     """Tests for interpolate_iv_term_structure function."""
 
@@ -387,6 +607,119 @@ class TestInterpolateIVTermStructure:
         assert result == 0.25
 
 
+class TestInterpolateIVTermStructureMany:
+    """Tests for interpolate_iv_term_structure_many function."""
+
+    def test_matches_scalar_between_expiries(self):
+        """Test that interior targets match the scalar function."""
+        pairs = [
+            (date(2024, 3, 15), 0.20),
+            (date(2024, 6, 21), 0.25),
+            (date(2024, 9, 20), 0.30),
+        ]
+        ref_date = date(2024, 1, 1)
+        targets = [date(2024, 4, 1), date(2024, 6, 21), date(2024, 8, 1)]
+
+        result = interpolate_iv_term_structure_many(targets, pairs, ref_date)
+
+        expected = [interpolate_iv_term_structure(t, pairs, ref_date) for t in targets]
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_unsorted_pairs(self):
+        """Test that expiry order in the input does not matter."""
+        pairs = [
+            (date(2024, 9, 20), 0.30),
+            (date(2024, 3, 15), 0.20),
+            (date(2024, 6, 21), 0.25),
+        ]
+        ref_date = date(2024, 1, 1)
+
+        result = interpolate_iv_term_structure_many([date(2024, 3, 15)], pairs, ref_date)
+
+        assert result[0] == 0.20
+
+    def test_out_of_range_targets_warn_once_per_case(self):
+        """Test that edge targets use nearest expiries with one warning per case."""
+        pairs = [
+            (date(2024, 3, 15), 0.20),
+            (date(2024, 6, 21), 0.25),
+        ]
+        ref_date = date(2024, 1, 1)
+        targets = [date(2024, 1, 15), date(2024, 2, 1), date(2024, 12, 31)]
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = interpolate_iv_term_structure_many(targets, pairs, ref_date)
+
+            messages = [str(x.message) for x in w]
+            assert len(messages) == 2
+            assert "before all available expiries" in messages[0]
+            assert "after all available expiries" in messages[1]
+
+        np.testing.assert_array_equal(result, [0.20, 0.20, 0.25])
+
+    def test_expiry_at_reference_date_uses_future_expiry(self):
+        """Test fallback when the lower bracket is not after the reference date."""
+        pairs = [
+            (date(2024, 1, 1), 0.20),
+            (date(2024, 3, 15), 0.25),
+        ]
+        ref_date = date(2024, 1, 1)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            result = interpolate_iv_term_structure_many([date(2024, 2, 1)], pairs, ref_date)
+
+            assert len(w) == 1
+            assert "not after reference date" in str(w[0].message)
+
+        assert result[0] == 0.25
+
+    def test_negative_iv_raises_error(self):
+        """Test that negative IV in pairs raises an error."""
+        pairs = [(date(2024, 3, 15), -0.20)]
+
+        with pytest.raises(TermStructureError, match="All IVs must be positive"):
+            interpolate_iv_term_structure_many([date(2024, 5, 1)], pairs, date(2024, 1, 1))
+
+
+class TestTermStructure:
+    """Tests for TermStructure."""
+
+    pairs = [
+        (date(2024, 9, 20), 0.30),
+        (date(2024, 3, 15), 0.20),
+        (date(2024, 6, 21), 0.25),
+    ]
+    ref_date = date(2024, 1, 1)
+
+    def test_precomputes_total_variance(self):
+        """Test that total variance is stored per sorted expiry."""
+        ts = TermStructure(self.pairs, self.ref_date)
+        np.testing.assert_allclose(ts.total_variances, ts.ivs ** 2 * ts.days / 365.0)
+        assert ts.ivs.tolist() == [0.20, 0.25, 0.30]
+
+    def test_iv_at_matches_scalar(self):
+        """Test that repeated lookups match interpolate_iv_term_structure."""
+        ts = TermStructure(self.pairs, self.ref_date)
+        for target in (date(2024, 4, 1), date(2024, 6, 21), date(2024, 8, 1)):
+            assert ts.iv_at(target) == pytest.approx(
+                interpolate_iv_term_structure(target, self.pairs, self.ref_date), rel=1e-12
+            )
+
+    def test_repeated_expiry_keeps_last_iv(self):
+        """Test that a repeated expiry keeps the IV given last."""
+        pairs = self.pairs + [(date(2024, 3, 15), 0.22), (date(2024, 6, 21), 0.27)]
+        ts = TermStructure(pairs, self.ref_date)
+        assert ts.ivs.tolist() == [0.22, 0.27, 0.30]
+        assert ts.days.tolist() == [74, 172, 263]
+
+    def test_empty_pairs(self):
+        """Test that no pairs is rejected at construction."""
+        with pytest.raises(TermStructureError, match="No expiry-IV pairs"):
+            TermStructure([], self.ref_date)
+
+
 class TestComputeTimeToExpiry:
     """Tests for compute_time_to_expiry function."""
 
@@ -470,3 +803,27 @@ class TestComputeTimeToExpiry:
 
         # Should be approximately 5 years (accounting for leap years)
         assert 4.9 < result < 5.1
+
+
+class TestComputeTimeToExpiryBatch:
+    """Tests for compute_time_to_expiry_batch function."""
+
+    def test_matches_scalar(self):
+        """Test that each element matches compute_time_to_expiry."""
+        ref = date(2024, 1, 1)
+        expiries = [date(2024, 7, 1), date(2025, 1, 1), date(2024, 1, 2)]
+
+        result = compute_time_to_expiry_batch(expiries, ref)
+
+        assert result.dtype == np.float64
+        assert result.tolist() == [compute_time_to_expiry(e, ref) for e in expiries]
+
+    def test_expired_raises(self):
+        """Test that any expiry on or before the reference date is rejected."""
+        ref = date(2024, 1, 1)
+        with pytest.raises(TermStructureError, match="2023-12-31 is not after"):
+            compute_time_to_expiry_batch([date(2024, 7, 1), date(2023, 12, 31)], ref)
+
+    def test_empty(self):
+        """Test with no expiries."""
+        assert compute_time_to_expiry_batch([], date(2024, 1, 1)).shape == (0,)
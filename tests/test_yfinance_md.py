@@ -1,12 +1,14 @@
 """Tests for yfinance market data client."""
 
+import asyncio
 import warnings
 from datetime import date
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
 
 import pandas as pd
 import pytest
 
+from polyarb.clients import yfinance_md
 from polyarb.clients.yfinance_md import YFMarketData, YFinanceClientError
 
 
@@ -16,376 +18,411 @@ def client():
     return YFMarketData()
 
 
-class TestGetSpot:
-    """Tests for get_spot method."""
+def _raise(exc):
+    """Callable that raises ``exc`` whatever it is called with."""
+    def raiser(*args, **kwargs):
+        raise exc
+    return raiser
 
-    def test_get_spot_current_price(self, client):
-        """Test getting spot price from currentPrice field."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {'currentPrice': 450.25}
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            spot = client.get_spot('SPY')
-            assert spot == 450.25
-
-    def test_get_spot_regular_market_price(self, client):
-        """Test getting spot price from regularMarketPrice field."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {'regularMarketPrice': 450.25}
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            spot = client.get_spot('SPY')
-            assert spot == 450.25
-
-    def test_get_spot_previous_close(self, client):
-        """Test getting spot price from previousClose field."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {'previousClose': 450.25}
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            spot = client.get_spot('SPY')
-            assert spot == 450.25
-
-    def test_get_spot_from_history_fallback(self, client):
-        """Test fallback to history when info fields unavailable."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {}
-
-        # Create mock history DataFrame
-        hist_data = pd.DataFrame({
-            'Close': [450.25, 451.00, 452.50]
-        })
-        mock_ticker.history.return_value = hist_data
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            spot = client.get_spot('SPY')
-            assert spot == 452.50  # Last close from history
-
-    def test_get_spot_invalid_ticker(self, client):
-        """Test error when ticker has no data."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {}
-        mock_ticker.history.return_value = pd.DataFrame()  # Empty DataFrame
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with pytest.raises(YFinanceClientError, match="No price data available"):
-                client.get_spot('INVALID')
-
-    def test_get_spot_zero_price(self, client):
-        """Test error when price is zero or negative."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {'currentPrice': 0}
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with pytest.raises(YFinanceClientError, match="Invalid spot price"):
-                client.get_spot('SPY')
 
-    def test_get_spot_negative_price(self, client):
-        """Test error when price is negative."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {'currentPrice': -100}
+@pytest.fixture(autouse=True)
+def _no_cache(tmp_path, monkeypatch):
+    """Point the on-disk response cache at a per-test directory."""
+    monkeypatch.setenv("POLYARB_CACHE_DIR", str(tmp_path))
+
+
+@pytest.fixture(autouse=True)
+def yf_ticker(monkeypatch):
+    """Route yfinance.Ticker to whatever the test stores under 't' (raised if an exception)."""
+    holder = {}
+
+    def fake_ticker(*_args, **_kwargs):
+        ticker = holder['t']
+        if isinstance(ticker, Exception):
+            raise ticker
+        return ticker
+
+    monkeypatch.setattr('yfinance.Ticker', fake_ticker)
+    return holder
+
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with pytest.raises(YFinanceClientError, match="Invalid spot price"):
+@pytest.fixture
+def recorded_warnings():
+    """Record every warning raised during the test."""
+    with warnings.catch_warnings(record=True) as records:
+        warnings.simplefilter("always")
+        yield records
+
+
+def _warned(records, text):
+    """Whether any recorded warning message contains ``text`` (case-insensitive)."""
+    text = text.lower()
+    return any(text in str(record.message).lower() for record in records)
+
+
+@pytest.fixture(scope="module")
+def ticker_factory():
+    """Build plain yfinance.Ticker stand-ins (much cheaper than MagicMock)."""
+    def make(info=None, options=(), history=None, calls=None, puts=None, option_chain=None):
+        hist = pd.DataFrame() if history is None else history
+        chain = SimpleNamespace(calls=calls, puts=puts)
+        return SimpleNamespace(
+            info={} if info is None else info,
+            options=options,
+            history=lambda **_: hist,
+            option_chain=option_chain or (lambda _expiry: chain),
+        )
+    return make
+
+
+# Canonical 3-strike chains built once per module; tests derive variants with
+# .assign()/.drop() (get_chain copies its input, so these are never mutated)
+@pytest.fixture(scope="module")
+def base_calls_df():
+    """Call side of a valid option chain."""
+    return pd.DataFrame({
+        'strike': [440, 445, 450],
+        'lastPrice': [10.5, 7.2, 4.1],
+        'bid': [10.4, 7.1, 4.0],
+        'ask': [10.6, 7.3, 4.2],
+        'volume': [100, 200, 150],
+        'impliedVolatility': [0.20, 0.21, 0.22]
+    })
+
+
+@pytest.fixture(scope="module")
+def base_puts_df():
+    """Put side of a valid option chain."""
+    return pd.DataFrame({
+        'strike': [440, 445, 450],
+        'lastPrice': [2.1, 4.5, 7.8],
+        'bid': [2.0, 4.4, 7.7],
+        'ask': [2.2, 4.6, 7.9],
+        'volume': [80, 120, 90],
+        'impliedVolatility': [0.19, 0.20, 0.21]
+    })
+
+
+class TestGetSpot:
+    """Tests for get_spot method."""
+
+    @pytest.mark.parametrize("info, history, expected, raises", [
+        # Price fields in order of preference
+        ({'currentPrice': 450.25}, None, 450.25, None),
+        ({'regularMarketPrice': 450.25}, None, 450.25, None),
+        ({'previousClose': 450.25}, None, 450.25, None),
+        # Fallback to the last close in history when info has no price
+        ({}, pd.DataFrame({'Close': [450.25, 451.00, 452.50]}), 452.50, None),
+        ({}, pd.DataFrame(), None, "No price data available"),
+        ({'currentPrice': 0}, None, None, "Invalid spot price"),
+        ({'currentPrice': -100}, None, None, "Invalid spot price"),
+    ], ids=[
+        "current_price", "regular_market_price", "previous_close",
+        "history_fallback", "invalid_ticker", "zero_price", "negative_price",
+    ])
+    def test_get_spot(
+        self, client, yf_ticker, ticker_factory, info, history, expected, raises
+    ):
+        """Test spot price lookup across info fields, history and invalid prices."""
+        yf_ticker['t'] = ticker_factory(info=info, history=history)
+
+        if raises:
+            with pytest.raises(YFinanceClientError, match=raises):
                 client.get_spot('SPY')
+        else:
+            assert client.get_spot('SPY') == expected
 
-    def test_get_spot_exception_handling(self, client):
+    def test_get_spot_exception_handling(self, client, yf_ticker):
         """Test generic exception handling."""
-        with patch('yfinance.Ticker', side_effect=Exception("Network error")):
-            with pytest.raises(YFinanceClientError, match="Error fetching spot price"):
-                client.get_spot('SPY')
+        yf_ticker['t'] = Exception("Network error")
+        with pytest.raises(YFinanceClientError, match="Error fetching spot price"):
+            client.get_spot('SPY')
 
 
 class TestGetOptionExpiries:
     """Tests for get_option_expiries method."""
 
-    def test_get_option_expiries_success(self, client):
+    def test_get_option_expiries_success(self, client, yf_ticker, ticker_factory):
         """Test getting option expiries."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19', '2024-02-16', '2024-03-15')
+        mock_ticker = ticker_factory(options=('2024-01-19', '2024-02-16', '2024-03-15'))
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            expiries = client.get_option_expiries('SPY')
-            assert len(expiries) == 3
-            assert expiries[0] == date(2024, 1, 19)
-            assert expiries[1] == date(2024, 2, 16)
-            assert expiries[2] == date(2024, 3, 15)
+        yf_ticker['t'] = mock_ticker
+        expiries = client.get_option_expiries('SPY')
+        assert len(expiries) == 3
+        assert expiries[0] == date(2024, 1, 19)
+        assert expiries[1] == date(2024, 2, 16)
+        assert expiries[2] == date(2024, 3, 15)
 
-    def test_get_option_expiries_sorted(self, client):
+    def test_get_option_expiries_sorted(self, client, yf_ticker, ticker_factory):
         """Test that expiries are returned sorted."""
-        mock_ticker = MagicMock()
         # Provide unsorted dates
-        mock_ticker.options = ('2024-03-15', '2024-01-19', '2024-02-16')
+        mock_ticker = ticker_factory(options=('2024-03-15', '2024-01-19', '2024-02-16'))
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            expiries = client.get_option_expiries('SPY')
-            assert expiries[0] == date(2024, 1, 19)
-            assert expiries[1] == date(2024, 2, 16)
-            assert expiries[2] == date(2024, 3, 15)
+        yf_ticker['t'] = mock_ticker
+        expiries = client.get_option_expiries('SPY')
+        assert expiries[0] == date(2024, 1, 19)
+        assert expiries[1] == date(2024, 2, 16)
+        assert expiries[2] == date(2024, 3, 15)
 
-    def test_get_option_expiries_no_options(self, client):
+    def test_get_option_expiries_no_options(self, client, yf_ticker, ticker_factory):
         """Test error when ticker has no options."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ()  # Empty tuple
+        mock_ticker = ticker_factory(options=())  # Empty tuple
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with pytest.raises(YFinanceClientError, match="No option expiries available"):
-                client.get_option_expiries('BTC-USD')
+        yf_ticker['t'] = mock_ticker
+        with pytest.raises(YFinanceClientError, match="No option expiries available"):
+            client.get_option_expiries('BTC-USD')
 
-    def test_get_option_expiries_invalid_format(self, client):
+    def test_get_option_expiries_invalid_format(
+        self, client, yf_ticker, ticker_factory, recorded_warnings
+    ):
         """Test handling of invalid date formats."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19', 'invalid-date', '2024-02-16')
+        mock_ticker = ticker_factory(options=('2024-01-19', 'invalid-date', '2024-02-16'))
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                expiries = client.get_option_expiries('SPY')
+        yf_ticker['t'] = mock_ticker
+        expiries = client.get_option_expiries('SPY')
 
-                # Should skip invalid date and warn
-                assert len(expiries) == 2
-                assert len(w) == 1
-                assert "invalid expiry date" in str(w[0].message).lower()
+        # Should skip invalid date and warn
+        assert len(expiries) == 2
+        assert len(recorded_warnings) == 1
+        assert _warned(recorded_warnings, "invalid expiry date")
 
-    def test_get_option_expiries_all_invalid(self, client):
+    def test_get_option_expiries_all_invalid(
+        self, client, yf_ticker, ticker_factory, recorded_warnings
+    ):
         """Test error when all expiries have invalid format."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('invalid1', 'invalid2')
+        mock_ticker = ticker_factory(options=('invalid1', 'invalid2'))
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with warnings.catch_warnings(record=True):
-                warnings.simplefilter("always")
-                with pytest.raises(YFinanceClientError, match="No valid option expiries"):
-                    client.get_option_expiries('SPY')
+        yf_ticker['t'] = mock_ticker
+        with pytest.raises(YFinanceClientError, match="No valid option expiries"):
+            client.get_option_expiries('SPY')
 
-    def test_get_option_expiries_exception_handling(self, client):
+    def test_get_option_expiries_exception_handling(self, client, yf_ticker):
         """Test generic exception handling."""
-        with patch('yfinance.Ticker', side_effect=Exception("Network error")):
-            with pytest.raises(YFinanceClientError, match="Error fetching option expiries"):
-                client.get_option_expiries('SPY')
+        yf_ticker['t'] = Exception("Network error")
+        with pytest.raises(YFinanceClientError, match="Error fetching option expiries"):
+            client.get_option_expiries('SPY')
 
 
 class TestGetChain:
     """Tests for get_chain method."""
 
-    def test_get_chain_success(self, client):
+    def test_get_chain_success(
+        self, client, yf_ticker, ticker_factory, base_calls_df, base_puts_df
+    ):
         """Test getting option chain with valid IV data."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19',)
-
-        # Create mock option chain data
-        calls_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'lastPrice': [10.5, 7.2, 4.1],
-            'bid': [10.4, 7.1, 4.0],
-            'ask': [10.6, 7.3, 4.2],
-            'volume': [100, 200, 150],
-            'impliedVolatility': [0.20, 0.21, 0.22]
-        })
-        puts_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'lastPrice': [2.1, 4.5, 7.8],
-            'bid': [2.0, 4.4, 7.7],
-            'ask': [2.2, 4.6, 7.9],
-            'volume': [80, 120, 90],
-            'impliedVolatility': [0.19, 0.20, 0.21]
-        })
-
-        mock_chain = Mock()
-        mock_chain.calls = calls_data
-        mock_chain.puts = puts_data
-        mock_ticker.option_chain.return_value = mock_chain
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            calls, puts = client.get_chain('SPY', date(2024, 1, 19))
-
-            assert len(calls) == 3
-            assert len(puts) == 3
-            assert 'impliedVolatility' in calls.columns
-            assert 'impliedVolatility' in puts.columns
-
-    def test_get_chain_expiry_not_available(self, client):
+        mock_ticker = ticker_factory(
+            options=('2024-01-19',), calls=base_calls_df, puts=base_puts_df
+        )
+
+        yf_ticker['t'] = mock_ticker
+        calls, puts = client.get_chain('SPY', date(2024, 1, 19))
+
+        assert len(calls) == 3
+        assert len(puts) == 3
+        assert 'impliedVolatility' in calls.columns
+        assert 'impliedVolatility' in puts.columns
+
+    def test_get_chain_expiry_not_available(self, client, yf_ticker, ticker_factory):
         """Test error when expiry is not available."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19', '2024-02-16')
+        mock_ticker = ticker_factory(options=('2024-01-19', '2024-02-16'))
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with pytest.raises(YFinanceClientError, match="Expiry .* not available"):
-                client.get_chain('SPY', date(2024, 3, 15))
+        yf_ticker['t'] = mock_ticker
+        with pytest.raises(YFinanceClientError, match="Expiry .* not available"):
+            client.get_chain('SPY', date(2024, 3, 15))
 
-    def test_get_chain_missing_iv_field(self, client):
+    def test_get_chain_missing_iv_field(
+        self, client, yf_ticker, ticker_factory, recorded_warnings, base_calls_df, base_puts_df
+    ):
         """Test handling when IV field is missing."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19',)
-
-        # Create chain data without IV field
-        calls_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'lastPrice': [10.5, 7.2, 4.1],
-        })
-        puts_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'lastPrice': [2.1, 4.5, 7.8],
-        })
-
-        mock_chain = Mock()
-        mock_chain.calls = calls_data
-        mock_chain.puts = puts_data
-        mock_ticker.option_chain.return_value = mock_chain
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                with pytest.raises(YFinanceClientError, match="No valid option data"):
-                    client.get_chain('SPY', date(2024, 1, 19))
-
-                # Should warn about missing IV
-                assert any("No impliedVolatility field" in str(warning.message) for warning in w)
-
-    def test_get_chain_some_missing_iv(self, client):
-        """Test dropping rows with missing IV values."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19',)
-
-        # Create chain with some NaN IV values
-        calls_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'impliedVolatility': [0.20, None, 0.22]  # Missing middle value
-        })
-        puts_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'impliedVolatility': [0.19, 0.20, None]  # Missing last value
-        })
-
-        mock_chain = Mock()
-        mock_chain.calls = calls_data
-        mock_chain.puts = puts_data
-        mock_ticker.option_chain.return_value = mock_chain
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with warnings.catch_warnings(record=True) as w:
-                warnings.simplefilter("always")
-                calls, puts = client.get_chain('SPY', date(2024, 1, 19))
-
-                # Should drop rows with missing IV
-                assert len(calls) == 2
-                assert len(puts) == 2
-
-                # Should warn about dropped rows
-                assert any("Dropped" in str(warning.message) for warning in w)
-
-    def test_get_chain_percentage_iv_conversion(self, client):
-        """Test conversion of percentage-form IV to decimal."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19',)
-
-        # Create chain with IV in percentage form (>1.0)
-        calls_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'impliedVolatility': [20.0, 21.0, 22.0]  # Percentage form
-        })
-        puts_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'impliedVolatility': [19.0, 20.0, 21.0]  # Percentage form
-        })
-
-        mock_chain = Mock()
-        mock_chain.calls = calls_data
-        mock_chain.puts = puts_data
-        mock_ticker.option_chain.return_value = mock_chain
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            calls, puts = client.get_chain('SPY', date(2024, 1, 19))
-
-            # Should convert to decimal form
-            assert calls['impliedVolatility'].iloc[0] == pytest.approx(0.20)
-            assert calls['impliedVolatility'].iloc[1] == pytest.approx(0.21)
-            assert puts['impliedVolatility'].iloc[0] == pytest.approx(0.19)
-
-    def test_get_chain_all_missing_iv(self, client):
+        # Chain data without IV field
+        mock_ticker = ticker_factory(
+            options=('2024-01-19',),
+            calls=base_calls_df.drop(columns='impliedVolatility'),
+            puts=base_puts_df.drop(columns='impliedVolatility'),
+        )
+
+        yf_ticker['t'] = mock_ticker
+        with pytest.raises(YFinanceClientError, match="No valid option data"):
+            client.get_chain('SPY', date(2024, 1, 19))
+
+        # Should warn about missing IV
+        assert _warned(recorded_warnings, "No impliedVolatility field")
+
+    @pytest.mark.parametrize("calls_iv, puts_iv, expected_calls, expected_puts, warning", [
+        # Rows with missing IV are dropped with a warning
+        ([0.20, None, 0.22], [0.19, 0.20, None], [0.20, 0.22], [0.19, 0.20], "Dropped"),
+        # Percentage-form IVs are converted to decimal
+        ([20.0, 21.0, 22.0], [19.0, 20.0, 21.0], [0.20, 0.21, 0.22], [0.19, 0.20, 0.21], None),
+    ], ids=["some_missing_iv", "percentage_iv_conversion"])
+    def test_get_chain_iv_handling(
+        self, client, yf_ticker, ticker_factory, recorded_warnings,
+        base_calls_df, base_puts_df,
+        calls_iv, puts_iv, expected_calls, expected_puts, warning
+    ):
+        """Test IV cleaning: dropping missing values and percentage conversion."""
+        mock_ticker = ticker_factory(
+            options=('2024-01-19',),
+            calls=base_calls_df.assign(impliedVolatility=calls_iv),
+            puts=base_puts_df.assign(impliedVolatility=puts_iv),
+        )
+
+        yf_ticker['t'] = mock_ticker
+        calls, puts = client.get_chain('SPY', date(2024, 1, 19))
+
+        assert calls['impliedVolatility'].tolist() == pytest.approx(expected_calls)
+        assert puts['impliedVolatility'].tolist() == pytest.approx(expected_puts)
+        if warning:
+            assert _warned(recorded_warnings, warning)
+
+    def test_get_chain_all_missing_iv(
+        self, client, yf_ticker, ticker_factory, recorded_warnings, base_calls_df, base_puts_df
+    ):
         """Test error when all IV values are missing."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19',)
-
-        # Create chain with all NaN IV values
-        calls_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'impliedVolatility': [None, None, None]
-        })
-        puts_data = pd.DataFrame({
-            'strike': [440, 445, 450],
-            'impliedVolatility': [None, None, None]
-        })
-
-        mock_chain = Mock()
-        mock_chain.calls = calls_data
-        mock_chain.puts = puts_data
-        mock_ticker.option_chain.return_value = mock_chain
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with warnings.catch_warnings(record=True):
-                warnings.simplefilter("always")
-                with pytest.raises(YFinanceClientError, match="No valid option data"):
-                    client.get_chain('SPY', date(2024, 1, 19))
-
-    def test_get_chain_exception_handling(self, client):
+        mock_ticker = ticker_factory(
+            options=('2024-01-19',),
+            calls=base_calls_df.assign(impliedVolatility=[None] * 3),
+            puts=base_puts_df.assign(impliedVolatility=[None] * 3),
+        )
+
+        yf_ticker['t'] = mock_ticker
+        with pytest.raises(YFinanceClientError, match="No valid option data"):
+            client.get_chain('SPY', date(2024, 1, 19))
+
+    def test_get_chain_exception_handling(self, client, yf_ticker, ticker_factory):
         """Test generic exception handling."""
-        mock_ticker = MagicMock()
-        mock_ticker.options = ('2024-01-19',)
-        mock_ticker.option_chain.side_effect = Exception("Network error")
+        mock_ticker = ticker_factory(
+            options=('2024-01-19',), option_chain=_raise(Exception("Network error"))
+        )
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with pytest.raises(YFinanceClientError, match="Error fetching option chain"):
-                client.get_chain('SPY', date(2024, 1, 19))
+        yf_ticker['t'] = mock_ticker
+        with pytest.raises(YFinanceClientError, match="Error fetching option chain"):
+            client.get_chain('SPY', date(2024, 1, 19))
 
 
 class TestGetDividendYield:
     """Tests for get_dividend_yield method."""
 
-    def test_get_dividend_yield_from_field(self, client):
-        """Test getting dividend yield from dividendYield field."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {'dividendYield': 0.0152}
-
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            div_yield = client.get_dividend_yield('AAPL')
-            assert div_yield == pytest.approx(0.0152)
-
-    def test_get_dividend_yield_computed(self, client):
-        """Test computing dividend yield from rate and price."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {
-            'dividendRate': 1.00,
-            'currentPrice': 180.00
+    @pytest.mark.parametrize("info, expected", [
+        # dividendYield field is used as-is
+        ({'dividendYield': 0.0152}, pytest.approx(0.0152)),
+        # Otherwise computed from dividendRate and price
+        ({'dividendRate': 1.00, 'currentPrice': 180.00}, pytest.approx(1.00 / 180.00)),
+        ({}, None),
+        # Zero price avoids the division
+        ({'dividendRate': 1.00, 'currentPrice': 0}, None),
+    ], ids=["from_field", "computed", "not_available", "zero_price"])
+    def test_get_dividend_yield(self, client, yf_ticker, ticker_factory, info, expected):
+        """Test dividend yield lookup, computation and missing data."""
+        mock_ticker = ticker_factory(info=info)
+
+        yf_ticker['t'] = mock_ticker
+        div_yield = client.get_dividend_yield('AAPL')
+
+        if expected is None:
+            assert div_yield is None
+        else:
+            assert div_yield == expected
+
+    def test_get_dividend_yield_exception_handling(self, client, yf_ticker):
+        """Test that exceptions return None (non-critical)."""
+        yf_ticker['t'] = Exception("Network error")
+        div_yield = client.get_dividend_yield('SPY')
+        assert div_yield is None
+
+
+class TestTickerReuse:
+    """Tests for per-client Ticker reuse."""
+
+    def test_one_ticker_per_symbol(self, client, yf_ticker, ticker_factory, monkeypatch):
+        """Test that expiry and dividend lookups for a symbol share one Ticker."""
+        yf_ticker['t'] = ticker_factory(
+            info={'dividendYield': 0.0152}, options=('2024-01-19',)
+        )
+        constructed = []
+        fake_ticker = yfinance_md.yf.Ticker
+        monkeypatch.setattr(
+            'yfinance.Ticker', lambda symbol: constructed.append(symbol) or fake_ticker(symbol)
+        )
+
+        client.get_option_expiries('SPY')
+        client.get_dividend_yield('SPY')
+        client.get_dividend_yield('QQQ')
+
+        assert constructed == ['SPY', 'QQQ']
+
+    def test_spot_is_not_memoized(self, client, yf_ticker, ticker_factory):
+        """Test that repeated get_spot calls see updated quotes."""
+        yf_ticker['t'] = ticker_factory(info={'currentPrice': 450.25})
+        assert client.get_spot('SPY') == 450.25
+
+        yf_ticker['t'] = ticker_factory(info={'currentPrice': 452.10})
+        assert client.get_spot('SPY') == 452.10
+
+
+class TestDiskCache:
+    """Tests for on-disk caching of expiries and dividend yield."""
+
+    def test_expiries_and_dividend_served_from_disk(self, yf_ticker, ticker_factory):
+        """Test that a new client reuses cached expiries and dividend yield."""
+        yf_ticker['t'] = ticker_factory(
+            info={'dividendRate': 1.00, 'currentPrice': 0},
+            options=('2024-02-16', '2024-01-19'),
+        )
+        first = YFMarketData()
+        expiries = first.get_option_expiries('SPY')
+        assert first.get_dividend_yield('SPY') is None
+
+        yf_ticker['t'] = Exception("Network error")
+        second = YFMarketData()
+
+        assert second.get_option_expiries('SPY') == expiries
+        assert second.get_dividend_yield('SPY') is None
+        with pytest.raises(YFinanceClientError, match="Error fetching spot price"):
+            second.get_spot('SPY')
+
+
+class TestBatch:
+    """Tests for the concurrent *_many methods."""
+
+    def test_many_preserve_order(self, client, monkeypatch, ticker_factory):
+        """Test that results come back in request order for each symbol."""
+        tickers = {
+            sym: ticker_factory(info={'currentPrice': price}, options=(expiry,))
+            for sym, price, expiry in [
+                ('SPY', 450.0, '2024-01-19'),
+                ('QQQ', 380.0, '2024-02-16'),
+                ('IWM', 190.0, '2024-03-15'),
+            ]
         }
+        monkeypatch.setattr('yfinance.Ticker', lambda symbol: tickers[symbol])
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            div_yield = client.get_dividend_yield('AAPL')
-            assert div_yield == pytest.approx(1.00 / 180.00)
+        assert client.get_spot_many(['QQQ', 'SPY', 'IWM']) == [380.0, 450.0, 190.0]
+        assert client.get_option_expiries_many(['IWM', 'SPY']) == [
+            [date(2024, 3, 15)], [date(2024, 1, 19)]
+        ]
 
-    def test_get_dividend_yield_not_available(self, client):
-        """Test returning None when dividend data unavailable."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {}
+    def test_many_raises_client_error(self, client, monkeypatch, ticker_factory):
+        """Test that a failing symbol surfaces as YFinanceClientError."""
+        good = ticker_factory(info={'currentPrice': 450.0})
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            div_yield = client.get_dividend_yield('BTC-USD')
-            assert div_yield is None
+        def fake_ticker(symbol):
+            if symbol == 'BAD':
+                raise Exception("Network error")
+            return good
+
+        monkeypatch.setattr('yfinance.Ticker', fake_ticker)
+
+        with pytest.raises(YFinanceClientError, match="Error fetching spot price for BAD"):
+            client.get_spot_many(['SPY', 'BAD'])
 
-    def test_get_dividend_yield_zero_price(self, client):
-        """Test returning None when price is zero (avoid division)."""
-        mock_ticker = MagicMock()
-        mock_ticker.info = {
-            'dividendRate': 1.00,
-            'currentPrice': 0
+    def test_aget_spot_many(self, client, monkeypatch, ticker_factory):
+        """Test the async variant returns spots in request order."""
+        tickers = {
+            'SPY': ticker_factory(info={'currentPrice': 450.0}),
+            'QQQ': ticker_factory(info={'currentPrice': 380.0}),
         }
+        monkeypatch.setattr('yfinance.Ticker', lambda symbol: tickers[symbol])
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            div_yield = client.get_dividend_yield('SPY')
-            assert div_yield is None
+        assert asyncio.run(client.aget_spot_many(['QQQ', 'SPY'])) == [380.0, 450.0]
+        assert asyncio.run(client.aget_spot('SPY')) == 450.0
 
-    def test_get_dividend_yield_exception_handling(self, client):
-        """Test that exceptions return None (non-critical)."""
-        with patch('yfinance.Ticker', side_effect=Exception("Network error")):
-            div_yield = client.get_dividend_yield('SPY')
-            assert div_yield is None